@@ -0,0 +1,26 @@
+from contextlib import contextmanager
+import os
+
+
+@contextmanager
+def atomic_open(path, mode='w', buffering=-1, newline=None):
+    """
+    Opens temporary file next to the path for writing and renames it over
+    the path when the block ends without an error - readers never see
+    a half-written file.
+    """
+    temporary_path = f'{path}.tmp'
+    if 'b' in mode:
+        file_handle = open(temporary_path, mode, buffering)
+    else:
+        file_handle = open(temporary_path, mode, buffering, newline=newline)
+    try:
+        with file_handle:
+            yield file_handle
+            file_handle.flush()
+            os.fsync(file_handle.fileno())
+        os.replace(temporary_path, path)
+    except BaseException:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        raise
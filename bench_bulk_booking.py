@@ -0,0 +1,108 @@
+from database import Database
+from flight import Flight
+from plane import Plane
+from ticket import Ticket
+import argparse
+import sys
+import time
+from errors import (
+    ChosenSeatIsOccupied,
+    InvalidSeatNumber,
+    LackingFlightObjectError
+)
+
+
+def create_database(planes_number, seats_number):
+    """
+    Returns Database with given number of empty planes.
+    """
+    database = Database()
+    for plane_number in range(1, planes_number + 1):
+        database.add_flight(Flight(plane_number))
+        database.add_plane(Plane(plane_number, seats_number, 1, 'LOT'))
+    return database
+
+
+def generate_tickets(tickets_number, planes_number, seats_number):
+    """
+    Returns list of tickets - every fifth one requests an occupied seat.
+    """
+    tickets = []
+    for index in range(tickets_number):
+        plane_number = index % planes_number + 1
+        seat_number = index // planes_number % seats_number + 1
+        if index % 5 == 4:
+            seat_number = 1
+        tickets.append(Ticket(
+            str(index),
+            plane_number,
+            'economic',
+            seat_number,
+            1
+        ))
+    return tickets
+
+
+def book_one_at_a_time(database, tickets):
+    """
+    Reference - books tickets one at a time, as add_tickets did before
+    the bulk booking, and returns the number of rejected tickets.
+    """
+    rejected = 0
+    for ticket in tickets:
+        try:
+            rejected += database.add_ticket(ticket)
+        except (
+            ChosenSeatIsOccupied,
+            InvalidSeatNumber,
+            LackingFlightObjectError
+        ):
+            rejected += 1
+    return rejected
+
+
+def book_bulk(database, tickets):
+    """
+    Books tickets with book_tickets_bulk() and returns the number of
+    rejected tickets.
+    """
+    return len(database.book_tickets_bulk(tickets).conflicts())
+
+
+def measure(book, args):
+    """
+    Returns the best tickets per second rate of given booking function.
+    """
+    best_rate = 0
+    for _ in range(args.repeats):
+        database = create_database(args.planes, args.seats)
+        tickets = generate_tickets(args.tickets, args.planes, args.seats)
+        start = time.perf_counter()
+        book(database, tickets)
+        elapsed = time.perf_counter() - start
+        best_rate = max(best_rate, args.tickets / elapsed)
+    return best_rate
+
+
+def main(arguments):
+    """
+    Compares booking tickets one at a time with the bulk booking.
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--tickets', type=int, default=200000)
+    parser.add_argument('--planes', type=int, default=100)
+    parser.add_argument('--seats', type=int, default=2500)
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args(arguments[1:])
+
+    sequential_rate = measure(book_one_at_a_time, args)
+    bulk_rate = measure(book_bulk, args)
+
+    print(f'tickets: {args.tickets}')
+    print(f'one at a time: {sequential_rate:,.0f} tickets/s')
+    print(f'bulk:          {bulk_rate:,.0f} tickets/s')
+    print(f'speedup:       {bulk_rate / sequential_rate:.2f}x')
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,130 @@
+from database import Database
+from flight import Flight
+from plane import Plane
+from ticket import Ticket
+import argparse
+import random
+import sys
+import threading
+import time
+from errors import (
+    ChosenSeatIsOccupied,
+    NoFreeSeatsError
+)
+
+
+def create_database(seats_number):
+    """
+    Returns Database with a single empty plane.
+    """
+    database = Database()
+    database.add_flight(Flight(1))
+    database.add_plane(Plane(1, seats_number, seats_number, 'LOT'))
+    return database
+
+
+def hammer(database, desk, operations, seats_number, barrier):
+    """
+    Books, changes and releases random seats of the plane as one check-in
+    desk. Returns the number of operations rejected because of the seat
+    being occupied.
+    """
+    rng = random.Random(desk)
+    own_tickets = []
+    rejected = 0
+    barrier.wait()
+    for operation in range(operations):
+        seat_class = rng.choice(('business', 'economic'))
+        seat_num = rng.randint(1, seats_number)
+        choice = rng.random()
+        try:
+            if choice < 0.4 or not own_tickets:
+                ticket = Ticket(
+                    f'{desk}-{operation}',
+                    1,
+                    seat_class,
+                    seat_num,
+                    1
+                )
+                database.book_seat(ticket)
+                own_tickets.append(ticket.ticket_id())
+            elif choice < 0.55:
+                database.book_next_free_seat(
+                    f'{desk}-{operation}',
+                    1,
+                    seat_class,
+                    1
+                )
+                own_tickets.append(f'{desk}-{operation}')
+            elif choice < 0.85:
+                ticket_id = rng.choice(own_tickets)
+                database.change_seat(ticket_id, seat_class, seat_num)
+            else:
+                ticket_id = own_tickets.pop(rng.randrange(len(own_tickets)))
+                database.release_seat(database.tickets().pop(ticket_id))
+        except (ChosenSeatIsOccupied, NoFreeSeatsError):
+            rejected += 1
+    return rejected
+
+
+def double_bookings(database):
+    """
+    Returns the number of inconsistencies between the tickets and
+    the occupancy of the plane - 0 means no seat is booked twice, no
+    ticket holds a free seat and no occupied seat is held by no ticket.
+    """
+    plane = database.planes()[1]
+    held = {}
+    for ticket in database.tickets().values():
+        seat = (ticket.seat_class(), ticket.seat_number())
+        held[seat] = held.get(seat, 0) + 1
+    errors = sum(count - 1 for count in held.values())
+    for seat_class in ('business', 'economic'):
+        occupancy = plane.seats_occupancy(seat_class)
+        for seat_num in range(1, occupancy.seats_number() + 1):
+            if occupancy.is_free(seat_num) == ((seat_class, seat_num) in held):
+                errors += 1
+    return errors
+
+
+def main(arguments):
+    """
+    Hammers one plane from many threads and checks for double bookings.
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--threads', type=int, default=16)
+    parser.add_argument('--operations', type=int, default=20000)
+    parser.add_argument('--seats', type=int, default=500)
+    args = parser.parse_args(arguments[1:])
+
+    sys.setswitchinterval(1e-6)
+    database = create_database(args.seats)
+    barrier = threading.Barrier(args.threads)
+    rejected = []
+    threads = [
+        threading.Thread(target=lambda desk=desk: rejected.append(hammer(
+            database,
+            desk,
+            args.operations,
+            args.seats,
+            barrier
+        )))
+        for desk in range(args.threads)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    total = args.threads * args.operations
+    print(f'operations: {total} from {args.threads} threads')
+    print(f'rate:       {total / elapsed:,.0f} operations/s')
+    print(f'rejected:   {sum(rejected)}')
+    print(f'tickets:    {len(database.tickets())}')
+    print(f'errors:     {double_bookings(database)}')
+
+
+if __name__ == '__main__':
+    main(sys.argv)
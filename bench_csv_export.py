@@ -0,0 +1,102 @@
+from database import Database
+from flight import Flight
+from plane import Plane
+from ticket import Ticket
+from ticket_io import TICKETS_FILE_HEADER
+import argparse
+import csv
+import os
+import sys
+import tempfile
+import time
+
+
+def create_database(tickets_number, columnar_tickets):
+    """
+    Returns Database with given number of tickets spread over 100 planes.
+    """
+    database = Database(columnar_tickets=columnar_tickets)
+    seats_number = tickets_number // 100 + 1
+    for plane_number in range(1, 101):
+        database.add_flight(Flight(plane_number))
+        database.add_plane(Plane(plane_number, seats_number, 1, 'LOT'))
+    database.book_tickets_bulk(
+        Ticket(
+            str(index),
+            index % 100 + 1,
+            'economic',
+            index // 100 + 1,
+            index % 20 + 1
+        )
+        for index in range(tickets_number)
+    )
+    return database
+
+
+def write_with_dict_writer(database, path):
+    """
+    Reference writer - writes tickets one dictionary at a time with
+    csv.DictWriter straight into the target file.
+    """
+    with open(path, 'w', newline='') as file_handle:
+        writer = csv.DictWriter(file_handle, TICKETS_FILE_HEADER)
+        writer.writeheader()
+        for ticket in database.tickets().values():
+            writer.writerow({
+                'ticket_id': ticket.ticket_id(),
+                'plane_number': ticket.plane_number(),
+                'seat_class': ticket.seat_class(),
+                'seat_number': ticket.seat_number(),
+                'gate_number': ticket.gate_number()
+            })
+
+
+def write_with_write_files(database, path):
+    """
+    Writes tickets with Database.write_files().
+    """
+    database.write_files({'tickets': path})
+
+
+def measure(write, database, path, repeats):
+    """
+    Returns the shortest time of writing the tickets of database.
+    """
+    best_time = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        write(database, path)
+        elapsed = time.perf_counter() - start
+        if best_time is None or elapsed < best_time:
+            best_time = elapsed
+    return best_time
+
+
+def main(arguments):
+    """
+    Compares csv.DictWriter based export with Database.write_files().
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--tickets', type=int, default=1000000)
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--columnar', action='store_true')
+    args = parser.parse_args(arguments[1:])
+
+    database = create_database(args.tickets, args.columnar)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'tickets_database.csv')
+        dict_time = measure(
+            write_with_dict_writer, database, path, args.repeats
+        )
+        export_time = measure(
+            write_with_write_files, database, path, args.repeats
+        )
+
+    print(f'tickets: {args.tickets}, columnar: {args.columnar}')
+    print(f'csv.DictWriter: {dict_time:.2f} s')
+    print(f'write_files:    {export_time:.2f} s')
+    print(f'speedup:        {dict_time / export_time:.2f}x')
+
+
+if __name__ == '__main__':
+    main(sys.argv)
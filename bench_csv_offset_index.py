@@ -0,0 +1,86 @@
+from csv_offset_index import CsvOffsetIndex
+from ticket_io import TICKETS_FILE_HEADER, read_tickets_from_csv
+import argparse
+import csv
+import os
+import sys
+import tempfile
+import time
+
+
+def write_tickets_file(path, tickets_number):
+    """
+    Writes csv file with given number of tickets spread over 100 planes.
+    """
+    with open(path, 'w', newline='') as file_handle:
+        writer = csv.writer(file_handle, lineterminator='\n')
+        writer.writerow(TICKETS_FILE_HEADER)
+        writer.writerows(
+            (index, index % 100 + 1, 'economic', index // 100 + 1, 1)
+            for index in range(tickets_number)
+        )
+
+
+def lookup_with_full_parse(path, ticket_id):
+    """
+    Reference lookup - parses and validates every row of the file.
+    """
+    with open(path, 'r') as file_handle:
+        return read_tickets_from_csv(file_handle)[ticket_id]
+
+
+def lookup_with_offset_index(path, ticket_id):
+    """
+    Looks the ticket up with CsvOffsetIndex, like a single run
+    of console_ui.py tickets --id does.
+    """
+    with CsvOffsetIndex('tickets', path) as index:
+        return index[ticket_id]
+
+
+def measure(lookup, path, ticket_id, repeats):
+    """
+    Returns the shortest time of looking the ticket up.
+    """
+    best_time = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        lookup(path, ticket_id)
+        elapsed = time.perf_counter() - start
+        if best_time is None or elapsed < best_time:
+            best_time = elapsed
+    return best_time
+
+
+def main(arguments):
+    """
+    Compares single ticket lookups with the offset index on files
+    of growing size with reading the whole file.
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        '--tickets', type=int, nargs='+', default=[10000, 100000, 1000000]
+    )
+    parser.add_argument('--repeats', type=int, default=5)
+    args = parser.parse_args(arguments[1:])
+
+    with tempfile.TemporaryDirectory() as directory:
+        for tickets_number in args.tickets:
+            path = os.path.join(directory, f'tickets_{tickets_number}.csv')
+            write_tickets_file(path, tickets_number)
+            ticket_id = str(tickets_number // 2)
+            start = time.perf_counter()
+            lookup_with_offset_index(path, ticket_id)
+            build_time = time.perf_counter() - start
+            index_time = measure(
+                lookup_with_offset_index, path, ticket_id, args.repeats
+            )
+            parse_time = measure(lookup_with_full_parse, path, ticket_id, 1)
+            print(f'tickets: {tickets_number}')
+            print(f'  full parse:           {parse_time * 1000:.1f} ms')
+            print(f'  building offsets:     {build_time * 1000:.1f} ms')
+            print(f'  offset index lookup:  {index_time * 1000:.3f} ms')
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,117 @@
+from passenger import Passenger
+from ticket import Ticket
+from ticket_store import TicketStore
+import argparse
+import sys
+import tracemalloc
+
+
+class DictTicket:
+    """
+    Reference ticket keeping its attributes in per-instance __dict__,
+    as Ticket did before it was given __slots__.
+    """
+    def __init__(
+        self,
+        ticket_id,
+        plane_number,
+        seat_class,
+        seat_number,
+        gate_number
+    ):
+        self._plane_number = plane_number
+        self._ticket_id = ticket_id
+        self._seat_class = seat_class
+        self._seat_number = seat_number
+        self._gate_number = gate_number
+
+
+class DictPassenger:
+    """
+    Reference passenger keeping its attributes in per-instance __dict__,
+    as Passenger did before it was given __slots__.
+    """
+    def __init__(self, fname, lname, ticket_id):
+        self._first_name = fname
+        self._last_name = lname
+        self._ticket_id = ticket_id
+
+
+def measure(create, objects_number):
+    """
+    Returns the number of bytes allocated while creating the objects,
+    not counting the strings shared by both representations.
+    """
+    ids = [str(number) for number in range(objects_number)]
+    tracemalloc.start()
+    objects = [create(ticket_id) for ticket_id in ids]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return allocated
+
+
+def measure_tickets_collection(collection, objects_number):
+    """
+    Returns the number of bytes allocated while filling the collection
+    of tickets, not counting the ticket ids.
+    Every ticket gets its own seat class string and numbers, as tickets
+    parsed from csv file do.
+    """
+    ids = [str(number) for number in range(objects_number)]
+    tracemalloc.start()
+    for number, ticket_id in enumerate(ids):
+        collection[ticket_id] = Ticket(
+            ticket_id,
+            1000 + number % 500,
+            b'economic'.decode(),
+            1000 + number % 400,
+            1000 + number % 20
+        )
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return allocated
+
+
+def main(arguments):
+    """
+    Compares memory used by slotted model classes and dict-based ones
+    and memory used by dictionary of tickets and TicketStore.
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--objects', type=int, default=200000)
+    args = parser.parse_args(arguments[1:])
+
+    cases = (
+        (
+            'Ticket',
+            lambda ticket_id: DictTicket(ticket_id, 1, 'economic', 1, 1),
+            lambda ticket_id: Ticket(ticket_id, 1, 'economic', 1, 1)
+        ),
+        (
+            'Passenger',
+            lambda ticket_id: DictPassenger('Jan', 'Kowalski', ticket_id),
+            lambda ticket_id: Passenger('Jan', 'Kowalski', ticket_id)
+        )
+    )
+    print(f'objects: {args.objects}')
+    for name, create_dict_based, create_slotted in cases:
+        dict_based = measure(create_dict_based, args.objects)
+        slotted = measure(create_slotted, args.objects)
+        print(
+            f'{name}: __dict__ {dict_based / args.objects:.0f} B/object, '
+            f'__slots__ {slotted / args.objects:.0f} B/object, '
+            f'{dict_based / slotted:.2f}x less memory'
+        )
+
+    dict_of_tickets = measure_tickets_collection({}, args.objects)
+    store = measure_tickets_collection(TicketStore(), args.objects)
+    print(
+        f'Tickets collection: dict {dict_of_tickets / args.objects:.0f} '
+        f'B/ticket, TicketStore {store / args.objects:.0f} B/ticket, '
+        f'{dict_of_tickets / store:.2f}x less memory'
+    )
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,66 @@
+from database import Database
+from flight import Flight
+from plane import Plane
+from ticket import Ticket
+import argparse
+import random
+import sys
+import time
+
+
+def create_database(economic_seats, business_seats, occupancy):
+    """
+    Returns Database with one plane which seats are booked at random with
+    given probability.
+    """
+    database = Database()
+    database.add_flight(Flight(1))
+    database.add_plane(Plane(1, economic_seats, business_seats, 'LOT'))
+    rng = random.Random(0)
+    tickets = []
+    for seat_class, seats_number in (
+        ('economic', economic_seats),
+        ('business', business_seats)
+    ):
+        for seat_num in range(1, seats_number + 1):
+            if rng.random() < occupancy:
+                ticket_id = str(len(tickets) + 1)
+                tickets.append(Ticket(ticket_id, 1, seat_class, seat_num, 1))
+    database.book_tickets_bulk(tickets)
+    return database
+
+
+def main(arguments):
+    """
+    Measures swapping the plane of a full flight for a smaller one.
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--economic', type=int, default=6000)
+    parser.add_argument('--business', type=int, default=1000)
+    parser.add_argument('--new-economic', type=int, default=5000)
+    parser.add_argument('--new-business', type=int, default=800)
+    parser.add_argument('--occupancy', type=float, default=0.7)
+    parser.add_argument('--repeats', type=int, default=5)
+    args = parser.parse_args(arguments[1:])
+
+    best = None
+    for _ in range(args.repeats):
+        database = create_database(
+            args.economic,
+            args.business,
+            args.occupancy
+        )
+        new_plane = Plane(1, args.new_economic, args.new_business, 'LOT')
+        start = time.perf_counter()
+        report = database.reassign_plane(new_plane)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    print(f'tickets:  {len(database.tickets())}')
+    print(f'moved:    {len(report.booked())}')
+    print(f'rejected: {len(report.conflicts())}')
+    print(f'time:     {best * 1000:.2f} ms')
+
+
+if __name__ == '__main__':
+    main(sys.argv)
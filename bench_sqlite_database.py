@@ -0,0 +1,87 @@
+from database import Database
+from sqlite_database import SqliteDatabase
+from bench_csv_export import create_database
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+
+def first_lookup_with_database(paths, sqlite_path, ticket_id):
+    """
+    Reference - loads all csv files into Database before the lookup.
+    """
+    database = Database()
+    database.read_files(paths)
+    return database.tickets()[ticket_id]
+
+
+def first_lookup_with_sqlite(paths, sqlite_path, ticket_id):
+    """
+    Opens SqliteDatabase filled before and looks the ticket up.
+    """
+    with SqliteDatabase(sqlite_path) as database:
+        return database.tickets()[ticket_id]
+
+
+def measure(lookup, paths, sqlite_path, ticket_id, repeats):
+    """
+    Returns the shortest time from start to the first answered lookup.
+    """
+    best_time = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        lookup(paths, sqlite_path, ticket_id)
+        elapsed = time.perf_counter() - start
+        if best_time is None or elapsed < best_time:
+            best_time = elapsed
+    return best_time
+
+
+def main(arguments):
+    """
+    Compares the time to the first lookup of Database loaded from csv
+    files with SqliteDatabase, and reports how long filling it took.
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--tickets', type=int, default=300000)
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args(arguments[1:])
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = {
+            kind: os.path.join(directory, f'{kind}_database.csv')
+            for kind in ('flights', 'planes', 'tickets')
+        }
+        create_database(args.tickets, False).write_files(paths)
+        sqlite_path = os.path.join(directory, 'database.sqlite')
+        start = time.perf_counter()
+        with SqliteDatabase(sqlite_path) as database:
+            database.read_files(paths)
+        import_time = time.perf_counter() - start
+
+        ticket_id = str(args.tickets // 2)
+        database_time = measure(
+            first_lookup_with_database,
+            paths,
+            sqlite_path,
+            ticket_id,
+            args.repeats
+        )
+        sqlite_time = measure(
+            first_lookup_with_sqlite,
+            paths,
+            sqlite_path,
+            ticket_id,
+            args.repeats
+        )
+
+    print(f'tickets: {args.tickets}')
+    print(f'sqlite import:  {import_time:.2f} s')
+    print(f'Database:       {database_time * 1000:.1f} ms to first lookup')
+    print(f'SqliteDatabase: {sqlite_time * 1000:.1f} ms to first lookup')
+
+
+if __name__ == '__main__':
+    main(sys.argv)
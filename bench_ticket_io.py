@@ -0,0 +1,106 @@
+from ticket import Ticket
+from ticket_io import iter_tickets_from_csv, TICKETS_FILE_HEADER
+import argparse
+import csv
+import os
+import sys
+import tempfile
+import time
+from errors import (
+    InvalidTicketIDNumber,
+    InvalidSeatNumber,
+    InvalidGateNumber,
+    InvalidSeatClass,
+    InvalidPlaneNumber
+)
+
+
+def generate_tickets_file(path, rows_number, invalid_percent=0):
+    """
+    Writes tickets csv file with given number of rows - given percent of
+    them has an invalid seat number or gate number.
+    """
+    with open(path, 'w', newline='') as file_handle:
+        writer = csv.writer(file_handle)
+        writer.writerow(TICKETS_FILE_HEADER)
+        for ticket_id in range(1, rows_number + 1):
+            seat_class = 'business' if ticket_id % 5 == 0 else 'economic'
+            seat_number = ticket_id % 400 + 1
+            gate_number = ticket_id % 20 + 1
+            if ticket_id % 100 < invalid_percent:
+                if ticket_id % 2:
+                    seat_number = 0
+                else:
+                    gate_number = 'x'
+            writer.writerow((
+                ticket_id,
+                ticket_id % 100 + 1,
+                seat_class,
+                seat_number,
+                gate_number
+            ))
+
+
+def iter_tickets_with_dict_reader(file_handle):
+    """
+    Reference reader - parses every row into a dictionary with
+    csv.DictReader, as the readers did before the positional fast path.
+    """
+    for ticket in csv.DictReader(file_handle):
+        try:
+            yield Ticket(
+                ticket['ticket_id'],
+                int(ticket['plane_number']),
+                ticket['seat_class'],
+                int(ticket['seat_number']),
+                int(ticket['gate_number'])
+            )
+        except (
+            ValueError,
+            InvalidPlaneNumber,
+            InvalidSeatClass,
+            InvalidSeatNumber,
+            InvalidGateNumber,
+            InvalidTicketIDNumber
+        ):
+            continue
+
+
+def measure(reader, path, repeats):
+    """
+    Returns the best rows per second rate of given reader.
+    """
+    best_rate = 0
+    for _ in range(repeats):
+        start = time.perf_counter()
+        with open(path, 'r') as file_handle:
+            rows_number = sum(1 for _ in reader(file_handle))
+        elapsed = time.perf_counter() - start
+        best_rate = max(best_rate, rows_number / elapsed)
+    return best_rate
+
+
+def main(arguments):
+    """
+    Compares csv.DictReader based parsing with the positional fast path.
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=500000)
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--invalid-percent', type=int, default=0)
+    args = parser.parse_args(arguments[1:])
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'tickets_database.csv')
+        generate_tickets_file(path, args.rows, args.invalid_percent)
+        dict_rate = measure(iter_tickets_with_dict_reader, path, args.repeats)
+        positional_rate = measure(iter_tickets_from_csv, path, args.repeats)
+
+    print(f'rows: {args.rows}, invalid: {args.invalid_percent}%')
+    print(f'csv.DictReader: {dict_rate:,.0f} rows/s')
+    print(f'positional:     {positional_rate:,.0f} rows/s')
+    print(f'speedup:        {positional_rate / dict_rate:.2f}x')
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,71 @@
+from rejections import RejectionCounts
+
+
+class BookingReport:
+    """
+    Class BookingReport - result of booking a batch of tickets.
+    Contains attributes:
+    :param booked: tickets which seats were booked
+    :type booked: list
+
+    :param conflicts: list of (ticket, reason) tuples describing tickets
+    which could not be booked
+    :type conflicts: list
+
+    :param committed: True if the batch was committed into the Database
+    :type committed: bool
+    """
+    def __init__(self):
+        """
+        Creates instance of BookingReport describing an empty batch.
+        """
+        self._booked = []
+        self._conflicts = []
+        self._committed = False
+
+    def booked(self):
+        """
+        Returns list of tickets which seats were booked.
+        """
+        return self._booked
+
+    def conflicts(self):
+        """
+        Returns list of (ticket, reason) tuples of rejected tickets.
+        """
+        return self._conflicts
+
+    def committed(self):
+        """
+        Returns True if the batch was committed into the Database.
+        """
+        return self._committed
+
+    def conflicts_by_reason(self):
+        """
+        Returns RejectionCounts of the rejected tickets.
+        """
+        return RejectionCounts(reason for _, reason in self._conflicts)
+
+    def add_conflict(self, ticket, reason):
+        """
+        Records that the ticket was rejected for given reason.
+        """
+        self._conflicts.append((ticket, reason))
+
+    def mark_committed(self, booked):
+        """
+        Records that the batch was committed and given tickets were booked.
+        """
+        self._booked = list(booked)
+        self._committed = True
+
+    def __str__(self):
+        """
+        Returns short summary of the batch.
+        """
+        summary = f'booked: {len(self._booked)}, '
+        summary += f'rejected: {len(self._conflicts)}'
+        if self._conflicts:
+            summary += f', {self.conflicts_by_reason()}'
+        return summary
@@ -1,16 +1,110 @@
 from database import Database
+from csv_offset_index import OffsetIndexedDatabase
+from lazy_database import LazyDatabase
+from readonly_database import ReadOnlyDatabase, build_index
+from sqlite_database import SqliteDatabase
+from live_sync import LiveSync
+from query_server import QueryServer, ask_server
+from contextlib import redirect_stderr, redirect_stdout
 import argparse
+import asyncio
+import io
+import shlex
 import sys
+from errors import (
+    ChosenPassengerDoesNotExist,
+    ChosenSeatIsOccupied,
+    FilePathNotFoundError,
+    InvalidSeatClass,
+    InvalidSeatNumber,
+    MalformedFileError,
+    MalformedResponseError,
+    StaleIndexError,
+    StaleSnapshotError
+)
+
+
+default_files = {
+    'flights': 'flights_database.csv',
+    'planes': 'planes_database.csv',
+    'tickets': 'tickets_database.csv',
+    'passengers': 'passengers_database.csv'
+}
 
 
 def load_data(database):
     """
-    Loads default data into the Database.
+    Loads default data into the Database - all files are parsed at the same
+    time.
+    Returns dictionary with the number of omitted rows of each file.
+    """
+    return database.read_files(default_files)
+
+
+snapshot_file = 'database.snapshot'
+
+
+def load_database(snapshot_path=None):
+    """
+    Returns Database loaded from the snapshot file.
+    If the snapshot is missing or any of the default files has changed
+    since it was saved, loads the default files and saves new snapshot.
+    """
+    if snapshot_path is None:
+        snapshot_path = snapshot_file
+    database = Database()
+    sources = list(default_files.values())
+    try:
+        database.load_snapshot(snapshot_path, sources)
+        return database
+    except (FilePathNotFoundError, MalformedFileError, StaleSnapshotError):
+        pass
+    database = Database()
+    load_data(database)
+    try:
+        database.save_snapshot(snapshot_path, sources)
+    except OSError:
+        pass
+    return database
+
+
+index_file = 'database.index'
+
+
+def open_index(index_path=None, snapshot_path=None):
+    """
+    Returns read-only Database answering lookups from memory-mapped index
+    file. If the index is missing or any of the default files has changed
+    since it was built, builds it again from the loaded Database.
+    """
+    if index_path is None:
+        index_path = index_file
+    sources = list(default_files.values())
+    try:
+        return ReadOnlyDatabase(index_path, sources)
+    except (FilePathNotFoundError, MalformedFileError, StaleIndexError):
+        pass
+    database = load_database(snapshot_path)
+    try:
+        build_index(database, index_path, sources)
+    except OSError:
+        return database
+    return ReadOnlyDatabase(index_path, sources)
+
+
+def open_sqlite(sqlite_path):
+    """
+    Returns SqliteDatabase kept in the file at given path - if it has no
+    flights yet, the default files are loaded into it first.
     """
-    database.read_flights('flights_database.csv')
-    database.read_planes('planes_database.csv')
-    database.read_tickets('tickets_database.csv')
-    database.read_passengers('passengers_database.csv')
+    database = SqliteDatabase(sqlite_path)
+    if not database.flights():
+        try:
+            load_data(database)
+        except BaseException:
+            database.close()
+            raise
+    return database
 
 
 def create_table(data):
@@ -94,26 +188,99 @@ def get_departure_gate(database, args):
     print(table)
 
 
+def find_passengers(database, args):
+    """
+    Prints passengers which names start with given name or, if the distance
+    is given, differ from it by at most distance edits.
+    """
+    if args.distance is None:
+        found = database.find_passengers(args.name)
+    else:
+        found = database.find_passengers_fuzzy(args.name, args.distance)
+    if not found:
+        print('no passengers found')
+    for person in found:
+        print(str(person))
+
+
+def change_seat(database, args):
+    """
+    Moves the ticket to the seat given in the arguments and prints it.
+    """
+    if args.seat_class is None or args.seat is None:
+        print('seat class and seat are required')
+        return
+    try:
+        ticket = database.change_seat(args.id, args.seat_class, args.seat)
+    except ChosenPassengerDoesNotExist:
+        print('not found')
+    except ChosenSeatIsOccupied:
+        print('seat occupied')
+    except (InvalidSeatClass, InvalidSeatNumber):
+        print('invalid seat')
+    else:
+        print(str(ticket))
+
+
 operation_desc = 'accepts values: flights, planes, tickets, passengers, '
-operation_desc += 'boarding_pass, flight_params, check_gate - '
+operation_desc += 'boarding_pass, flight_params, check_gate, change_seat, '
+operation_desc += 'find_passenger, watch, serve - '
 operation_desc += 'values have to be lowercase'
 
 id_desc = 'accepts values (usually ints) if they exist in the Database - \n'
 id_desc += 'argument is required in order to specify the object, eg. ticket'
 
+name_desc = 'passenger\'s name or its beginning - last name, "first last" '
+name_desc += 'or "last first", required by find_passenger'
 
-def main(arguments):
+distance_desc = 'maximum number of typos in the name - enables fuzzy '
+distance_desc += 'find_passenger'
+
+
+seat_class_desc = 'new seat class - economic or business, required by '
+seat_class_desc += 'change_seat'
+
+seat_desc = 'new seat number, required by change_seat - the change is kept '
+seat_desc += 'only in watch and serve modes or with --sqlite'
+
+interval_desc = 'number of seconds between checks of the files in watch mode'
+
+sqlite_desc = 'path of SQLite file the operation is answered from and '
+sqlite_desc += 'changes are kept in - filled from the default files when empty'
+
+unvalidated_desc = 'answer --id lookups straight from single rows of the csv '
+unvalidated_desc += 'files without loading them - the answer is not validated'
+
+unvalidated_note = 'note: answered from single csv rows without checks '
+unvalidated_note += 'against the other files - the flight may be unknown, '
+unvalidated_note += 'the seat may be occupied and planes have no booked seats'
+
+
+def create_parser():
     """
-    Main funcion of the console_ui.
+    Returns parser of the arguments of the console_ui.
     """
-    database = Database()
-    load_data(database)
-
     parser = argparse.ArgumentParser()
     parser.add_argument('OPERATION', help=operation_desc)
     parser.add_argument('--id', help=id_desc)
-    args = parser.parse_args(arguments[1:])
+    parser.add_argument('--name', help=name_desc)
+    parser.add_argument('--distance', type=int, help=distance_desc)
+    parser.add_argument('--seat_class', help=seat_class_desc)
+    parser.add_argument('--seat', type=int, help=seat_desc)
+    parser.add_argument(
+        '--interval', type=float, default=1.0, help=interval_desc
+    )
+    parser.add_argument('--sqlite', help=sqlite_desc)
+    parser.add_argument(
+        '--unvalidated', action='store_true', help=unvalidated_desc
+    )
+    return parser
 
+
+def run_operation(database, args):
+    """
+    Prints the result of the operation asked for by the arguments.
+    """
     if args.id:
         if int(args.id) <= 10:
             if args.OPERATION == 'flights':
@@ -130,6 +297,8 @@ def main(arguments):
                 get_flights_params(database, args)
             elif args.OPERATION == 'check_gate':
                 get_departure_gate(database, args)
+            elif args.OPERATION == 'change_seat':
+                change_seat(database, args)
             else:
                 print('unknown argument')
         else:
@@ -147,9 +316,111 @@ def main(arguments):
         elif args.OPERATION == 'passengers':
             for person in database.passengers():
                 print(str(database.passengers()[person]))
+        elif args.OPERATION == 'find_passenger':
+            if args.name:
+                find_passengers(database, args)
+            else:
+                print('name is required')
         else:
             print('unknown argument')
 
 
+def answer(sync, arguments, parser=None):
+    """
+    Returns the output of the operation given by the list of arguments,
+    answered from the Database kept in sync with the default files.
+    """
+    if parser is None:
+        parser = create_parser()
+    output = io.StringIO()
+    with redirect_stdout(output), redirect_stderr(output):
+        try:
+            args = parser.parse_args(arguments)
+        except SystemExit:
+            return output.getvalue()
+        if sync.last_error() is not None:
+            print(f'files not synced: {sync.last_error()}')
+        with sync.lock():
+            try:
+                run_operation(sync.database(), args)
+            except (KeyError, ValueError):
+                print('not found')
+    return output.getvalue()
+
+
+def watch(sync, lines, parser=None):
+    """
+    Answers queries read line by line from the Database kept in sync with
+    the default files, until the lines end or 'quit' is read.
+    Every line holds the arguments of a single operation.
+    """
+    if parser is None:
+        parser = create_parser()
+    for line in lines:
+        arguments = shlex.split(line)
+        if not arguments:
+            continue
+        if arguments == ['quit']:
+            break
+        print(answer(sync, arguments, parser), end='')
+
+
+socket_file = 'database.sock'
+
+
+def serve(socket_path, sync, parser=None):
+    """
+    Answers queries sent to the Unix socket from the Database kept in sync
+    with the default files, until interrupted.
+    """
+    if parser is None:
+        parser = create_parser()
+    server = QueryServer(
+        socket_path,
+        lambda arguments: answer(sync, arguments, parser)
+    )
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+def main(arguments):
+    """
+    Main funcion of the console_ui.
+    """
+    parser = create_parser()
+    args = parser.parse_args(arguments[1:])
+
+    if args.OPERATION == 'watch':
+        with LiveSync(default_files, args.interval) as sync:
+            watch(sync, sys.stdin, parser)
+        return
+    if args.OPERATION == 'serve':
+        with LiveSync(default_files, args.interval) as sync:
+            serve(socket_file, sync, parser)
+        return
+    if args.sqlite:
+        with open_sqlite(args.sqlite) as database:
+            run_operation(database, args)
+        return
+
+    try:
+        print(ask_server(socket_file, arguments[1:]), end='')
+        return
+    except (OSError, MalformedResponseError):
+        pass
+
+    if args.id and args.OPERATION != 'change_seat':
+        if args.unvalidated:
+            print(unvalidated_note)
+            database = OffsetIndexedDatabase(default_files)
+        else:
+            database = open_index()
+    else:
+        database = LazyDatabase(default_files)
+    run_operation(database, args)
+
+
 if __name__ == "__main__":
     main(sys.argv)
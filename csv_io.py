@@ -0,0 +1,45 @@
+import csv
+
+
+def read_header(reader, columns):
+    """
+    Reads the header row from csv reader and returns the tuple of indexes
+    of given columns - rows can be then parsed positionally.
+    Raises KeyError if any of the columns is missing in the header.
+    Returns None if the file is empty.
+    """
+    header = next(reader, None)
+    if header is None:
+        return None
+    positions = {name: index for index, name in enumerate(header)}
+    return tuple(positions[column] for column in columns)
+
+
+def parse_int(text):
+    """
+    Returns the int written in text or None if it is not an int.
+    Text which is not made of decimal digits, optionally signed and
+    surrounded by whitespace, is rejected without the cost of raising
+    and catching ValueError.
+    """
+    if text.isdecimal() and len(text) < 19:
+        return int(text)
+    digits = text.strip().lstrip('+-')
+    if not digits.isdecimal():
+        return None
+    try:
+        return int(text)
+    except ValueError:
+        return None
+
+
+def write_csv(file_handle, header, rows):
+    """
+    Writes the header row and rows into csv file - rows may be any
+    iterable, they are written as they are generated.
+    Lines end with '\\n' like the files shipped with the project, so
+    the file should be opened with newline=''.
+    """
+    writer = csv.writer(file_handle, lineterminator='\n')
+    writer.writerow(header)
+    writer.writerows(rows)
@@ -0,0 +1,454 @@
+from csv_io import parse_int
+from atomic_file import atomic_open
+import codecs
+import csv
+import io
+import locale
+import mmap
+import os
+import struct
+import threading
+from database import CSV_ROW_READERS, LOADING_ORDER, translated_read_errors
+
+
+OFFSETS_MAGIC = b'PIPROFF\0'
+OFFSETS_VERSION = 1
+OFFSETS_SUFFIX = '.offsets'
+
+KEY_COLUMNS = {
+    'flights': 'plane_number',
+    'planes': 'plane_number',
+    'tickets': 'ticket_id',
+    'passengers': 'ticket_id'
+}
+
+_INT_KEYS = ('flights', 'planes')
+
+_HEADER = struct.Struct('<8sH')
+_SOURCE = struct.Struct('<qq')
+_COUNTS = struct.Struct('<QQ')
+_SLOT = struct.Struct('<QQ')
+_LENGTH = struct.Struct('<I')
+
+
+def offsets_path(csv_path):
+    """
+    Returns the path of the offset index kept next to csv file.
+    """
+    return f'{csv_path}{OFFSETS_SUFFIX}'
+
+
+def _read_record(file_handle):
+    """
+    Returns bytes of the csv record starting at the current position of
+    binary file handle - lines are joined while a quoted field spans them.
+    """
+    record = file_handle.readline()
+    while record.count(b'"') % 2:
+        line = file_handle.readline()
+        if not line:
+            break
+        record += line
+    return record
+
+
+def _parse_record(record, encoding):
+    """
+    Returns the list of fields of csv record.
+    """
+    text = record.decode(encoding)
+    return next(csv.reader(io.StringIO(text, newline='')), [])
+
+
+def _index_key(kind, field):
+    """
+    Returns the key under which the row with given key field is indexed -
+    plane numbers are written in canonical form, so ' 1' and '01' are
+    found as 1 - or None if the row cannot hold a valid key.
+    """
+    if kind in _INT_KEYS:
+        value = parse_int(field)
+        if value is None:
+            return None
+        return str(value).encode('utf-8')
+    return field.encode('utf-8')
+
+
+def _lookup_key(kind, key):
+    """
+    Returns key encoded like _index_key() or None if it is of wrong type.
+    """
+    if kind in _INT_KEYS:
+        if type(key) is not int:
+            return None
+        return str(key).encode('utf-8')
+    if not isinstance(key, str):
+        return None
+    return key.encode('utf-8')
+
+
+def _object_key(kind, new_object):
+    """
+    Returns the key of object read from the file of given kind.
+    """
+    if kind in _INT_KEYS:
+        return new_object.plane_number()
+    return new_object.ticket_id()
+
+
+def scan_offsets(kind, file_handle, encoding):
+    """
+    Reads csv file of given kind from binary file handle and returns
+    the header record and the list of (key, offset) pairs of its data
+    records sorted by key and offset. The header is validated, of every
+    data record only the key field is decoded.
+    """
+    header = _read_record(file_handle)
+    if not header:
+        return header, []
+    header_text = header.decode(encoding)
+    for _ in CSV_ROW_READERS[kind]([header_text]):
+        pass
+    key_index = _parse_record(header, encoding).index(KEY_COLUMNS[kind])
+    raw_keys = kind not in _INT_KEYS and codecs.lookup(encoding).name in (
+        'utf-8',
+        'ascii'
+    )
+    entries = []
+    offset = len(header)
+    lines = iter(file_handle)
+    for line in lines:
+        record_offset = offset
+        offset += len(line)
+        if b'"' in line:
+            while line.count(b'"') % 2:
+                following = next(lines, b'')
+                if not following:
+                    break
+                offset += len(following)
+                line += following
+            fields = _parse_record(line, encoding)
+            if len(fields) <= key_index:
+                continue
+            key = _index_key(kind, fields[key_index])
+        else:
+            fields = line.rstrip(b'\r\n').split(b',', key_index + 1)
+            if len(fields) <= key_index:
+                continue
+            if raw_keys:
+                key = fields[key_index]
+            else:
+                key = _index_key(kind, fields[key_index].decode(encoding))
+        if key is not None:
+            entries.append((key, record_offset))
+    entries.sort()
+    return header, entries
+
+
+def pack_offsets(source, header_length, entries):
+    """
+    Returns the offset index of csv file: its source stamp, the length
+    of its header and a table of fixed size slots sorted by key followed
+    by the keys - binary search visits only the slots and keys it compares.
+    """
+    keys_offset = (
+        _HEADER.size + _SOURCE.size + _COUNTS.size
+        + _SLOT.size * len(entries)
+    )
+    slots = []
+    keys = []
+    for key, row_offset in entries:
+        slots.append(_SLOT.pack(keys_offset, row_offset))
+        keys.append(_LENGTH.pack(len(key)))
+        keys.append(key)
+        keys_offset += _LENGTH.size + len(key)
+    return b''.join([
+        _HEADER.pack(OFFSETS_MAGIC, OFFSETS_VERSION),
+        _SOURCE.pack(*source),
+        _COUNTS.pack(header_length, len(entries)),
+        *slots,
+        *keys
+    ])
+
+
+def _source(file_handle):
+    """
+    Returns (modification time in ns, size) of the opened file.
+    """
+    status = os.fstat(file_handle.fileno())
+    return status.st_mtime_ns, status.st_size
+
+
+class CsvOffsetIndex:
+    """
+    Class CsvOffsetIndex - finds single rows of csv file by their key
+    without parsing the whole file. Offsets of the rows are kept sorted
+    by key in a sidecar file, which is built again whenever the csv file
+    has changed since. A lookup reads only the slots visited by binary
+    search and the found row, which is validated like when the file is
+    read by Database - checks involving other files are not made.
+    Flights and planes are keyed by plane number, tickets and passengers
+    by ticket id. Of rows with the same key the first valid one is found.
+    Contains attributes:
+    :param kind: 'flights', 'planes', 'tickets' or 'passengers'
+    :type kind: str
+
+    :param path: path of the csv file
+    :type path: str
+
+    :param file_handle: csv file opened in binary mode
+    :type file_handle: file object
+
+    :param buffer: memory map of the sidecar file or the index built
+    in memory if it could not be saved
+    :type buffer: mmap.mmap or bytes
+
+    :param header: header record of the csv file
+    :type header: str
+
+    :param count: number of indexed rows
+    :type count: int
+
+    :param lock: lock held while a row is read
+    :type lock: threading.Lock
+    """
+    def __init__(self, kind, path, index_path=None):
+        """
+        Creates instance of CsvOffsetIndex. If the sidecar file at
+        index_path - by default next to the csv file - is missing or
+        stale, builds it again.
+        """
+        self._kind = kind
+        self._path = str(path)
+        self._encoding = locale.getpreferredencoding(False)
+        self._lock = threading.Lock()
+        if index_path is None:
+            index_path = offsets_path(self._path)
+        with translated_read_errors(self._path):
+            self._file_handle = open(self._path, 'rb')
+        self._index_file_handle = None
+        try:
+            with translated_read_errors(self._path):
+                self._buffer = self._open_buffer(str(index_path))
+            header_length, self._count = _COUNTS.unpack_from(
+                self._buffer,
+                _HEADER.size + _SOURCE.size
+            )
+            self._file_handle.seek(0)
+            header = self._file_handle.read(header_length)
+            self._header = header.decode(self._encoding)
+        except BaseException:
+            self.close()
+            raise
+
+    def _open_buffer(self, index_path):
+        """
+        Returns the index of the csv file - memory map of the sidecar file
+        if it is up to date, otherwise the index built again.
+        """
+        source = _source(self._file_handle)
+        try:
+            self._index_file_handle = open(index_path, 'rb')
+            buffer = mmap.mmap(
+                self._index_file_handle.fileno(),
+                0,
+                access=mmap.ACCESS_READ
+            )
+            magic, version = _HEADER.unpack_from(buffer, 0)
+            stamp = _SOURCE.unpack_from(buffer, _HEADER.size)
+            if (magic, version, stamp) == (
+                OFFSETS_MAGIC,
+                OFFSETS_VERSION,
+                source
+            ):
+                return buffer
+            buffer.close()
+        except (OSError, ValueError, struct.error):
+            pass
+        if self._index_file_handle is not None:
+            self._index_file_handle.close()
+            self._index_file_handle = None
+        self._file_handle.seek(0)
+        header, entries = scan_offsets(
+            self._kind,
+            self._file_handle,
+            self._encoding
+        )
+        buffer = pack_offsets(source, len(header), entries)
+        try:
+            with atomic_open(index_path, 'wb') as file_handle:
+                file_handle.write(buffer)
+        except OSError:
+            pass
+        return buffer
+
+    def path(self):
+        """
+        Returns the path of the csv file.
+        """
+        return self._path
+
+    def close(self):
+        """
+        Closes the csv and sidecar files.
+        """
+        buffer = getattr(self, '_buffer', None)
+        if isinstance(buffer, mmap.mmap):
+            buffer.close()
+        if self._index_file_handle is not None:
+            self._index_file_handle.close()
+        self._file_handle.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _slot(self, index):
+        """
+        Returns the key and the row offset stored in slot of given index.
+        """
+        key_offset, row_offset = _SLOT.unpack_from(
+            self._buffer,
+            _HEADER.size + _SOURCE.size + _COUNTS.size + index * _SLOT.size
+        )
+        length, = _LENGTH.unpack_from(self._buffer, key_offset)
+        key_offset += _LENGTH.size
+        return self._buffer[key_offset:key_offset + length], row_offset
+
+    def _first_slot(self, encoded):
+        """
+        Returns the index of the first slot with key not less than encoded.
+        """
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._slot(middle)[0] < encoded:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _read_object(self, row_offset):
+        """
+        Returns the object read from the row at given offset or None if
+        the row is invalid.
+        """
+        with self._lock:
+            self._file_handle.seek(row_offset)
+            record = _read_record(self._file_handle)
+        rows = CSV_ROW_READERS[self._kind]([
+            self._header,
+            record.decode(self._encoding)
+        ])
+        with translated_read_errors(self._path):
+            for _, _, new_object in rows:
+                return new_object
+        return None
+
+    def get(self, key, default=None):
+        """
+        Returns the object with given key or default if there is no valid
+        row with the key.
+        """
+        encoded = _lookup_key(self._kind, key)
+        if encoded is None:
+            return default
+        index = self._first_slot(encoded)
+        while index < self._count:
+            slot_key, row_offset = self._slot(index)
+            if slot_key != encoded:
+                break
+            new_object = self._read_object(row_offset)
+            if (
+                new_object is not None
+                and _object_key(self._kind, new_object) == key
+            ):
+                return new_object
+            index += 1
+        return default
+
+    def __getitem__(self, key):
+        new_object = self.get(key)
+        if new_object is None:
+            raise KeyError(key)
+        return new_object
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+
+class OffsetIndexedDatabase:
+    """
+    Class OffsetIndexedDatabase - answers single lookups straight from
+    the csv files with CsvOffsetIndex. Offers the same collections as
+    Database for lookups by key - the index of a file is opened, and built
+    if needed, only when its collection is first used.
+    Planes are returned without their seats booked by tickets.
+    Contains attributes:
+    :param paths: dictionary of paths of 'flights', 'planes', 'tickets'
+    and 'passengers' files
+    :type paths: dict
+
+    :param indexes: dictionary of CsvOffsetIndex of the files already used
+    :type indexes: dict
+
+    :param lock: lock held while an index is opened
+    :type lock: threading.Lock
+    """
+    def __init__(self, paths):
+        """
+        Creates instance of OffsetIndexedDatabase - no file is read yet.
+        """
+        self._paths = dict(paths)
+        self._indexes = {}
+        self._lock = threading.Lock()
+
+    def _index(self, kind):
+        """
+        Returns CsvOffsetIndex of the file of given kind.
+        """
+        with self._lock:
+            if kind not in self._indexes:
+                self._indexes[kind] = CsvOffsetIndex(kind, self._paths[kind])
+            return self._indexes[kind]
+
+    def close(self):
+        """
+        Closes the files of all opened indexes.
+        """
+        with self._lock:
+            for kind in LOADING_ORDER:
+                if kind in self._indexes:
+                    self._indexes.pop(kind).close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def flights(self):
+        """
+        Returns index of flights.
+        """
+        return self._index('flights')
+
+    def planes(self):
+        """
+        Returns index of planes.
+        """
+        return self._index('planes')
+
+    def tickets(self):
+        """
+        Returns index of tickets.
+        """
+        return self._index('tickets')
+
+    def passengers(self):
+        """
+        Returns index of passengers.
+        """
+        return self._index('passengers')
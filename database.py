@@ -1,7 +1,49 @@
-from flight_io import read_flights_from_csv
-from passenger_io import read_passengers_from_csv
-from plane_io import read_planes_from_csv
-from ticket_io import read_tickets_from_csv
+from flight_io import (
+    iter_flights_from_csv,
+    iter_flight_rows_from_csv,
+    write_flights_to_csv
+)
+from passenger_io import (
+    iter_passengers_from_csv,
+    iter_passenger_rows_from_csv,
+    write_passengers_to_csv
+)
+from plane_io import (
+    iter_planes_from_csv,
+    iter_plane_rows_from_csv,
+    write_planes_to_csv
+)
+from ticket_io import (
+    iter_tickets_from_csv,
+    iter_ticket_rows_from_csv,
+    write_tickets_to_csv,
+    TICKETS_FILE_HEADER
+)
+from csv_io import write_csv
+from ticket import Ticket
+from ticket_store import TicketStore
+from name_index import NameIndex
+from booking_report import BookingReport
+from reseating import plan_reseating
+from rejections import (
+    RejectionCounts,
+    DUPLICATE_KEY,
+    UNKNOWN_FLIGHT,
+    UNKNOWN_TICKET,
+    INVALID_SEAT_CLASS,
+    INVALID_SEAT_NUMBER,
+    INVALID_GATE_NUMBER,
+    OCCUPIED_SEAT,
+    NO_FREE_SEAT
+)
+from snapshot import SEAT_CLASSES, read_snapshot, write_snapshot
+from atomic_file import atomic_open
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, ExitStack
+from itertools import islice
+import csv
+import os
+import threading
 from errors import (
     FilePathNotFoundError,
     FileIsADirectoryError,
@@ -15,14 +57,110 @@ from errors import (
     LackingFlightObjectError,
     InvalidFileHeaderError,
     InvalidPassengerTicketID,
-    PassengerAlreadyAskedForHelpError,
-    AllAssistantsAreBusyError,
     ChosenPassengerDoesNotExist,
-    ChosenPassengerHasNotAskedForHelp,
-    MalformedFileError
+    MalformedFileError,
+    NoFreeSeatsError,
+    TicketAlreadyExistsError
 )
 
 
+CSV_READERS = {
+    'flights': iter_flights_from_csv,
+    'planes': iter_planes_from_csv,
+    'tickets': iter_tickets_from_csv,
+    'passengers': iter_passengers_from_csv
+}
+
+CSV_ROW_READERS = {
+    'flights': iter_flight_rows_from_csv,
+    'planes': iter_plane_rows_from_csv,
+    'tickets': iter_ticket_rows_from_csv,
+    'passengers': iter_passenger_rows_from_csv
+}
+
+LOADING_ORDER = ('flights', 'planes', 'tickets', 'passengers')
+
+WRITE_BUFFER_SIZE = 1 << 20
+
+TICKETS_BATCH_SIZE = 10000
+
+JOURNAL_BATCH_SIZE = 10000
+
+BATCH_OPERATIONS = {
+    'flights': 'add_flights',
+    'planes': 'add_planes',
+    'tickets': 'book_tickets_bulk',
+    'passengers': 'add_passengers'
+}
+
+
+@contextmanager
+def translated_read_errors(path):
+    """
+    Translates errors raised while reading csv file into errors reported
+    by Database - every translated error carries the path of the file.
+    """
+    try:
+        yield
+    except FileNotFoundError:
+        raise FilePathNotFoundError(path)
+    except IsADirectoryError:
+        raise FileIsADirectoryError(path)
+    except (
+        InvalidKeyInFlightsFile,
+        InvalidKeyInPassengersFile,
+        InvalidKeyInPlanesFile,
+        InvalidKeyInTicketsFile
+    ):
+        raise InvalidFileHeaderError(path)
+    except csv.Error:
+        raise MalformedFileError(path)
+
+
+def parse_csv_file(kind, path):
+    """
+    Returns the list of objects read from csv file of given kind -
+    'flights', 'planes', 'tickets' or 'passengers' - and RejectionCounts
+    of the omitted rows.
+    """
+    rejections = RejectionCounts()
+    with open(path, 'r') as file_handle:
+        objects = list(CSV_READERS[kind](file_handle, rejections))
+    return objects, rejections
+
+
+def parser_count(kinds):
+    """
+    Returns the number of processes parsing files of given kinds at the
+    same time - one per file, but not more than there are processors.
+    """
+    return max(1, min(len(kinds), os.cpu_count() or 1))
+
+
+class _BatchLog:
+    """
+    Collects data of objects added into Database in a batch and records
+    them in its journal as one operation per JOURNAL_BATCH_SIZE objects.
+    Does nothing if log is None.
+    """
+    def __init__(self, log, operation):
+        self._log = log
+        self._operation = operation
+        self._added = []
+
+    def add(self, fields):
+        if self._log is None:
+            return
+        self._added.append(fields)
+        if len(self._added) >= JOURNAL_BATCH_SIZE:
+            self.flush()
+
+    def flush(self):
+        if self._added:
+            self._log(self._operation, self._added)
+            self._added = []
+
+
 class Database:
     """
     Class Database. Contains attributes:
@@ -35,17 +173,145 @@ class Database:
     :param planes: dictionary of planes in database
     :type planes: dict
 
-    :param tickets: dictionary of tickets in database
-    :type tickets: dict
+    :param tickets: dictionary of tickets in database, TicketStore if
+    the database stores tickets in columns
+    :type tickets: dict or TicketStore
+
+    :param tickets_by_plane: secondary index of tickets - dictionary
+    mapping plane number to ticket ids holding a seat on the plane
+    :type tickets_by_plane: dict
+
+    :param tickets_by_cabin: secondary index of tickets - dictionary
+    mapping (plane number, seat class) to ticket ids
+    :type tickets_by_cabin: dict
+
+    :param tickets_by_gate: secondary index of tickets - dictionary
+    mapping gate number to ticket ids
+    :type tickets_by_gate: dict
+
+    :param indexed_tickets: dictionary mapping ticket id to the plane number,
+    seat class, seat number and gate number it is indexed under
+    :type indexed_tickets: dict
+
+    :param passenger_names: index of passengers' names
+    :type passenger_names: NameIndex
+
+    :param plane_locks: dictionary mapping plane number to the lock held
+    while the seats or the assistants of the plane change
+    :type plane_locks: dict
+
+    :param locks_lock: lock held while a plane lock is created
+    :type locks_lock: threading.Lock
+
+    :param tickets_lock: lock held while the dictionary of tickets or its
+    secondary indexes change - always taken after plane locks
+    :type tickets_lock: threading.RLock
+
+    :param journal: journal recording changes of Database or None
+    :type journal: Journal
     """
-    def __init__(self):
+    def __init__(self, columnar_tickets=False):
         """
         Creates instance of Database.
+        If columnar_tickets is True tickets are kept in TicketStore and
+        objects of class Ticket are created only on access.
         """
         self._flights = {}
         self._passengers = {}
         self._planes = {}
-        self._tickets = {}
+        self._tickets = TicketStore() if columnar_tickets else {}
+        self._tickets_by_plane = {}
+        self._tickets_by_cabin = {}
+        self._tickets_by_gate = {}
+        self._indexed_tickets = {}
+        self._passenger_names = NameIndex()
+        self._plane_locks = {}
+        self._locks_lock = threading.Lock()
+        self._tickets_lock = threading.RLock()
+        self._journal = None
+
+    def journal(self):
+        """
+        Returns the journal recording changes of Database or None.
+        """
+        return self._journal
+
+    def set_journal(self, journal):
+        """
+        Makes Database record changes in the journal - None stops recording.
+        Recorded are add_flight, add_plane, add_ticket, add_passenger,
+        book_seat, book_next_free_seat, release_seat, change_seat,
+        book_tickets_bulk, change_seats, reassign_plane and the assistance
+        operations. Changes are recorded while the locks of their planes
+        are held, so the journal keeps their order. Objects added in
+        batches, also by reading csv files, are recorded as add_flights,
+        add_planes, book_tickets_bulk and add_passengers with the data of
+        the objects actually added, so the journal does not depend on
+        the files.
+        """
+        self._journal = journal
+
+    def _log(self, operation, *arguments):
+        """
+        Records the operation in the journal if there is one.
+        """
+        if self._journal is not None:
+            self._journal.record(operation, *arguments)
+
+    def _batch_log(self, kind):
+        """
+        Returns _BatchLog recording objects of given kind added in a batch.
+        """
+        log = None if self._journal is None else self._log
+        return _BatchLog(log, BATCH_OPERATIONS[kind])
+
+    def _added_fields(self, kind, new_object):
+        """
+        Returns the data needed to add the object of given kind again as
+        it was added - tickets with the seats they got.
+        """
+        if kind == 'flights':
+            return new_object.plane_number()
+        if kind == 'planes':
+            return [
+                new_object.plane_number(),
+                new_object.economic_seats_number(),
+                new_object.business_seats_number(),
+                new_object.carrier()
+            ]
+        if kind == 'tickets':
+            ticket = self._tickets[new_object.ticket_id()]
+            return list(self._ticket_fields(ticket))
+        return [
+            new_object.first_name(),
+            new_object.last_name(),
+            new_object.ticket_id()
+        ]
+
+    @staticmethod
+    def _ticket_fields(ticket):
+        """
+        Returns tuple of the data needed to create the ticket again.
+        """
+        return (
+            ticket.ticket_id(),
+            ticket.plane_number(),
+            ticket.seat_class(),
+            ticket.seat_number(),
+            ticket.gate_number()
+        )
+
+    def _log_tickets(self, operation, tickets):
+        """
+        Records the operation on given tickets in the journal if there is
+        one and the tickets are not empty.
+        """
+        tickets_fields = [
+            list(self._ticket_fields(ticket))
+            for ticket in tickets
+        ]
+        if tickets_fields:
+            self._log(operation, tickets_fields)
 
     def flights(self):
         """
@@ -78,6 +344,7 @@ class Database:
         detected_existing_keys = 0
         if new_flight.plane_number() not in self.flights():
             self._flights[new_flight.plane_number()] = new_flight
+            self._log('add_flight', new_flight.plane_number())
         else:
             detected_existing_keys += 1
         return detected_existing_keys
@@ -91,11 +358,42 @@ class Database:
             if new_passenger.ticket_id() not in self.tickets():
                 raise LackingTicketObjectError
             else:
-                self._passengers[new_passenger.ticket_id()] = new_passenger
+                self._add_passenger(new_passenger)
+                self._log(
+                    'add_passenger',
+                    new_passenger.first_name(),
+                    new_passenger.last_name(),
+                    new_passenger.ticket_id()
+                )
         else:
             detected_existing_keys += 1
         return detected_existing_keys
 
+    def _add_passenger(self, new_passenger):
+        """
+        Adds checked new_passenger into dictionary of passengers and
+        the index of names.
+        """
+        self._passengers[new_passenger.ticket_id()] = new_passenger
+        self._passenger_names.add(new_passenger)
+
+    def find_passengers(self, name_prefix):
+        """
+        Returns list of passengers which last name, 'first last' or
+        'last first' name starts with given prefix - case insensitive.
+        """
+        ticket_ids = self._passenger_names.find_prefix(name_prefix)
+        return [self._passengers[ticket_id] for ticket_id in ticket_ids]
+
+    def find_passengers_fuzzy(self, name, max_distance=1):
+        """
+        Returns list of passengers which last name, 'first last' or
+        'last first' name differs from given name by at most max_distance
+        edits - case insensitive, the closest first.
+        """
+        ticket_ids = self._passenger_names.find_fuzzy(name, max_distance)
+        return [self._passengers[ticket_id] for ticket_id in ticket_ids]
+
     def add_plane(self, new_plane):
         """
         Adds new_plane into dictionary of planes contained in Database.
@@ -106,65 +404,267 @@ class Database:
                 raise LackingFlightObjectError
             else:
                 self._planes[new_plane.plane_number()] = new_plane
+                self._log(
+                    'add_plane',
+                    new_plane.plane_number(),
+                    new_plane.economic_seats_number(),
+                    new_plane.business_seats_number(),
+                    new_plane.carrier()
+                )
         else:
             detected_existing_keys += 1
         return detected_existing_keys
 
+    def plane_lock(self, plane_number):
+        """
+        Returns the lock held while the seats or the assistants of given
+        plane change - holding it makes a sequence of operations on the
+        plane atomic.
+        """
+        lock = self._plane_locks.get(plane_number)
+        if lock is None:
+            with self._locks_lock:
+                lock = self._plane_locks.setdefault(
+                    plane_number,
+                    threading.RLock()
+                )
+        return lock
+
+    @contextmanager
+    def _planes_locked(self, plane_numbers):
+        """
+        Holds locks of given planes - always taken in the order of plane
+        numbers, so that threads locking several planes do not deadlock.
+        """
+        with ExitStack() as stack:
+            for plane_number in sorted(set(plane_numbers)):
+                stack.enter_context(self.plane_lock(plane_number))
+            yield
+
+    def _store_ticket(self, ticket, new_only=False):
+        """
+        Stores ticket in dictionary of tickets and secondary indexes.
+        Returns False without storing it if new_only is True and ticket
+        with the same id is already stored.
+        """
+        with self._tickets_lock:
+            if new_only and ticket.ticket_id() in self._tickets:
+                return False
+            self._tickets[ticket.ticket_id()] = ticket
+            self._index_ticket(ticket)
+        return True
+
+    def _book(self, used_ticket, new_only=False, operation=None):
+        """
+        Books the seat of used_ticket and stores it - atomic for other
+        threads. Returns False without booking if new_only is True and
+        ticket with the same id is already stored. If the operation is
+        given, the booking is recorded in the journal as it.
+        """
+        plane_num = used_ticket.plane_number()
+        plane = self.planes()[plane_num]
+        occupancy = plane.seats_occupancy(used_ticket.seat_class())
+        seat_num = used_ticket.seat_number()
+
+        if seat_num > occupancy.seats_number():
+            raise InvalidSeatNumber
+
+        with self.plane_lock(plane_num):
+            if not occupancy.is_free(seat_num):
+                raise ChosenSeatIsOccupied
+            if not self._store_ticket(used_ticket, new_only):
+                return False
+            occupancy.book(seat_num)
+            if operation is not None:
+                self._log(operation, *self._ticket_fields(used_ticket))
+        return True
+
     def book_seat(self, used_ticket):
         """
         Checks whether the seat from used_ticket is available.
         If so, books it, otherwise, informs user that operation
         cannot be done.
         """
-        if used_ticket.seat_class() == 'business':
-            plane = used_ticket.plane_number()
-            plane = self.planes()[plane]
-            seat_num = used_ticket.seat_number()
+        self._book(used_ticket, operation='book_seat')
 
-            if seat_num > plane.business_seats_number():
-                raise InvalidSeatNumber
+    def release_seat(self, used_ticket):
+        """
+        Releases given ticket's seat.
+        """
+        plane_num = used_ticket.plane_number()
+        plane = self.planes()[plane_num]
+        occupancy = plane.seats_occupancy(used_ticket.seat_class())
+        seat_num = used_ticket.seat_number()
 
-            if plane.business_seats_occupancy()[seat_num] == 'FREE':
-                self._tickets[used_ticket.ticket_id()] = used_ticket
-                plane.business_seats_occupancy()[seat_num] = 'OCCUPIED'
-            else:
-                raise ChosenSeatIsOccupied
-        else:
-            plane = used_ticket.plane_number()
-            plane = self.planes()[plane]
-            seat_num = used_ticket.seat_number()
+        if seat_num > occupancy.seats_number():
+            raise InvalidSeatNumber
 
-            if seat_num > plane.economic_seats_number():
-                raise InvalidSeatNumber
+        held_seat = (plane_num, used_ticket.seat_class(), seat_num)
+        ticket_id = used_ticket.ticket_id()
+        with self.plane_lock(plane_num):
+            occupancy.release(seat_num)
+            with self._tickets_lock:
+                indexed = self._indexed_tickets.get(ticket_id)
+                if indexed is not None and indexed[:3] == held_seat:
+                    self._unindex_ticket(ticket_id)
+            self._log('release_seat', *self._ticket_fields(used_ticket))
 
-            if plane.economic_seats_occupancy()[seat_num] == 'FREE':
-                self._tickets[used_ticket.ticket_id()] = used_ticket
-                plane.economic_seats_occupancy()[seat_num] = 'OCCUPIED'
-            else:
-                raise ChosenSeatIsOccupied
+    def change_seat(self, ticket_id, new_class, new_seat):
+        """
+        Moves the ticket with given id to given seat of its plane - the new
+        seat is booked and the old one released at once, other threads see
+        either the old or the new seat held.
+        Returns the ticket with the new seat.
+        """
+        while True:
+            ticket = self._tickets.get(ticket_id)
+            if ticket is None:
+                raise ChosenPassengerDoesNotExist
+            plane_num = ticket.plane_number()
+            with self.plane_lock(plane_num):
+                ticket = self._tickets.get(ticket_id)
+                if ticket is not None and ticket.plane_number() == plane_num:
+                    return self._change_seat(ticket, new_class, new_seat)
 
-    def release_seat(self, used_ticket):
+    def _change_seat(self, ticket, new_class, new_seat):
         """
-        Releases given ticket's seat.
+        Moves the ticket to given seat of its plane while the lock of
+        the plane is held. The old seat is released only if the ticket
+        still holds it - after release_seat() it may belong to another
+        ticket - as recorded in secondary indexes, which snapshots keep,
+        and in the occupancy of the cabin. Returns the ticket with the new
+        seat.
         """
-        if used_ticket.seat_class() == 'business':
-            plane = used_ticket.plane_number()
-            plane = self.planes()[plane]
-            seat_num = used_ticket.seat_number()
+        plane = self.planes()[ticket.plane_number()]
+        new_ticket = Ticket(
+            ticket.ticket_id(),
+            ticket.plane_number(),
+            new_class,
+            new_seat,
+            ticket.gate_number()
+        )
+        old_occupancy = plane.seats_occupancy(ticket.seat_class())
+        new_occupancy = plane.seats_occupancy(new_class)
+        if new_seat > new_occupancy.seats_number():
+            raise InvalidSeatNumber
+        old_seat = ticket.seat_number()
+        holds_old_seat = self.holds_seat(ticket.ticket_id()) and \
+            not old_occupancy.is_free(old_seat)
+        if holds_old_seat and new_occupancy is old_occupancy and \
+                new_seat == old_seat:
+            return ticket
+        if not new_occupancy.is_free(new_seat):
+            raise ChosenSeatIsOccupied
+        new_occupancy.book(new_seat)
+        if holds_old_seat:
+            old_occupancy.release(old_seat)
+        self._store_ticket(new_ticket)
+        self._log('change_seat', ticket.ticket_id(), new_class, new_seat)
+        return new_ticket
 
-            if seat_num > plane.business_seats_number():
-                raise InvalidSeatNumber
+    def _index_ticket(self, ticket):
+        """
+        Adds ticket into secondary indexes, removing its previous entries.
+        """
+        self._unindex_ticket(ticket.ticket_id())
+        self._index_new_ticket(ticket)
 
-            plane.business_seats_occupancy()[seat_num] = 'FREE'
-        else:
-            plane = used_ticket.plane_number()
-            plane = self.planes()[plane]
-            seat_num = used_ticket.seat_number()
+    def _index_new_ticket(self, ticket):
+        """
+        Adds ticket which is not indexed yet into secondary indexes.
+        """
+        ticket_id = ticket.ticket_id()
+        plane_num = ticket.plane_number()
+        seat_class = ticket.seat_class()
+        gate_num = ticket.gate_number()
+        self._indexed_tickets[ticket_id] = (
+            plane_num,
+            seat_class,
+            ticket.seat_number(),
+            gate_num
+        )
+        self._index_entry(self._tickets_by_plane, plane_num, ticket_id)
+        cabin = (plane_num, seat_class)
+        self._index_entry(self._tickets_by_cabin, cabin, ticket_id)
+        self._index_entry(self._tickets_by_gate, gate_num, ticket_id)
+
+    @staticmethod
+    def _index_entry(index, key, ticket_id):
+        """
+        Adds ticket id under given key of the index - unlike setdefault()
+        creates the dictionary of ids only for a new key.
+        """
+        ticket_ids = index.get(key)
+        if ticket_ids is None:
+            ticket_ids = index[key] = {}
+        ticket_ids[ticket_id] = None
+
+    def _unindex_ticket(self, ticket_id):
+        """
+        Removes ticket from secondary indexes.
+        """
+        indexed = self._indexed_tickets.pop(ticket_id, None)
+        if indexed is None:
+            return
+        plane_num, seat_class, _, gate_num = indexed
+        for index, key in (
+            (self._tickets_by_plane, plane_num),
+            (self._tickets_by_cabin, (plane_num, seat_class)),
+            (self._tickets_by_gate, gate_num)
+        ):
+            ticket_ids = index[key]
+            del ticket_ids[ticket_id]
+            if not ticket_ids:
+                del index[key]
 
-            if seat_num > plane.economic_seats_number():
-                raise InvalidSeatNumber
+    def _rebuild_ticket_indexes(self, released=()):
+        """
+        Builds secondary indexes of all tickets from scratch - tickets with
+        ids in released do not hold their seats and are not indexed.
+        """
+        self._tickets_by_plane = {}
+        self._tickets_by_cabin = {}
+        self._tickets_by_gate = {}
+        self._indexed_tickets = {}
+        for ticket in self._tickets.values():
+            if ticket.ticket_id() not in released:
+                self._index_new_ticket(ticket)
 
-            plane.economic_seats_occupancy()[seat_num] = 'FREE'
+    def holds_seat(self, ticket_id):
+        """
+        Returns True if the stored ticket with given id holds its seat -
+        False if there is no such ticket or its seat was released.
+        """
+        with self._tickets_lock:
+            ticket = self._tickets.get(ticket_id)
+            indexed = self._indexed_tickets.get(ticket_id)
+        return ticket is not None and indexed is not None and indexed == (
+            ticket.plane_number(),
+            ticket.seat_class(),
+            ticket.seat_number(),
+            ticket.gate_number()
+        )
+
+    def tickets_on_plane(self, plane_number, seat_class=None):
+        """
+        Returns list of tickets holding a seat on given plane, optionally
+        only the tickets of given seat class.
+        Uses secondary index - takes time proportional to the result size.
+        """
+        if seat_class is None:
+            ticket_ids = self._tickets_by_plane.get(plane_number, {})
+        else:
+            cabin = (plane_number, seat_class)
+            ticket_ids = self._tickets_by_cabin.get(cabin, {})
+        return [self._tickets[ticket_id] for ticket_id in ticket_ids]
+
+    def tickets_at_gate(self, gate_number):
+        """
+        Returns list of tickets holding a seat and boarding at given gate.
+        Uses secondary index - takes time proportional to the result size.
+        """
+        ticket_ids = self._tickets_by_gate.get(gate_number, {})
+        return [self._tickets[ticket_id] for ticket_id in ticket_ids]
 
     def add_ticket(self, new_ticket):
         """
@@ -174,12 +674,373 @@ class Database:
         if new_ticket.ticket_id() not in self.tickets():
             if new_ticket.plane_number() not in self.flights():
                 raise LackingFlightObjectError
-            else:
-                self.book_seat(new_ticket)
+            elif not self._book(new_ticket, True, 'add_ticket'):
+                detected_existing_keys += 1
         else:
             detected_existing_keys += 1
         return detected_existing_keys
 
+    def change_seats(self, tickets, all_or_nothing=False):
+        """
+        Moves stored tickets to the seats of given tickets with the same
+        ids. Tickets may change seat class or plane and may take seats
+        released by other tickets of the batch, so passengers can swap
+        seats. Seats of every cabin are checked against its occupancy
+        bitmap at once, under the locks of all planes involved, so
+        conflicts do not raise exceptions. If all_or_nothing is True
+        nothing changes when any ticket conflicts. Passengers leaving
+        a plane stop being helped by its assistants.
+        Returns BookingReport.
+        """
+        tickets = list(tickets)
+        while True:
+            plane_numbers = {ticket.plane_number() for ticket in tickets}
+            held = self._held_planes(tickets)
+            with self._planes_locked(plane_numbers | held):
+                with self._tickets_lock:
+                    if held == self._held_planes(tickets):
+                        return self._change_seats(tickets, all_or_nothing)
+
+    def _held_planes(self, tickets):
+        """
+        Returns set of numbers of planes on which stored tickets with
+        the ids of given tickets hold seats.
+        """
+        planes = set()
+        for ticket in tickets:
+            stored = self._tickets.get(ticket.ticket_id())
+            if stored is not None:
+                planes.add(stored.plane_number())
+        return planes
+
+    def _check_seat_changes(self, tickets, report):
+        """
+        Returns dictionary mapping ticket id to the stored ticket and
+        the ticket with its new seat, for the tickets which can be moved.
+        Rejected tickets are recorded in the report.
+        """
+        moves = {}
+        for ticket in tickets:
+            ticket_id = ticket.ticket_id()
+            plane_num = ticket.plane_number()
+            stored = self._tickets.get(ticket_id)
+            if stored is None:
+                reason = UNKNOWN_TICKET
+            elif ticket_id in moves:
+                reason = DUPLICATE_KEY
+            elif plane_num not in self._flights or \
+                    plane_num not in self._planes:
+                reason = UNKNOWN_FLIGHT
+            else:
+                occupancy = self._planes[plane_num].seats_occupancy(
+                    ticket.seat_class()
+                )
+                if 0 < ticket.seat_number() <= occupancy.seats_number():
+                    moves[ticket_id] = (stored, ticket)
+                    continue
+                reason = INVALID_SEAT_NUMBER
+            report.add_conflict(ticket, reason)
+
+        while True:
+            released = self._seat_masks(stored for stored, _ in moves.values())
+            taken = {}
+            rejected_ids = []
+            for ticket_id, (_, ticket) in moves.items():
+                cabin = (ticket.plane_number(), ticket.seat_class())
+                cabin_taken = taken.get(cabin)
+                if cabin_taken is None:
+                    occupancy = self._planes[cabin[0]].seats_occupancy(
+                        cabin[1]
+                    )
+                    cabin_taken = occupancy.occupied_mask()
+                    cabin_taken &= ~released.get(cabin, 0)
+                bit = 1 << (ticket.seat_number() - 1)
+                if cabin_taken & bit:
+                    rejected_ids.append(ticket_id)
+                else:
+                    taken[cabin] = cabin_taken | bit
+            if not rejected_ids:
+                return moves
+            for ticket_id in rejected_ids:
+                report.add_conflict(moves.pop(ticket_id)[1], OCCUPIED_SEAT)
+
+    @staticmethod
+    def _seat_masks(tickets):
+        """
+        Returns dictionary mapping (plane number, seat class) to the mask
+        of seats held by given tickets - built in a bitmap, so that
+        the time does not grow with the number of seats per ticket.
+        """
+        bits = {}
+        for ticket in tickets:
+            cabin = (ticket.plane_number(), ticket.seat_class())
+            cabin_bits = bits.get(cabin)
+            if cabin_bits is None:
+                cabin_bits = bits[cabin] = []
+            cabin_bits.append(ticket.seat_number() - 1)
+        masks = {}
+        for cabin, cabin_bits in bits.items():
+            bitmap = bytearray(max(cabin_bits) // 8 + 1)
+            for bit in cabin_bits:
+                bitmap[bit >> 3] |= 1 << (bit & 7)
+            masks[cabin] = int.from_bytes(bitmap, 'little')
+        return masks
+
+    def _change_seats(self, tickets, all_or_nothing):
+        """
+        Moves tickets to their new seats while locks of the planes and
+        the dictionary of tickets are held. Returns BookingReport.
+        """
+        report = BookingReport()
+        moves = self._check_seat_changes(tickets, report)
+        if all_or_nothing and report.conflicts():
+            return report
+        released = self._seat_masks(stored for stored, _ in moves.values())
+        booked = self._seat_masks(ticket for _, ticket in moves.values())
+        for (plane_num, seat_class), mask in released.items():
+            occupancy = self._planes[plane_num].seats_occupancy(seat_class)
+            occupancy.release_mask(mask)
+        for (plane_num, seat_class), mask in booked.items():
+            occupancy = self._planes[plane_num].seats_occupancy(seat_class)
+            occupancy.book_mask(mask)
+        for stored, ticket in moves.values():
+            plane = self._planes[stored.plane_number()]
+            ticket_id = ticket.ticket_id()
+            if plane.plane_number() != ticket.plane_number() and \
+                    ticket_id in plane.busy_assistnats():
+                plane.thank_for_assistance(ticket_id)
+            self._store_ticket(ticket)
+        report.mark_committed(ticket for _, ticket in moves.values())
+        self._log_tickets('change_seats', report.booked())
+        return report
+
+    def reassign_plane(self, new_plane):
+        """
+        Replaces the plane of the flight with new_plane, which may have
+        different numbers of seats. Tickets of the flight keep their seat
+        numbers where possible, the others get the lowest free seats of
+        their class, and passengers keep their assistants. Nothing changes
+        if any ticket cannot be seated - such tickets are reported as
+        conflicts.
+        Returns BookingReport which booked tickets are the tickets with
+        new seats.
+        """
+        plane_num = new_plane.plane_number()
+        if plane_num not in self._flights:
+            raise LackingFlightObjectError
+        report = BookingReport()
+        with self.plane_lock(plane_num), self._tickets_lock:
+            old_plane = self._planes.get(plane_num)
+            tickets = self.tickets_on_plane(plane_num)
+            kept, moved, unseated = plan_reseating(tickets, new_plane)
+            for ticket in unseated:
+                report.add_conflict(ticket, NO_FREE_SEAT)
+            if unseated:
+                return report
+            masks = self._seat_masks(kept + moved)
+            for (_, seat_class), mask in masks.items():
+                new_plane.seats_occupancy(seat_class).book_mask(mask)
+            if old_plane is not None:
+                for ticket_id in old_plane.busy_assistnats():
+                    new_plane.ask_for_assistance(ticket_id)
+            self._planes[plane_num] = new_plane
+            for ticket in moved:
+                self._store_ticket(ticket)
+            self._log(
+                'reassign_plane',
+                plane_num,
+                new_plane.economic_seats_number(),
+                new_plane.business_seats_number(),
+                new_plane.carrier()
+            )
+        report.mark_committed(moved)
+        return report
+
+    def book_next_free_seat(self, ticket_id, plane_number, seat_class, gate):
+        """
+        Creates new ticket with the first free seat of given class on given
+        plane and adds it into dictionary of tickets contained in Database.
+        Returns created ticket.
+        """
+        return self._book_next_free_seat(
+            ticket_id,
+            plane_number,
+            seat_class,
+            gate,
+            'add_ticket'
+        )
+
+    def _book_next_free_seat(
+        self,
+        ticket_id,
+        plane_number,
+        seat_class,
+        gate,
+        operation=None
+    ):
+        """
+        Books the first free seat for new ticket, recording the booking in
+        the journal as the operation if it is given. Returns created ticket.
+        """
+        if ticket_id in self.tickets():
+            raise TicketAlreadyExistsError
+        if plane_number not in self.flights():
+            raise LackingFlightObjectError
+        plane = self.planes()[plane_number]
+        with self.plane_lock(plane_number):
+            seat_num = plane.seats_occupancy(seat_class).first_free_seat()
+            if seat_num is None:
+                raise NoFreeSeatsError
+            new_ticket = Ticket(
+                ticket_id,
+                plane_number,
+                seat_class,
+                seat_num,
+                gate
+            )
+            if not self._book(new_ticket, True, operation):
+                raise TicketAlreadyExistsError
+        return new_ticket
+
+    def _check_cabin_bookings(self, occupancy, tickets, report):
+        """
+        Returns mask of the seats that can be booked for tickets of one
+        cabin and the set of ids of conflicting tickets, which are also
+        recorded in the report - the first ticket requesting a seat wins.
+        Seat numbers outside the cabin are rejected before any bit is
+        built for them, so huge numbers do not create huge masks.
+        """
+        seats_number = occupancy.seats_number()
+        requested = 0
+        repeated = 0
+        out_of_range = False
+        for ticket in tickets:
+            seat_num = ticket.seat_number()
+            if not 0 < seat_num <= seats_number:
+                out_of_range = True
+                continue
+            bit = 1 << (seat_num - 1)
+            repeated |= requested & bit
+            requested |= bit
+        taken = occupancy.occupied_mask()
+        if not (repeated or out_of_range or requested & taken):
+            return requested, set()
+
+        requested = 0
+        rejected_ids = set()
+        for ticket in tickets:
+            seat_num = ticket.seat_number()
+            if not 0 < seat_num <= seats_number:
+                reason = INVALID_SEAT_NUMBER
+            elif (taken | requested) & (1 << (seat_num - 1)):
+                reason = OCCUPIED_SEAT
+            else:
+                requested |= 1 << (seat_num - 1)
+                continue
+            report.add_conflict(ticket, reason)
+            rejected_ids.add(ticket.ticket_id())
+        return requested, rejected_ids
+
+    def book_tickets_bulk(self, tickets, all_or_nothing=False):
+        """
+        Books seats of the tickets from given iterable and adds them into
+        dictionary of tickets contained in Database.
+        Tickets are grouped by plane and seat class and every group is
+        checked against the occupancy bitmap at once, so conflicts do not
+        raise exceptions. If all_or_nothing is True nothing is booked when
+        any ticket conflicts, otherwise all non-conflicting tickets are.
+        Returns BookingReport.
+        """
+        return self._book_tickets_batch(
+            tickets,
+            all_or_nothing,
+            operation='book_tickets_bulk'
+        )
+
+    def _book_tickets_batch(
+        self,
+        tickets,
+        all_or_nothing=False,
+        operation=None
+    ):
+        """
+        Books the tickets as book_tickets_bulk() does. If the operation is
+        given, the booked tickets are recorded in the journal as it.
+        Returns BookingReport.
+        """
+        tickets = list(tickets)
+        plane_numbers = [ticket.plane_number() for ticket in tickets]
+        with self._planes_locked(plane_numbers), self._tickets_lock:
+            report = self._book_tickets_bulk(tickets, all_or_nothing)
+            if operation is not None:
+                self._log_tickets(operation, report.booked())
+            return report
+
+    def _book_tickets_bulk(self, tickets, all_or_nothing):
+        """
+        Books seats of the tickets while locks of their planes and
+        the dictionary of tickets are held. Every ticket is checked before
+        any seat is booked - plane numbers against the flights, seats
+        against the cabins and gates against the range of TicketStore - so
+        tickets created without checks are rejected instead of failing to
+        be stored after their seats are booked. Returns BookingReport.
+        """
+        report = BookingReport()
+        candidates = []
+        cabins = {}
+        batch_ids = set()
+        for ticket in tickets:
+            ticket_id = ticket.ticket_id()
+            plane_num = ticket.plane_number()
+            if not Ticket._is_positive_int(ticket.gate_number()):
+                report.add_conflict(ticket, INVALID_GATE_NUMBER)
+            elif ticket.seat_class() not in SEAT_CLASSES:
+                report.add_conflict(ticket, INVALID_SEAT_CLASS)
+            elif ticket_id in self._tickets or ticket_id in batch_ids:
+                report.add_conflict(ticket, DUPLICATE_KEY)
+            elif plane_num not in self._flights or \
+                    plane_num not in self._planes:
+                report.add_conflict(ticket, UNKNOWN_FLIGHT)
+            else:
+                candidates.append(ticket)
+                batch_ids.add(ticket_id)
+                plane_cabins = cabins.get(plane_num)
+                if plane_cabins is None:
+                    plane_cabins = cabins[plane_num] = {}
+                cabin_tickets = plane_cabins.get(ticket.seat_class())
+                if cabin_tickets is None:
+                    cabin_tickets = plane_cabins[ticket.seat_class()] = []
+                cabin_tickets.append(ticket)
+
+        bookings = []
+        rejected_ids = set()
+        for plane_num, plane_cabins in cabins.items():
+            plane = self._planes[plane_num]
+            for seat_class, cabin_tickets in plane_cabins.items():
+                occupancy = plane.seats_occupancy(seat_class)
+                requested, cabin_rejected_ids = self._check_cabin_bookings(
+                    occupancy,
+                    cabin_tickets,
+                    report
+                )
+                bookings.append((occupancy, requested))
+                rejected_ids |= cabin_rejected_ids
+
+        if all_or_nothing and report.conflicts():
+            return report
+        for occupancy, requested in bookings:
+            occupancy.book_mask(requested)
+        booked = []
+        for ticket in candidates:
+            ticket_id = ticket.ticket_id()
+            if ticket_id in rejected_ids:
+                continue
+            self._tickets[ticket_id] = ticket
+            self._index_new_ticket(ticket)
+            booked.append(ticket)
+        report.mark_committed(booked)
+        return report
+
     def ask_for_assistance(self, passenger_ticket):
         """
         Adds new passengers that require help if any assistant is free.
@@ -190,12 +1051,9 @@ class Database:
         if ticket_id in self.tickets():
             if not ticket_id or not str(ticket_id):
                 raise InvalidPassengerTicketID
-            elif ticket_id in plane.busy_assistnats():
-                raise PassengerAlreadyAskedForHelpError
-            elif len(plane.busy_assistnats()) < 3:
-                plane._busy_assistants.add(ticket_id)
-            else:
-                raise AllAssistantsAreBusyError
+            with self.plane_lock(plane_num):
+                plane.ask_for_assistance(ticket_id)
+                self._log('ask_for_assistance', ticket_id)
         else:
             raise ChosenPassengerDoesNotExist
 
@@ -209,120 +1067,369 @@ class Database:
         if ticket_id in self.tickets():
             if not ticket_id or not str(ticket_id):
                 raise InvalidPassengerTicketID
-            elif ticket_id not in plane.busy_assistnats():
-                raise ChosenPassengerHasNotAskedForHelp
-            else:
-                plane._busy_assistants.remove(ticket_id)
+            with self.plane_lock(plane_num):
+                plane.thank_for_assistance(ticket_id)
+                self._log('thank_for_assistance', ticket_id)
         else:
             raise ChosenPassengerDoesNotExist
 
-    def read_flights(self, path):
+    def _try_add_flight(self, flight):
+        """
+        Adds flight into Database unless it is rejected.
+        Returns the reason of the rejection or None - does not raise.
+        """
+        if flight.plane_number() in self._flights:
+            return DUPLICATE_KEY
+        self._flights[flight.plane_number()] = flight
+        return None
+
+    def _try_add_plane(self, plane):
+        """
+        Adds plane into Database unless it is rejected.
+        Returns the reason of the rejection or None - does not raise.
+        """
+        if plane.plane_number() in self._planes:
+            return DUPLICATE_KEY
+        if plane.plane_number() not in self._flights:
+            return UNKNOWN_FLIGHT
+        self._planes[plane.plane_number()] = plane
+        return None
+
+    def _try_add_ticket(self, ticket, reseat_occupied=False):
+        """
+        Books the seat of the ticket and adds it into Database unless it is
+        rejected. If reseat_occupied is True ticket which seat is already
+        occupied gets the first free seat of its class.
+        Returns the reason of the rejection or None - does not raise.
+        """
+        if ticket.ticket_id() in self._tickets:
+            return DUPLICATE_KEY
+        plane_num = ticket.plane_number()
+        if plane_num not in self._flights or plane_num not in self._planes:
+            return UNKNOWN_FLIGHT
+        occupancy = self._planes[plane_num].seats_occupancy(
+            ticket.seat_class()
+        )
+        if ticket.seat_number() > occupancy.seats_number():
+            return INVALID_SEAT_NUMBER
+        with self.plane_lock(plane_num):
+            if occupancy.is_free(ticket.seat_number()):
+                if not self._book(ticket, new_only=True):
+                    return DUPLICATE_KEY
+                return None
+            if reseat_occupied and occupancy.first_free_seat() is not None:
+                try:
+                    self._book_next_free_seat(
+                        ticket.ticket_id(),
+                        plane_num,
+                        ticket.seat_class(),
+                        ticket.gate_number()
+                    )
+                except TicketAlreadyExistsError:
+                    return DUPLICATE_KEY
+                return None
+        return OCCUPIED_SEAT
+
+    def _try_add_passenger(self, person):
+        """
+        Adds passenger into Database unless it is rejected.
+        Returns the reason of the rejection or None - does not raise.
+        """
+        if person.ticket_id() in self._passengers:
+            return DUPLICATE_KEY
+        if person.ticket_id() not in self._tickets:
+            return UNKNOWN_TICKET
+        self._add_passenger(person)
+        return None
+
+    def add_flights(self, flights):
+        """
+        Adds flights from given iterable into Database.
+        Returns RejectionCounts of the omitted flights.
+        """
+        return self._add_objects('flights', flights, self._try_add_flight)
+
+    def add_planes(self, planes):
+        """
+        Adds planes from given iterable into Database.
+        Returns RejectionCounts of the omitted planes.
+        """
+        return self._add_objects('planes', planes, self._try_add_plane)
+
+    def add_tickets(self, tickets, reseat_occupied=False):
+        """
+        Adds tickets from given iterable into Database - they are booked
+        with book_tickets_bulk() in batches of TICKETS_BATCH_SIZE, so that
+        tickets read from a file are not all kept in memory and the locks
+        are released between batches.
+        If reseat_occupied is True tickets which seats are already occupied
+        get the first free seat of their class instead of being omitted.
+        Returns RejectionCounts of the omitted tickets.
+        """
+        rejections = RejectionCounts()
+        tickets = iter(tickets)
+        batch_log = self._batch_log('tickets')
+        while True:
+            batch = list(islice(tickets, TICKETS_BATCH_SIZE))
+            if not batch:
+                return rejections
+            report = self._book_tickets_batch(
+                batch,
+                operation=BATCH_OPERATIONS['tickets']
+            )
+            try:
+                for ticket, reason in report.conflicts():
+                    if reseat_occupied and reason == OCCUPIED_SEAT:
+                        reason = self._try_add_ticket(ticket, reseat_occupied)
+                        if reason is None:
+                            batch_log.add(
+                                self._added_fields('tickets', ticket)
+                            )
+                    if reason is not None:
+                        rejections[reason] += 1
+            finally:
+                batch_log.flush()
+
+    def add_passengers(self, passengers):
+        """
+        Adds passengers from given iterable into Database.
+        Returns RejectionCounts of the omitted passengers.
+        """
+        return self._add_objects(
+            'passengers',
+            passengers,
+            self._try_add_passenger
+        )
+
+    def _add_objects(self, kind, objects, try_add):
+        """
+        Adds objects of given kind one at a time with try_add, which returns
+        the reason of rejecting an object or None. Added objects are
+        recorded in the journal in batches.
+        Returns RejectionCounts of the omitted objects.
+        """
+        rejections = RejectionCounts()
+        batch_log = self._batch_log(kind)
+        try:
+            for new_object in objects:
+                reason = try_add(new_object)
+                if reason is not None:
+                    rejections[reason] += 1
+                else:
+                    batch_log.add(self._added_fields(kind, new_object))
+        finally:
+            batch_log.flush()
+        return rejections
+
+    def _read_file(self, kind, path, report=None, **options):
+        """
+        Reads objects of given kind from csv file and adds them into
+        Database. Without report all objects are added with add_* method,
+        with report one at a time, so that every omitted row - rejected
+        either by the reader or by Database - is passed to the report
+        with its line number while the file is being read.
+        Returns RejectionCounts of the omitted rows.
+        """
+        with translated_read_errors(path):
+            with open(path, 'r') as file_handle:
+                if report is None:
+                    rejections = RejectionCounts()
+                    adders = {
+                        'flights': self.add_flights,
+                        'planes': self.add_planes,
+                        'tickets': self.add_tickets,
+                        'passengers': self.add_passengers
+                    }
+                    objects = CSV_READERS[kind](file_handle, rejections)
+                    rejections.update(adders[kind](objects, **options))
+                    return rejections
+
+                adders = {
+                    'flights': self._try_add_flight,
+                    'planes': self._try_add_plane,
+                    'tickets': self._try_add_ticket,
+                    'passengers': self._try_add_passenger
+                }
+                report.set_source(path)
+                counts_before = report.counts().copy()
+                rows = CSV_ROW_READERS[kind](file_handle, report)
+                batch_log = self._batch_log(kind)
+                try:
+                    for line_number, row, new_object in rows:
+                        reason = adders[kind](new_object, **options)
+                        if reason is not None:
+                            report.reject(reason, line_number, row)
+                        else:
+                            batch_log.add(
+                                self._added_fields(kind, new_object)
+                            )
+                finally:
+                    batch_log.flush()
+                return RejectionCounts(report.counts() - counts_before)
+
+    def read_flights(self, path, report=None):
         """
         Reads data from csv files and adds new obecjts of class Flight
         that are not represented in database.
+        Objects are added one at a time as they are read from the file.
+        If report is given every omitted row is written into it.
+        Returns RejectionCounts of the omitted rows.
         """
-        detected_existing_keys = 0
-        try:
-            with open(path, 'r')as file_handle:
-                data_from_csv = read_flights_from_csv(file_handle)
-
-            if data_from_csv is None:
-                raise MalformedFileError
-
-            for flight_num in data_from_csv:
-                flight = data_from_csv[flight_num]
-                operation_result = self.add_flight(flight)
-                detected_existing_keys += operation_result
-        except FileNotFoundError:
-            raise FilePathNotFoundError
-        except IsADirectoryError:
-            raise FileIsADirectoryError
-        except InvalidKeyInFlightsFile:
-            raise InvalidFileHeaderError
-        return detected_existing_keys
+        return self._read_file('flights', path, report)
 
-    def read_passengers(self, path):
+    def read_passengers(self, path, report=None):
         """
         Reads data from csv files and adds new obecjts of class Passenger
         that are not represented in database.
+        Objects are added one at a time as they are read from the file.
+        If report is given every omitted row is written into it.
+        Returns RejectionCounts of the omitted rows.
         """
-        detected_invalid_rows = 0
-        try:
-            with open(path, 'r') as file_handle:
-                people_from_csv = read_passengers_from_csv(file_handle)
-
-            if people_from_csv is None:
-                raise MalformedFileError
+        return self._read_file('passengers', path, report)
 
-            for person_id in people_from_csv:
-                try:
-                    person = people_from_csv[person_id]
-                    operation_result = self.add_passenger(person)
-                    detected_invalid_rows += operation_result
-                except LackingTicketObjectError:
-                    detected_invalid_rows += 1
-        except FileNotFoundError:
-            raise FilePathNotFoundError
-        except IsADirectoryError:
-            raise FileIsADirectoryError
-        except InvalidKeyInPassengersFile:
-            raise InvalidFileHeaderError
-        return detected_invalid_rows
-
-    def read_planes(self, path):
+    def read_planes(self, path, report=None):
         """
         Reads data from csv files and adds new obecjts of class Plane
         that are not represented in database.
+        Objects are added one at a time as they are read from the file.
+        If report is given every omitted row is written into it.
+        Returns RejectionCounts of the omitted rows.
         """
-        detected_invalid_rows = 0
-        try:
-            with open(path, 'r') as file_handle:
-                planes_from_csv = read_planes_from_csv(file_handle)
-
-            if planes_from_csv is None:
-                raise MalformedFileError
+        return self._read_file('planes', path, report)
 
-            for plane_number in planes_from_csv:
-                try:
-                    operation_result = self.add_plane(
-                        planes_from_csv[plane_number]
-                    )
-                    detected_invalid_rows += operation_result
-                except LackingFlightObjectError:
-                    detected_invalid_rows += 1
-        except FileNotFoundError:
-            raise FilePathNotFoundError
-        except IsADirectoryError:
-            raise FileIsADirectoryError
-        except InvalidKeyInPlanesFile:
-            raise InvalidFileHeaderError
-        return detected_invalid_rows
-
-    def read_tickets(self, path):
+    def read_tickets(self, path, reseat_occupied=False, report=None):
         """
         Reads data from csv files and adds new obecjts of class Tickets
         that are not represented in database.
+        If reseat_occupied is True tickets which seats are already occupied
+        get the first free seat of their class instead of being omitted.
+        If report is given every omitted row is written into it.
+        Returns RejectionCounts of the omitted rows.
+        """
+        return self._read_file(
+            'tickets',
+            path,
+            report,
+            reseat_occupied=reseat_occupied
+        )
+
+    def read_files(self, paths, executor=None, report=None):
+        """
+        Parses csv files given in paths dictionary - keys are 'flights',
+        'planes', 'tickets' and 'passengers' - at the same time and adds
+        the objects into Database in order: flights, planes, tickets,
+        passengers, because planes and tickets require flights and
+        passengers require tickets.
+        Files are parsed by the executor, by default by a pool of processes.
+        Returns dictionary with RejectionCounts of the omitted rows of each
+        file, the same as returned by read_* methods.
+        Stops at the first file that cannot be read, objects from files
+        preceding it are already added.
+        If report is given every omitted row is written into it - the files
+        are then read one after another.
         """
-        detected_invalid_rows = 0
+        if report is not None:
+            return {
+                kind: self._read_file(kind, paths[kind], report)
+                for kind in LOADING_ORDER
+                if kind in paths
+            }
+        kinds = [kind for kind in LOADING_ORDER if kind in paths]
+        if not kinds:
+            return {}
+        own_executor = executor is None
+        if own_executor:
+            executor = ProcessPoolExecutor(max_workers=parser_count(kinds))
         try:
-            with open(path, 'r') as file_handle:
-                tickets_from_csv = read_tickets_from_csv(file_handle)
+            parsed_files = {
+                kind: executor.submit(parse_csv_file, kind, paths[kind])
+                for kind in kinds
+            }
+            adders = {
+                'flights': self.add_flights,
+                'planes': self.add_planes,
+                'tickets': self.add_tickets,
+                'passengers': self.add_passengers
+            }
+            rejections = {}
+            for kind in parsed_files:
+                with translated_read_errors(paths[kind]):
+                    objects, rejections[kind] = parsed_files[kind].result()
+                rejections[kind].update(adders[kind](objects))
+            return rejections
+        finally:
+            if own_executor:
+                executor.shutdown(cancel_futures=True)
 
-            if tickets_from_csv is None:
-                raise MalformedFileError
+    def write_files(self, paths, buffer_size=WRITE_BUFFER_SIZE):
+        """
+        Writes the Database into csv files given in paths dictionary - keys
+        are the same as in read_files() - under the headers they are read
+        with, so the files can be read back.
+        Rows are written as they are generated, through a buffer of given
+        size. Every file is written into a temporary file renamed over
+        the path when complete - the previous file stays untouched if
+        writing fails.
+        """
+        for kind in LOADING_ORDER:
+            if kind in paths:
+                with atomic_open(
+                    paths[kind], 'w', buffer_size, newline=''
+                ) as file_handle:
+                    self._write_csv_file(kind, file_handle)
 
-            for ticket_id in tickets_from_csv:
-                try:
-                    operation_result = self.add_ticket(
-                        tickets_from_csv[ticket_id]
-                        )
-                    detected_invalid_rows += operation_result
-                except (ChosenSeatIsOccupied, LackingFlightObjectError):
-                    detected_invalid_rows += 1
-        except FileNotFoundError:
-            raise FilePathNotFoundError
-        except IsADirectoryError:
-            raise FileIsADirectoryError
-        except InvalidKeyInTicketsFile:
-            raise InvalidFileHeaderError
-        return detected_invalid_rows
+    def _write_csv_file(self, kind, file_handle):
+        """
+        Writes objects of given kind into csv file. Tickets are written
+        under the tickets lock - bookings made meanwhile wait for it.
+        """
+        if kind == 'flights':
+            write_flights_to_csv(file_handle, self._flights.values())
+        elif kind == 'planes':
+            write_planes_to_csv(file_handle, self._planes.values())
+        elif kind == 'tickets':
+            with self._tickets_lock:
+                if isinstance(self._tickets, TicketStore):
+                    rows = self._tickets.rows()
+                    write_csv(file_handle, TICKETS_FILE_HEADER, rows)
+                else:
+                    write_tickets_to_csv(file_handle, self._tickets.values())
+        else:
+            write_passengers_to_csv(file_handle, self._passengers.values())
+
+    def save_snapshot(self, path, sources=()):
+        """
+        Saves the whole Database into binary snapshot file.
+        Modification times of source files are stored in the snapshot,
+        so it is treated as stale as soon as any of them changes.
+        """
+        with atomic_open(path, 'wb') as file_handle:
+            write_snapshot(file_handle, self, sources)
+
+    def load_snapshot(self, path, sources=None):
+        """
+        Replaces content of Database with content of binary snapshot file.
+        Objects are restored without validating them again.
+        Raises StaleSnapshotError if any of the source files has changed
+        since the snapshot was saved and MalformedFileError if the file
+        is not a valid snapshot.
+        """
+        with translated_read_errors(path):
+            with open(path, 'rb') as file_handle:
+                data = file_handle.read()
+        flights, planes, tickets, passengers, released = read_snapshot(
+            data,
+            sources
+        )
+        if isinstance(self._tickets, TicketStore):
+            self._tickets = TicketStore()
+            self._tickets.update(tickets)
+        else:
+            self._tickets = tickets
+        self._flights = flights
+        self._planes = planes
+        self._passengers = passengers
+        self._rebuild_ticket_indexes(released)
+        self._passenger_names = NameIndex()
+        for person in passengers.values():
+            self._passenger_names.add(person)
@@ -112,3 +112,23 @@ class ChosenPassengerHasNotAskedForHelp(Exception):
 
 class MalformedFileError(Exception):
     pass
+
+
+class NoFreeSeatsError(Exception):
+    pass
+
+
+class TicketAlreadyExistsError(Exception):
+    pass
+
+
+class StaleSnapshotError(Exception):
+    pass
+
+
+class StaleIndexError(Exception):
+    pass
+
+
+class MalformedResponseError(Exception):
+    pass
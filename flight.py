@@ -1,12 +1,18 @@
+from rejections import INVALID_PLANE_NUMBER
 from errors import InvalidPlaneNumber
 
 
+MAX_NUMBER = 2 ** 63 - 1
+
+
 class Flight:
     """
     Class Flight. Contains attributes:
     :param plane_nummber: plane's number
     :type plane_number: int
     """
+    __slots__ = ('_plane_number',)
+
     def __init__(self, plane_number):
         """
         Creates instance of class Flight.
@@ -14,11 +20,46 @@ class Flight:
         if self._if_plane_number(plane_number):
             self._plane_number = int(plane_number)
 
+    @staticmethod
+    def _is_positive_int(value):
+        """
+        Checks whether the value is a positive integer not greater than
+        MAX_NUMBER, so that it fits the 64-bit columns of TicketStore,
+        snapshots and indexes, without raising exceptions - values that
+        cannot be converted to int are not.
+        """
+        if type(value) is int:
+            return 0 < value <= MAX_NUMBER
+        try:
+            return 0 < int(value) <= MAX_NUMBER and int(value) == value
+        except (TypeError, ValueError, OverflowError):
+            return False
+
+    @staticmethod
+    def rejection_reason(plane_number):
+        """
+        Returns the reason why Flight cannot be created of given data or
+        None if it can - does not raise exceptions.
+        """
+        if not Flight._is_positive_int(plane_number):
+            return INVALID_PLANE_NUMBER
+        return None
+
+    @classmethod
+    def from_checked(cls, plane_number):
+        """
+        Creates instance of Flight of data for which rejection_reason()
+        returned None, without checking it again.
+        """
+        flight = cls.__new__(cls)
+        flight._plane_number = plane_number
+        return flight
+
     def _if_plane_number(self, plane_number):
         """
         Checks whether the plane_number is a positive integer.
         """
-        if not int(plane_number) > 0 or int(plane_number) != plane_number:
+        if not self._is_positive_int(plane_number):
             raise InvalidPlaneNumber
         return True
 
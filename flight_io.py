@@ -1,26 +1,80 @@
-from flight import Flight, InvalidPlaneNumber
+from flight import Flight
+from csv_io import read_header, parse_int, write_csv
+from rejections import MALFORMED_ROW
 import csv
 from errors import (
     InvalidKeyInFlightsFile
 )
 
 
+FLIGHTS_FILE_HEADER = ('plane_number',)
+
+
+def iter_flight_rows_from_csv(file_handle, rejections=None):
+    """
+    Yields (line number, row, object of class Flight) tuples read from csv
+    file one at a time - line number is the one the row ends at.
+    The header is validated once, rows are parsed positionally.
+    Omits invalid data rows - if rejections is given, every omitted row
+    is passed to its reject() method with the reason, line number and row.
+    Raises csv.Error if the file is malformed.
+    """
+    reader = csv.reader(file_handle)
+    try:
+        columns = read_header(reader, FLIGHTS_FILE_HEADER)
+    except KeyError:
+        raise InvalidKeyInFlightsFile
+    if columns is None:
+        return
+    plane_index, = columns
+    row_length = plane_index + 1
+    for row in reader:
+        if not row:
+            continue
+        if len(row) < row_length:
+            reason = MALFORMED_ROW
+        else:
+            plane_number = parse_int(row[plane_index])
+            reason = Flight.rejection_reason(plane_number)
+            if reason is None:
+                yield reader.line_num, row, Flight.from_checked(plane_number)
+                continue
+        if rejections is not None:
+            rejections.reject(reason, reader.line_num, row)
+
+
+def iter_flights_from_csv(file_handle, rejections=None):
+    """
+    Yields objects of class Flight read from csv file one at a time.
+    Omits invalid data rows - if rejections is given, every omitted row
+    is passed to its reject() method.
+    Raises csv.Error if the file is malformed.
+    """
+    for _, _, flight in iter_flight_rows_from_csv(file_handle, rejections):
+        yield flight
+
+
 def read_flights_from_csv(file_handle):
     """
     Reads data describing objects of class Flight from csv file.
     Omits invalid data rows.
     """
     flights = {}
-    reader = csv.DictReader(file_handle)
     try:
-        for flight_number in reader:
-            try:
-                plane_number = int(flight_number['plane_number'])
-                flights[plane_number] = Flight(plane_number)
-            except (ValueError, InvalidPlaneNumber):
-                continue
-    except KeyError:
-        raise InvalidKeyInFlightsFile
+        for flight in iter_flights_from_csv(file_handle):
+            flights[flight.plane_number()] = flight
     except csv.Error:
         return None
     return flights
+
+
+def write_flights_to_csv(file_handle, flights):
+    """
+    Writes objects of class Flight from given iterable into csv file
+    under the header read by iter_flights_from_csv - rows are
+    generated while being written.
+    """
+    write_csv(file_handle, FLIGHTS_FILE_HEADER, (
+        (flight.plane_number(),)
+        for flight in flights
+    ))
@@ -0,0 +1,93 @@
+from rejections import RejectionCounts
+from contextlib import contextmanager
+import csv
+import json
+
+
+REPORT_FORMATS = ('jsonl', 'csv')
+
+CSV_REPORT_HEADER = ('source', 'line', 'reason', 'row')
+
+
+class ImportReport:
+    """
+    Class ImportReport - writes details of every rejected data row into
+    a sidecar file as soon as the row is rejected, so that the report of
+    a file of any size takes constant memory.
+    Every record holds the source file, the line number, the reason and
+    the row. In 'jsonl' format every record is a JSON object in its own
+    line, in 'csv' format the fields of the row follow the reason.
+    Contains attributes:
+    :param file_handle: text file handle the records are written into
+    :type file_handle: file object
+
+    :param report_format: either 'jsonl' or 'csv'
+    :type report_format: str
+
+    :param source: path of the file which rows are being reported
+    :type source: str
+
+    :param counts: number of reported rows of each reason
+    :type counts: RejectionCounts
+    """
+    def __init__(self, file_handle, report_format='jsonl'):
+        """
+        Creates instance of ImportReport writing into file_handle.
+        """
+        if report_format not in REPORT_FORMATS:
+            raise ValueError(report_format)
+        self._file_handle = file_handle
+        self._report_format = report_format
+        self._source = None
+        self._counts = RejectionCounts()
+        self._writer = None
+        if report_format == 'csv':
+            self._writer = csv.writer(file_handle)
+            self._writer.writerow(CSV_REPORT_HEADER)
+
+    def source(self):
+        """
+        Returns path of the file which rows are being reported.
+        """
+        return self._source
+
+    def set_source(self, source):
+        """
+        Sets path of the file which rows are reported next.
+        """
+        self._source = None if source is None else str(source)
+
+    def counts(self):
+        """
+        Returns RejectionCounts of all reported rows.
+        """
+        return self._counts
+
+    def reject(self, reason, line_number=None, row=None):
+        """
+        Writes the record of the row rejected for given reason.
+        """
+        self._counts[reason] += 1
+        if self._writer is not None:
+            self._writer.writerow(
+                (self._source, line_number, reason, *(row or ()))
+            )
+            return
+        record = {
+            'source': self._source,
+            'line': line_number,
+            'reason': reason,
+            'row': row
+        }
+        self._file_handle.write(json.dumps(record) + '\n')
+
+
+@contextmanager
+def open_import_report(path):
+    """
+    Opens ImportReport writing into the file at given path - in 'csv'
+    format if the path ends with '.csv', otherwise in 'jsonl' format.
+    """
+    report_format = 'csv' if str(path).endswith('.csv') else 'jsonl'
+    with open(path, 'w', newline='') as file_handle:
+        yield ImportReport(file_handle, report_format)
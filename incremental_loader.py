@@ -0,0 +1,241 @@
+from database import (
+    Database,
+    CSV_READERS,
+    LOADING_ORDER,
+    translated_read_errors
+)
+from rejections import RejectionCounts
+from ticket_store import TicketStore
+from itertools import chain
+import locale
+import os
+
+
+TAIL_SIZE = 1 << 16
+
+
+class _SourceState:
+    """
+    What is known about the part of a source file already applied.
+    """
+    __slots__ = (
+        'device',
+        'inode',
+        'modification_time',
+        'size',
+        'header',
+        'offset',
+        'tail'
+    )
+
+    def __init__(self, device, inode, header):
+        self.device = device
+        self.inode = inode
+        self.modification_time = None
+        self.size = None
+        self.header = header
+        self.offset = len(header)
+        self.tail = b''
+
+    def tail_offset(self):
+        """
+        Returns the offset of the remembered tail in the file.
+        """
+        return self.offset - len(self.tail)
+
+    def read_tail(self, file_handle):
+        """
+        Remembers up to TAIL_SIZE bytes of binary file handle preceding
+        the offset, after the header.
+        """
+        start = max(len(self.header), self.offset - TAIL_SIZE)
+        file_handle.seek(start)
+        self.tail = file_handle.read(self.offset - start)
+
+    def matches(self, file_handle):
+        """
+        Returns True if binary file handle holds the remembered header
+        and tail where they were read from.
+        """
+        file_handle.seek(0)
+        if file_handle.read(len(self.header)) != self.header:
+            return False
+        file_handle.seek(self.tail_offset())
+        return file_handle.read(len(self.tail)) == self.tail
+
+
+class IncrementalLoader:
+    """
+    Class IncrementalLoader - keeps the Database in sync with csv files
+    which are only appended to.
+    For every file it remembers its modification time and size, the header,
+    the offset of the first byte not applied yet and up to TAIL_SIZE bytes
+    preceding it. Reloading parses only rows appended since and
+    applies them with add_* methods of the Database. Only complete lines
+    are applied - a row being written is applied by the next reload.
+    A file with the same modification time and size is not read at all.
+    If any file was truncated or replaced, or its header or the remembered
+    tail changed - even without changing its size - the Database is loaded
+    again from scratch. Only the header and the tail are compared, so
+    a reload reads a bounded part of the file - rows edited in place
+    between them are not noticed.
+    Contains attributes:
+    :param paths: dictionary of paths of 'flights', 'planes', 'tickets'
+    and 'passengers' files
+    :type paths: dict
+
+    :param database: the Database kept in sync
+    :type database: Database
+
+    :param sources: dictionary of states of the files already read
+    :type sources: dict
+
+    :param reloaded_fully: True if the last reload loaded the Database
+    from scratch
+    :type reloaded_fully: bool
+    """
+    def __init__(self, paths, database=None):
+        """
+        Creates instance of IncrementalLoader - nothing is read until
+        the first reload.
+        """
+        self._paths = dict(paths)
+        self._database = Database() if database is None else database
+        self._sources = {}
+        self._reloaded_fully = False
+
+    def database(self):
+        """
+        Returns the Database kept in sync - it is a new object after
+        reloading from scratch.
+        """
+        return self._database
+
+    def reloaded_fully(self):
+        """
+        Returns True if the last reload loaded the Database from scratch.
+        """
+        return self._reloaded_fully
+
+    def _is_unchanged(self, kind):
+        """
+        Returns True if everything already applied from the file is still
+        there. A file with the modification time and size it had when it
+        was last read is unchanged. Otherwise it has to be the same file,
+        not shorter, with the same header and the same bytes preceding
+        the remembered offset - appending to the file keeps them.
+        """
+        state = self._sources[kind]
+        path = self._paths[kind]
+        status = os.stat(path)
+        if (status.st_dev, status.st_ino) != (state.device, state.inode):
+            return False
+        if (status.st_mtime_ns, status.st_size) == (
+            state.modification_time,
+            state.size
+        ):
+            return True
+        if status.st_size < state.offset:
+            return False
+        with open(path, 'rb') as file_handle:
+            return state.matches(file_handle)
+
+    def _is_changed(self):
+        """
+        Returns True if any file has to be read from scratch.
+        """
+        for kind in self._sources:
+            with translated_read_errors(self._paths[kind]):
+                if not self._is_unchanged(kind):
+                    return True
+        return False
+
+    def _read_appended(self, kind):
+        """
+        Applies complete rows appended to the file since the last reload.
+        Returns RejectionCounts of the omitted rows.
+        """
+        path = self._paths[kind]
+        state = self._sources.get(kind)
+        encoding = locale.getpreferredencoding(False)
+        rejections = RejectionCounts()
+        with translated_read_errors(path):
+            with open(path, 'rb') as file_handle:
+                status = os.fstat(file_handle.fileno())
+                if state is None:
+                    header = file_handle.readline()
+                    if not header.endswith(b'\n'):
+                        return rejections
+                    state = _SourceState(
+                        status.st_dev,
+                        status.st_ino,
+                        header
+                    )
+                    self._sources[kind] = state
+                elif (status.st_mtime_ns, status.st_size) == (
+                    state.modification_time,
+                    state.size
+                ):
+                    return rejections
+                state.modification_time = status.st_mtime_ns
+                state.size = status.st_size
+                file_handle.seek(state.offset)
+
+                def complete_lines():
+                    for line in file_handle:
+                        if not line.endswith(b'\n'):
+                            return
+                        state.offset += len(line)
+                        yield line.decode(encoding)
+
+                header = state.header.decode(encoding)
+                objects = CSV_READERS[kind](
+                    chain([header], complete_lines()),
+                    rejections
+                )
+                adders = {
+                    'flights': self._database.add_flights,
+                    'planes': self._database.add_planes,
+                    'tickets': self._database.add_tickets,
+                    'passengers': self._database.add_passengers
+                }
+                rejections.update(adders[kind](objects))
+                state.read_tail(file_handle)
+        return rejections
+
+    def reload(self):
+        """
+        Applies rows appended to the files since the last reload, in order:
+        flights, planes, tickets, passengers. If any file has changed
+        otherwise, loads the Database again from scratch - if that fails,
+        the Database is left empty and the next reload starts from scratch.
+        Returns dictionary with RejectionCounts of the omitted rows of each
+        file, like Database.read_files().
+        """
+        if not self._sources:
+            self._reloaded_fully = True
+        elif self._is_changed():
+            self._reloaded_fully = True
+            self._database = self._new_database()
+            self._sources = {}
+        else:
+            self._reloaded_fully = False
+        try:
+            return {
+                kind: self._read_appended(kind)
+                for kind in LOADING_ORDER
+                if kind in self._paths
+            }
+        except Exception:
+            if self._reloaded_fully:
+                self._database = self._new_database()
+                self._sources = {}
+            raise
+
+    def _new_database(self):
+        """
+        Returns empty Database storing tickets the same way as the current
+        one.
+        """
+        columnar = isinstance(self._database.tickets(), TicketStore)
+        return Database(columnar_tickets=columnar)
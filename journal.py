@@ -0,0 +1,286 @@
+from flight import Flight
+from passenger import Passenger
+from plane import Plane
+from ticket import Ticket
+from snapshot import source_stamps
+from atomic_file import atomic_open
+import json
+import os
+import threading
+from errors import MalformedFileError
+
+
+SYNC_EVERY = 64
+COMPACT_EVERY = 10000
+
+
+def _check_committed(operation, report):
+    """
+    Raises ValueError if the replayed batch operation was not committed.
+    """
+    if not report.committed() or report.conflicts():
+        raise ValueError(f'Operation {operation} cannot be replayed')
+
+
+def _check_added(operation, rejections):
+    """
+    Raises ValueError if any object of the replayed batch was rejected.
+    """
+    if rejections.total():
+        raise ValueError(f'Operation {operation} cannot be replayed')
+
+
+def replay_record(database, record):
+    """
+    Applies the operation recorded in the journal to the Database.
+    Batch operations are recorded with the objects they added or changed,
+    so they have to add or change the same objects again - ValueError is
+    raised if any of them is rejected or conflicts.
+    """
+    operation, *arguments = record
+    if operation == 'add_flight':
+        database.add_flight(Flight(*arguments))
+    elif operation == 'add_plane':
+        database.add_plane(Plane(*arguments))
+    elif operation == 'add_ticket':
+        database.add_ticket(Ticket(*arguments))
+    elif operation == 'add_passenger':
+        database.add_passenger(Passenger(*arguments))
+    elif operation == 'book_seat':
+        database.book_seat(Ticket(*arguments))
+    elif operation == 'release_seat':
+        database.release_seat(Ticket(*arguments))
+    elif operation == 'change_seat':
+        database.change_seat(*arguments)
+    elif operation == 'ask_for_assistance':
+        database.ask_for_assistance(database.tickets()[arguments[0]])
+    elif operation == 'thank_for_assistance':
+        database.thank_for_assistance(database.tickets()[arguments[0]])
+    elif operation == 'add_flights':
+        flights = [Flight(plane_number) for plane_number in arguments[0]]
+        _check_added(operation, database.add_flights(flights))
+    elif operation == 'add_planes':
+        planes = [Plane(*fields) for fields in arguments[0]]
+        _check_added(operation, database.add_planes(planes))
+    elif operation == 'add_passengers':
+        passengers = [Passenger(*fields) for fields in arguments[0]]
+        _check_added(operation, database.add_passengers(passengers))
+    elif operation == 'book_tickets_bulk':
+        tickets = [Ticket(*fields) for fields in arguments[0]]
+        report = database.book_tickets_bulk(tickets, all_or_nothing=True)
+        _check_committed(operation, report)
+    elif operation == 'change_seats':
+        tickets = [Ticket(*fields) for fields in arguments[0]]
+        report = database.change_seats(tickets, all_or_nothing=True)
+        _check_committed(operation, report)
+    elif operation == 'reassign_plane':
+        report = database.reassign_plane(Plane(*arguments))
+        _check_committed(operation, report)
+    else:
+        raise ValueError(f'Unknown operation: {operation}')
+
+
+class Journal:
+    """
+    Class Journal - append-only journal of changes of Database.
+    Every change is a line holding JSON list of the operation and its
+    arguments, written to the file at once and synced to the disk every
+    sync_every changes. Compaction saves the Database into the base
+    snapshot and starts the journal again - the first line of the journal
+    identifies the base snapshot it was started after.
+    Contains attributes:
+    :param path: path of the journal file
+    :type path: str
+
+    :param base_path: path of the base snapshot
+    :type base_path: str
+
+    :param sync_every: number of changes after which the file is synced
+    :type sync_every: int
+
+    :param compact_every: number of changes after which compact_if_due()
+    compacts the journal
+    :type compact_every: int
+
+    :param file_handle: journal file opened for appending or None
+    :type file_handle: file
+
+    :param records: number of changes in the journal
+    :type records: int
+
+    :param unsynced: number of changes not synced to the disk yet
+    :type unsynced: int
+
+    :param lock: lock held while the file is written
+    :type lock: threading.Lock
+    """
+    def __init__(
+        self,
+        path,
+        sync_every=SYNC_EVERY,
+        compact_every=COMPACT_EVERY
+    ):
+        """
+        Creates instance of Journal - nothing is read or written until
+        recover() is called.
+        """
+        self._path = str(path)
+        self._base_path = f'{path}.base'
+        self._sync_every = sync_every
+        self._compact_every = compact_every
+        self._file_handle = None
+        self._records = 0
+        self._unsynced = 0
+        self._lock = threading.Lock()
+
+    def path(self):
+        """
+        Returns path of the journal file.
+        """
+        return self._path
+
+    def base_path(self):
+        """
+        Returns path of the base snapshot.
+        """
+        return self._base_path
+
+    def records(self):
+        """
+        Returns number of changes in the journal.
+        """
+        return self._records
+
+    def _base_stamp(self):
+        """
+        Returns modification time and size of the base snapshot or None if
+        there is no base snapshot.
+        """
+        if not os.path.exists(self._base_path):
+            return None
+        _, modification_time, size = source_stamps([self._base_path])[0]
+        return [modification_time, size]
+
+    def _start(self, base_stamp):
+        """
+        Replaces the journal file with an empty journal started after
+        the base snapshot with given stamp.
+        """
+        header = json.dumps({'base': base_stamp}).encode('utf-8') + b'\n'
+        with atomic_open(self._path, 'wb') as file_handle:
+            file_handle.write(header)
+
+    def _read(self):
+        """
+        Returns the base stamp from the first line of the journal, list of
+        recorded changes and the length of the complete lines. Incomplete
+        last line, left by a crash, is not returned. Returns None instead
+        of the stamp if there is no complete first line.
+        """
+        try:
+            with open(self._path, 'rb') as file_handle:
+                data = file_handle.read()
+        except FileNotFoundError:
+            return None, [], 0
+        lines = data.split(b'\n')
+        complete_length = len(data) - len(lines.pop())
+        if not lines:
+            return None, [], 0
+        try:
+            base_stamp = json.loads(lines[0])['base']
+            records = [json.loads(line) for line in lines[1:]]
+        except (ValueError, TypeError, KeyError):
+            raise MalformedFileError(self._path)
+        return base_stamp, records, complete_length
+
+    def recover(self, database):
+        """
+        Loads the base snapshot, if there is one, into the Database,
+        replays the journal on top of it and starts recording changes of
+        the Database. Without base snapshot the journal is replayed on top
+        of the Database as given. Journal started before the current base
+        snapshot is dropped - its changes are already in the snapshot.
+        Returns the number of replayed changes.
+        """
+        base_stamp = self._base_stamp()
+        if base_stamp is not None:
+            database.load_snapshot(self._base_path)
+        journal_stamp, records, complete_length = self._read()
+        if complete_length == 0 or journal_stamp != base_stamp:
+            records = []
+            self._start(base_stamp)
+        elif complete_length < os.path.getsize(self._path):
+            os.truncate(self._path, complete_length)
+        database.set_journal(None)
+        for record in records:
+            try:
+                replay_record(database, record)
+            except Exception as error:
+                raise MalformedFileError(self._path) from error
+        self._file_handle = open(self._path, 'ab')
+        self._records = len(records)
+        self._unsynced = 0
+        database.set_journal(self)
+        return len(records)
+
+    def record(self, operation, *arguments):
+        """
+        Appends the change to the journal. The file is synced to the disk
+        every sync_every changes.
+        """
+        line = json.dumps([operation, *arguments], separators=(',', ':'))
+        with self._lock:
+            self._file_handle.write(line.encode('utf-8') + b'\n')
+            self._file_handle.flush()
+            self._records += 1
+            self._unsynced += 1
+            if self._unsynced >= self._sync_every:
+                self._sync()
+
+    def _sync(self):
+        """
+        Syncs the journal file to the disk while the lock is held.
+        """
+        self._file_handle.flush()
+        os.fsync(self._file_handle.fileno())
+        self._unsynced = 0
+
+    def sync(self):
+        """
+        Syncs all recorded changes to the disk.
+        """
+        with self._lock:
+            self._sync()
+
+    def compact(self, database):
+        """
+        Saves the Database into the base snapshot and starts the journal
+        again. No other thread may change the Database meanwhile.
+        """
+        with self._lock:
+            database.save_snapshot(self._base_path)
+            self._file_handle.close()
+            self._start(self._base_stamp())
+            self._file_handle = open(self._path, 'ab')
+            self._records = 0
+            self._unsynced = 0
+
+    def compact_if_due(self, database):
+        """
+        Compacts the journal if it holds at least compact_every changes.
+        Returns True if the journal was compacted.
+        """
+        if self._records < self._compact_every:
+            return False
+        self.compact(database)
+        return True
+
+    def close(self):
+        """
+        Syncs the journal and closes its file.
+        """
+        if self._file_handle is None:
+            return
+        self.sync()
+        self._file_handle.close()
+        self._file_handle = None
@@ -0,0 +1,176 @@
+from database import Database, LOADING_ORDER, WRITE_BUFFER_SIZE
+from functools import wraps
+import threading
+
+
+DEPENDENCIES = {
+    'flights': (),
+    'planes': ('flights',),
+    'tickets': ('flights', 'planes'),
+    'passengers': ('tickets',)
+}
+
+
+def _loading(kind, method):
+    """
+    Returns method of Database which first loads the file of given kind
+    and the files it depends on.
+    """
+    @wraps(method)
+    def loading_method(self, *args, **kwargs):
+        if kind not in self._loaded:
+            self.load(kind)
+        return method(self, *args, **kwargs)
+    return loading_method
+
+
+class LazyDatabase(Database):
+    """
+    Class LazyDatabase - Database which reads every csv file only when
+    its collection is first needed. Reading a file reads first the files
+    it depends on: planes require flights, tickets require flights and
+    planes, passengers require tickets - listing flights reads only
+    the file of flights.
+    Contains attributes:
+    :param paths: dictionary of paths of 'flights', 'planes', 'tickets'
+    and 'passengers' files - missing kinds are left empty
+    :type paths: dict
+
+    :param loaded: set of kinds which files are already read
+    :type loaded: set
+
+    :param loading: set of kinds which files are being read
+    :type loading: set
+
+    :param loading_lock: lock held while a file is read
+    :type loading_lock: threading.RLock
+
+    :param rejections: dictionary with RejectionCounts of the omitted rows
+    of every file already read
+    :type rejections: dict
+    """
+    def __init__(self, paths, columnar_tickets=False):
+        """
+        Creates instance of LazyDatabase - nothing is read until needed.
+        """
+        super().__init__(columnar_tickets)
+        self._paths = dict(paths)
+        self._loaded = set()
+        self._loading = set()
+        self._loading_lock = threading.RLock()
+        self._rejections = {}
+
+    def loaded(self):
+        """
+        Returns tuple of kinds which files are already read, in loading
+        order.
+        """
+        return tuple(kind for kind in LOADING_ORDER if kind in self._loaded)
+
+    def rejections(self):
+        """
+        Returns dictionary with RejectionCounts of the omitted rows of every
+        file already read, like Database.read_files().
+        """
+        return dict(self._rejections)
+
+    def load(self, kind):
+        """
+        Reads the file of given kind - 'flights', 'planes', 'tickets' or
+        'passengers' - unless it is already read, after the files it
+        depends on. Raises the errors of Database.read_files() if the file
+        cannot be read - it is then read again on the next access.
+        """
+        with self._loading_lock:
+            if kind in self._loaded or kind in self._loading:
+                return
+            for dependency in DEPENDENCIES[kind]:
+                self.load(dependency)
+            self._loading.add(kind)
+            try:
+                if kind in self._paths:
+                    self._rejections[kind] = self._read_file(
+                        kind,
+                        self._paths[kind]
+                    )
+                self._loaded.add(kind)
+            finally:
+                self._loading.discard(kind)
+
+    def load_all(self):
+        """
+        Reads all files not read yet.
+        """
+        for kind in LOADING_ORDER:
+            self.load(kind)
+
+    def load_snapshot(self, path, sources=None):
+        """
+        Replaces content of Database with content of binary snapshot file -
+        the files are not read afterwards.
+        """
+        with self._loading_lock:
+            super().load_snapshot(path, sources)
+            self._loaded.update(LOADING_ORDER)
+
+    flights = _loading('flights', Database.flights)
+    add_flight = _loading('flights', Database.add_flight)
+    add_flights = _loading('flights', Database.add_flights)
+    read_flights = _loading('flights', Database.read_flights)
+
+    planes = _loading('planes', Database.planes)
+    add_plane = _loading('planes', Database.add_plane)
+    add_planes = _loading('planes', Database.add_planes)
+    read_planes = _loading('planes', Database.read_planes)
+
+    tickets = _loading('tickets', Database.tickets)
+    add_ticket = _loading('tickets', Database.add_ticket)
+    add_tickets = _loading('tickets', Database.add_tickets)
+    read_tickets = _loading('tickets', Database.read_tickets)
+    book_seat = _loading('tickets', Database.book_seat)
+    release_seat = _loading('tickets', Database.release_seat)
+    change_seat = _loading('tickets', Database.change_seat)
+    change_seats = _loading('tickets', Database.change_seats)
+    reassign_plane = _loading('tickets', Database.reassign_plane)
+    book_next_free_seat = _loading('tickets', Database.book_next_free_seat)
+    book_tickets_bulk = _loading('tickets', Database.book_tickets_bulk)
+    tickets_on_plane = _loading('tickets', Database.tickets_on_plane)
+    tickets_at_gate = _loading('tickets', Database.tickets_at_gate)
+    ask_for_assistance = _loading('tickets', Database.ask_for_assistance)
+    thank_for_assistance = _loading('tickets', Database.thank_for_assistance)
+
+    passengers = _loading('passengers', Database.passengers)
+    add_passenger = _loading('passengers', Database.add_passenger)
+    add_passengers = _loading('passengers', Database.add_passengers)
+    read_passengers = _loading('passengers', Database.read_passengers)
+    find_passengers = _loading('passengers', Database.find_passengers)
+    find_passengers_fuzzy = _loading(
+        'passengers',
+        Database.find_passengers_fuzzy
+    )
+
+    def read_files(self, paths, executor=None, report=None):
+        """
+        Reads csv files given in paths dictionary, like
+        Database.read_files(), after the own files of the same kinds.
+        """
+        for kind in LOADING_ORDER:
+            if kind in paths:
+                self.load(kind)
+        return super().read_files(paths, executor, report)
+
+    def write_files(self, paths, buffer_size=WRITE_BUFFER_SIZE):
+        """
+        Reads all files not read yet and writes the Database into csv files
+        given in paths dictionary, like Database.write_files().
+        """
+        self.load_all()
+        super().write_files(paths, buffer_size)
+
+    def save_snapshot(self, path, sources=()):
+        """
+        Reads all files not read yet and saves the whole Database into
+        binary snapshot file, like Database.save_snapshot().
+        """
+        self.load_all()
+        super().save_snapshot(path, sources)
@@ -0,0 +1,167 @@
+from incremental_loader import IncrementalLoader
+import os
+import threading
+from errors import (
+    FilePathNotFoundError,
+    FileIsADirectoryError,
+    InvalidFileHeaderError,
+    MalformedFileError
+)
+
+
+class LiveSync:
+    """
+    Class LiveSync - keeps a Database in memory in sync with the csv files
+    by polling their modification time, size and inode.
+    Appended rows are applied to the Database in place. A file changed
+    otherwise makes the Database be loaded again from scratch - passengers
+    which asked for assistance keep it if their tickets are still there.
+    Queries have to hold lock() - the Database is changed only while the
+    lock is held by poll().
+    Contains attributes:
+    :param loader: loader applying the changes of the files
+    :type loader: IncrementalLoader
+
+    :param database: Database of the last successful poll
+    :type database: Database
+
+    :param poll_interval: number of seconds between polls
+    :type poll_interval: float
+
+    :param stamps: modification time, size and inode of every file seen by
+    the last successful poll
+    :type stamps: dict
+
+    :param last_error: error raised by the last poll or None
+    :type last_error: Exception
+
+    :param lock: lock held while the Database is changed
+    :type lock: threading.RLock
+
+    :param stop_event: event set to stop polling in background
+    :type stop_event: threading.Event
+
+    :param thread: thread polling in background
+    :type thread: threading.Thread
+    """
+    def __init__(self, paths, poll_interval=1.0, database=None):
+        """
+        Creates instance of LiveSync - nothing is read until the first poll.
+        """
+        self._loader = IncrementalLoader(paths, database)
+        self._database = self._loader.database()
+        self._paths = dict(paths)
+        self._poll_interval = poll_interval
+        self._stamps = None
+        self._last_error = None
+        self._lock = threading.RLock()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def database(self):
+        """
+        Returns the Database kept in sync.
+        """
+        return self._database
+
+    def lock(self):
+        """
+        Returns the lock which has to be held while querying the Database.
+        """
+        return self._lock
+
+    def last_error(self):
+        """
+        Returns the error raised by the last poll or None if it succeeded.
+        """
+        return self._last_error
+
+    def _current_stamps(self):
+        """
+        Returns modification time, size and inode of every file, None for
+        missing files.
+        """
+        stamps = {}
+        for kind, path in self._paths.items():
+            try:
+                status = os.stat(path)
+            except OSError:
+                stamps[kind] = None
+                continue
+            stamps[kind] = (status.st_mtime_ns, status.st_size, status.st_ino)
+        return stamps
+
+    @staticmethod
+    def _carry_over_assistance(old_database, new_database):
+        """
+        Marks passengers which asked for assistance in the old Database as
+        asking for it in the new one, if their tickets are still there.
+        """
+        for plane_number, plane in old_database.planes().items():
+            for ticket_id in plane.busy_assistnats():
+                ticket = new_database.tickets().get(ticket_id)
+                if ticket is None or ticket.plane_number() != plane_number:
+                    continue
+                if plane_number in new_database.planes():
+                    new_database.ask_for_assistance(ticket)
+
+    def poll(self):
+        """
+        Applies the changes of the files made since the last poll.
+        Returns True if the Database was changed. If the files cannot be
+        read, keeps the last synced Database, remembers the error and tries
+        again on the next poll.
+        """
+        stamps = self._current_stamps()
+        if stamps == self._stamps:
+            return False
+        with self._lock:
+            try:
+                self._loader.reload()
+            except (
+                FilePathNotFoundError,
+                FileIsADirectoryError,
+                InvalidFileHeaderError,
+                MalformedFileError
+            ) as error:
+                self._last_error = error
+                return False
+            database = self._loader.database()
+            if database is not self._database:
+                self._carry_over_assistance(self._database, database)
+                self._database = database
+        self._stamps = stamps
+        self._last_error = None
+        return True
+
+    def _run(self):
+        """
+        Polls the files until stopped.
+        """
+        while not self._stop_event.wait(self._poll_interval):
+            self.poll()
+
+    def start(self):
+        """
+        Polls the files once and then keeps polling them in background.
+        """
+        self.poll()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stops polling in background.
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exception):
+        self.stop()
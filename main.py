@@ -1,11 +1,15 @@
 from ui import UserInterface
 
 
+journal_file = 'database.journal'
+
+
 def main():
     """
-    Function boots the UserInterface.
+    Function boots the UserInterface - changes made in the previous runs
+    are recovered from the journal.
     """
-    UserInterface()
+    UserInterface(journal_file)
 
 
 if __name__ == '__main__':
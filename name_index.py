@@ -0,0 +1,124 @@
+def normalize_name(name):
+    """
+    Returns case-folded name with whitespace collapsed to single spaces.
+    """
+    return ' '.join(name.casefold().split())
+
+
+def edit_distance(first, second):
+    """
+    Returns the Levenshtein distance between two strings - the number of
+    letters which have to be inserted, removed or replaced.
+    """
+    previous_row = list(range(len(second) + 1))
+    for index, letter in enumerate(first, 1):
+        row = [index]
+        for column in range(1, len(second) + 1):
+            row.append(min(
+                row[column - 1] + 1,
+                previous_row[column] + 1,
+                previous_row[column - 1] + (second[column - 1] != letter)
+            ))
+        previous_row = row
+    return previous_row[-1]
+
+
+class _TrieNode:
+    """
+    Node of the trie - ticket_ids are set only in nodes ending a name.
+    """
+    __slots__ = ('children', 'ticket_ids')
+
+    def __init__(self):
+        self.children = {}
+        self.ticket_ids = None
+
+
+class NameIndex:
+    """
+    Class NameIndex - trie of normalized passengers' names.
+    Every passenger is indexed under the last name, 'first last' and
+    'last first' names, so that a lookup by any of them finds the passenger.
+    Contains attributes:
+    :param root: root node of the trie
+    :type root: _TrieNode
+    """
+    def __init__(self):
+        """
+        Creates empty instance of NameIndex.
+        """
+        self._root = _TrieNode()
+
+    def _insert(self, name, ticket_id):
+        node = self._root
+        for letter in name:
+            child = node.children.get(letter)
+            if child is None:
+                child = node.children[letter] = _TrieNode()
+            node = child
+        if node.ticket_ids is None:
+            node.ticket_ids = {}
+        node.ticket_ids[ticket_id] = None
+
+    def add(self, passenger):
+        """
+        Adds passenger into the index.
+        """
+        first_name = normalize_name(passenger.first_name())
+        last_name = normalize_name(passenger.last_name())
+        ticket_id = passenger.ticket_id()
+        self._insert(last_name, ticket_id)
+        self._insert(f'{first_name} {last_name}', ticket_id)
+        self._insert(f'{last_name} {first_name}', ticket_id)
+
+    def find_prefix(self, prefix):
+        """
+        Returns ids of the tickets of passengers which names start with
+        given prefix. Visits only the subtree of the prefix.
+        """
+        node = self._root
+        for letter in normalize_name(prefix):
+            node = node.children.get(letter)
+            if node is None:
+                return []
+        found = {}
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if node.ticket_ids is not None:
+                found.update(node.ticket_ids)
+            stack.extend(reversed(node.children.values()))
+        return list(found)
+
+    def find_fuzzy(self, name, max_distance=1):
+        """
+        Returns ids of the tickets of passengers which names are within
+        max_distance edits (Levenshtein distance) from given name, the
+        closest first. Branches of the trie which cannot be within
+        the distance are not visited.
+        """
+        name = normalize_name(name)
+        first_row = list(range(len(name) + 1))
+        matches = {}
+        stack = [
+            (letter, child, first_row)
+            for letter, child in self._root.children.items()
+        ]
+        while stack:
+            letter, node, previous_row = stack.pop()
+            row = [previous_row[0] + 1]
+            for column in range(1, len(name) + 1):
+                row.append(min(
+                    row[column - 1] + 1,
+                    previous_row[column] + 1,
+                    previous_row[column - 1] + (name[column - 1] != letter)
+                ))
+            distance = row[-1]
+            if node.ticket_ids is not None and distance <= max_distance:
+                for ticket_id in node.ticket_ids:
+                    if distance < matches.get(ticket_id, max_distance + 1):
+                        matches[ticket_id] = distance
+            if min(row) <= max_distance:
+                for next_letter, child in node.children.items():
+                    stack.append((next_letter, child, row))
+        return sorted(matches, key=lambda ticket_id: matches[ticket_id])
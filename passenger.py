@@ -1,3 +1,8 @@
+from rejections import (
+    INVALID_FIRST_NAME,
+    INVALID_LAST_NAME,
+    INVALID_TICKET_ID
+)
 from errors import (
     InvalidPassengerFirstName,
     InvalidPassengerLastName,
@@ -17,6 +22,8 @@ class Passenger:
     :param ticket_id: passenger's ticket id
     :type ticket_id: str
     """
+    __slots__ = ('_first_name', '_last_name', '_ticket_id')
+
     def __init__(self, fname, lname, ticket_id):
         """
         Creates instance of passenger.
@@ -28,11 +35,44 @@ class Passenger:
         if self._if_ticket_id(ticket_id):
             self._ticket_id = str(ticket_id)
 
+    @staticmethod
+    def _is_not_empty(value):
+        """
+        Checks whether the value is a not empty string.
+        """
+        return bool(value) and bool(str(value))
+
+    @staticmethod
+    def rejection_reason(fname, lname, ticket_id):
+        """
+        Returns the reason why Passenger cannot be created of given data or
+        None if it can - does not raise exceptions.
+        """
+        if not Passenger._is_not_empty(fname):
+            return INVALID_FIRST_NAME
+        if not Passenger._is_not_empty(lname):
+            return INVALID_LAST_NAME
+        if not Passenger._is_not_empty(ticket_id):
+            return INVALID_TICKET_ID
+        return None
+
+    @classmethod
+    def from_checked(cls, fname, lname, ticket_id):
+        """
+        Creates instance of Passenger of data for which rejection_reason()
+        returned None, without checking it again.
+        """
+        passenger = cls.__new__(cls)
+        passenger._first_name = str(fname)
+        passenger._last_name = str(lname)
+        passenger._ticket_id = str(ticket_id)
+        return passenger
+
     def _if_fname(self, fname):
         """
         Checks whether the first name is a not empty string.
         """
-        if not fname or not str(fname):
+        if not self._is_not_empty(fname):
             raise InvalidPassengerFirstName
         return True
 
@@ -40,7 +80,7 @@ class Passenger:
         """
         Checks whether the last name is a not empty string.
         """
-        if not lname or not str(lname):
+        if not self._is_not_empty(lname):
             raise InvalidPassengerLastName
         return True
 
@@ -48,7 +88,7 @@ class Passenger:
         """
         Checks whether the ticket_id is a not empty string.
         """
-        if not ticket_id or not str(ticket_id):
+        if not self._is_not_empty(ticket_id):
             raise InvalidPassengerTicketID
         return True
 
@@ -1,11 +1,56 @@
 from passenger import Passenger
+from csv_io import read_header, write_csv
+from rejections import MALFORMED_ROW
 import csv
-from errors import (
-    InvalidPassengerFirstName,
-    InvalidPassengerLastName,
-    InvalidPassengerTicketID,
-    InvalidKeyInPassengersFile
-)
+from errors import InvalidKeyInPassengersFile
+
+
+PASSENGERS_FILE_HEADER = ('first_name', 'last_name', 'ticket_id')
+
+
+def iter_passenger_rows_from_csv(file_handle, rejections=None):
+    """
+    Yields (line number, row, object of class Passenger) tuples read from csv
+    file one at a time - line number is the one the row ends at.
+    The header is validated once, rows are parsed positionally.
+    Omits invalid data rows - if rejections is given, every omitted row
+    is passed to its reject() method with the reason, line number and row.
+    Raises csv.Error if the file is malformed.
+    """
+    reader = csv.reader(file_handle)
+    try:
+        columns = read_header(reader, PASSENGERS_FILE_HEADER)
+    except KeyError:
+        raise InvalidKeyInPassengersFile
+    if columns is None:
+        return
+    first_name_index, last_name_index, id_index = columns
+    row_length = max(columns) + 1
+    for row in reader:
+        if not row:
+            continue
+        if len(row) < row_length:
+            reason = MALFORMED_ROW
+        else:
+            data = (row[first_name_index], row[last_name_index], row[id_index])
+            reason = Passenger.rejection_reason(*data)
+            if reason is None:
+                yield reader.line_num, row, Passenger.from_checked(*data)
+                continue
+        if rejections is not None:
+            rejections.reject(reason, reader.line_num, row)
+
+
+def iter_passengers_from_csv(file_handle, rejections=None):
+    """
+    Yields objects of class Passenger read from csv file one at a time.
+    Omits invalid data rows - if rejections is given, every omitted row
+    is passed to its reject() method.
+    Raises csv.Error if the file is malformed.
+    """
+    rows = iter_passenger_rows_from_csv(file_handle, rejections)
+    for _, _, passenger in rows:
+        yield passenger
 
 
 def read_passengers_from_csv(file_handle, passengers=None):
@@ -15,22 +60,25 @@ def read_passengers_from_csv(file_handle, passengers=None):
     """
     if passengers is None:
         passengers = {}
-    reader = csv.DictReader(file_handle)
     try:
-        for person in reader:
-            try:
-                first_name = person['first_name']
-                last_name = person['last_name']
-                ID = person['ticket_id']
-                passengers[ID] = Passenger(first_name, last_name, ID)
-            except (
-                InvalidPassengerFirstName,
-                InvalidPassengerLastName,
-                InvalidPassengerTicketID
-            ):
-                continue
-    except KeyError:
-        raise InvalidKeyInPassengersFile
+        for passenger in iter_passengers_from_csv(file_handle):
+            passengers[passenger.ticket_id()] = passenger
     except csv.Error:
         return None
     return passengers
+
+
+def write_passengers_to_csv(file_handle, passengers):
+    """
+    Writes objects of class Passenger from given iterable into csv file
+    under the header read by iter_passengers_from_csv - rows are
+    generated while being written.
+    """
+    write_csv(file_handle, PASSENGERS_FILE_HEADER, (
+        (
+            passenger.first_name(),
+            passenger.last_name(),
+            passenger.ticket_id()
+        )
+        for passenger in passengers
+    ))
@@ -1,10 +1,23 @@
 from flight import Flight
+from seat_occupancy import SeatOccupancy
+from rejections import (
+    INVALID_PLANE_NUMBER,
+    INVALID_SEATS_NUMBER,
+    INVALID_CARRIER
+)
 from errors import (
     InvalidNumberOfSeats,
-    InvalidCarrierName
+    InvalidCarrierName,
+    InvalidSeatClass,
+    PassengerAlreadyAskedForHelpError,
+    AllAssistantsAreBusyError,
+    ChosenPassengerHasNotAskedForHelp
 )
 
 
+ASSISTANTS_NUMBER = 3
+
+
 class Plane(Flight):
     """
     Class Plane. Contains attributes:
@@ -20,15 +33,15 @@ class Plane(Flight):
     :param carrier: represents plane's carrier name
     :type carrier: str
 
-    :param economic_seats_occupancy: dictionary representing occupancy in
-    economy class seats
-    :type economic_seats_occupancy: str
-    Value must be either 'free' or 'occupied'
+    :param economic_seats_occupancy: bitmap representing occupancy in
+    economy class seats, can be read as a dictionary which values are
+    either 'FREE' or 'OCCUPIED'
+    :type economic_seats_occupancy: SeatOccupancy
 
-    :param business_seats_occupancy: dictionary representing occupancy in
-    business class seats
-    :type business_seats_occupancy: str
-    Value must be either 'FREE' or 'OCCUPIED'
+    :param business_seats_occupancy: bitmap representing occupancy in
+    business class seats, can be read as a dictionary which values are
+    either 'FREE' or 'OCCUPIED'
+    :type business_seats_occupancy: SeatOccupancy
 
     :param bussy_assistants: set representing passenger's ticket id that
     require help - length of the set represents the number of assistnats
@@ -36,6 +49,15 @@ class Plane(Flight):
     Maximum number of passengers that can be helped at once is 3
     :type bussy_assistants: set
     """
+    __slots__ = (
+        '_economic_seats_number',
+        '_business_seats_number',
+        '_carrier',
+        '_economic_seats_occupancy',
+        '_business_seats_occupancy',
+        '_busy_assistants'
+    )
+
     def __init__(
         self,
         plane_number,
@@ -53,21 +75,79 @@ class Plane(Flight):
             self._business_seats_number = int(business_seats_num)
         if self._if_carrier(carrier):
             self._carrier = carrier.upper()
-        self._economic_seats_occupancy = {
-            id: 'FREE'
-            for id in range(1, economic_seats_num + 1)
-            }
-        self._business_seats_occupancy = {
-            id: 'FREE'
-            for id in range(1, business_seats_num + 1)
-            }
+        self._economic_seats_occupancy = SeatOccupancy(
+            self._economic_seats_number
+        )
+        self._business_seats_occupancy = SeatOccupancy(
+            self._business_seats_number
+        )
         self._busy_assistants = set()
 
+    @staticmethod
+    def _is_carrier(carrier):
+        """
+        Checks whether the carrier is a not empty str that can be made
+        uppercase.
+        """
+        return bool(carrier) and bool(carrier.upper())
+
+    @staticmethod
+    def rejection_reason(
+        plane_number,
+        economic_seats_num,
+        business_seats_num,
+        carrier
+    ):
+        """
+        Returns the reason why Plane cannot be created of given data or
+        None if it can - does not raise exceptions.
+        """
+        if not Plane._is_positive_int(plane_number):
+            return INVALID_PLANE_NUMBER
+        if not Plane._is_positive_int(economic_seats_num):
+            return INVALID_SEATS_NUMBER
+        if not Plane._is_positive_int(business_seats_num):
+            return INVALID_SEATS_NUMBER
+        if not Plane._is_carrier(carrier):
+            return INVALID_CARRIER
+        return None
+
+    @classmethod
+    def from_checked(
+        cls,
+        plane_number,
+        economic_seats_num,
+        business_seats_num,
+        carrier,
+        economic_seats_occupancy=None,
+        business_seats_occupancy=None,
+        busy_assistants=()
+    ):
+        """
+        Creates instance of Plane of data for which rejection_reason()
+        returned None, without checking it again.
+        Seat occupancies and busy assistants of a stored plane can be given,
+        otherwise all seats are free and no assistant is busy.
+        """
+        if economic_seats_occupancy is None:
+            economic_seats_occupancy = SeatOccupancy(economic_seats_num)
+        if business_seats_occupancy is None:
+            business_seats_occupancy = SeatOccupancy(business_seats_num)
+        plane = cls.__new__(cls)
+        plane._plane_number = plane_number
+        plane._economic_seats_number = economic_seats_num
+        plane._business_seats_number = business_seats_num
+        plane._carrier = carrier.upper()
+        plane._economic_seats_occupancy = economic_seats_occupancy
+        plane._business_seats_occupancy = business_seats_occupancy
+        plane._busy_assistants = set(busy_assistants)
+        return plane
+
     def _if_economic_seats_number(self, seats_num):
         """
         Checks whether the number of economic class seats is a positive int.
         """
-        if not int(seats_num) > 0 or int(seats_num) != seats_num:
+        if not self._is_positive_int(seats_num):
             raise InvalidNumberOfSeats
         return True
 
@@ -75,7 +155,7 @@ class Plane(Flight):
         """
         Checks whether the number of business class seats is a positive int.
         """
-        if not int(seats_num) > 0 or int(seats_num) != seats_num:
+        if not self._is_positive_int(seats_num):
             raise InvalidNumberOfSeats
         return True
 
@@ -84,7 +164,7 @@ class Plane(Flight):
         Checks whether the carrier is not an empty str.
         Checks also whether the carrier str can be made uppercase.
         """
-        if not carrier or not carrier.upper():
+        if not self._is_carrier(carrier):
             raise InvalidCarrierName
         return True
 
@@ -120,18 +200,48 @@ class Plane(Flight):
 
     def economic_seats_occupancy(self):
         """
-        Returns dictionary representing occupancy in economy class seats.
+        Returns occupancy of economy class seats.
         """
         return self._economic_seats_occupancy
 
     def business_seats_occupancy(self):
         """
-        Returns dictionary representing occupancy in business class seats.
+        Returns occupancy of business class seats.
         """
         return self._business_seats_occupancy
 
+    def seats_occupancy(self, seat_class):
+        """
+        Returns occupancy of the seats of given class - seat_class has to be
+        either 'business' or 'economic'.
+        """
+        if seat_class == 'business':
+            return self._business_seats_occupancy
+        if seat_class == 'economic':
+            return self._economic_seats_occupancy
+        raise InvalidSeatClass
+
     def busy_assistnats(self):
         """
         Returns the set of tickets id of the passengers' that require help.
         """
         return self._busy_assistants
+
+    def ask_for_assistance(self, ticket_id):
+        """
+        Makes one of the free assistants help the passenger with given
+        ticket id.
+        """
+        if ticket_id in self._busy_assistants:
+            raise PassengerAlreadyAskedForHelpError
+        if len(self._busy_assistants) >= ASSISTANTS_NUMBER:
+            raise AllAssistantsAreBusyError
+        self._busy_assistants.add(ticket_id)
+
+    def thank_for_assistance(self, ticket_id):
+        """
+        Frees the assistant helping the passenger with given ticket id.
+        """
+        if ticket_id not in self._busy_assistants:
+            raise ChosenPassengerHasNotAskedForHelp
+        self._busy_assistants.remove(ticket_id)
@@ -1,42 +1,93 @@
 from plane import Plane
+from csv_io import read_header, parse_int, write_csv
+from rejections import MALFORMED_ROW
 import csv
-from errors import (
-    InvalidPlaneNumber,
-    InvalidNumberOfSeats,
-    InvalidCarrierName,
-    InvalidKeyInPlanesFile
+from errors import InvalidKeyInPlanesFile
+
+
+PLANES_FILE_HEADER = (
+    'plane_number',
+    'economic_seats_number',
+    'business_seats_number',
+    'carrier'
 )
 
 
+def iter_plane_rows_from_csv(file_handle, rejections=None):
+    """
+    Yields (line number, row, object of class Plane) tuples read from csv
+    file one at a time - line number is the one the row ends at.
+    The header is validated once, rows are parsed positionally.
+    Omits invalid data rows - if rejections is given, every omitted row
+    is passed to its reject() method with the reason, line number and row.
+    Raises csv.Error if the file is malformed.
+    """
+    reader = csv.reader(file_handle)
+    try:
+        columns = read_header(reader, PLANES_FILE_HEADER)
+    except KeyError:
+        raise InvalidKeyInPlanesFile
+    if columns is None:
+        return
+    plane_index, economic_index, business_index, carrier_index = columns
+    row_length = max(columns) + 1
+    for row in reader:
+        if not row:
+            continue
+        if len(row) < row_length:
+            reason = MALFORMED_ROW
+        else:
+            data = (
+                parse_int(row[plane_index]),
+                parse_int(row[economic_index]),
+                parse_int(row[business_index]),
+                row[carrier_index]
+            )
+            reason = Plane.rejection_reason(*data)
+            if reason is None:
+                yield reader.line_num, row, Plane.from_checked(*data)
+                continue
+        if rejections is not None:
+            rejections.reject(reason, reader.line_num, row)
+
+
+def iter_planes_from_csv(file_handle, rejections=None):
+    """
+    Yields objects of class Plane read from csv file one at a time.
+    Omits invalid data rows - if rejections is given, every omitted row
+    is passed to its reject() method.
+    Raises csv.Error if the file is malformed.
+    """
+    for _, _, plane in iter_plane_rows_from_csv(file_handle, rejections):
+        yield plane
+
+
 def read_planes_from_csv(file_handle):
     """
     Reads data describing objects of class Plane from csv file.
     Omits invalid data rows
     """
     planes = {}
-    reader = csv.DictReader(file_handle)
     try:
-        for plane in reader:
-            try:
-                plane_number = int(plane['plane_number'])
-                economic_seats_num = int(plane['economic_seats_number'])
-                business_seats_num = int(plane['business_seats_number'])
-                carrier = plane['carrier']
-                planes[plane_number] = Plane(
-                    plane_number,
-                    economic_seats_num,
-                    business_seats_num,
-                    carrier
-                )
-            except (
-                InvalidPlaneNumber,
-                InvalidNumberOfSeats,
-                InvalidCarrierName,
-                ValueError
-            ):
-                continue
-    except KeyError:
-        raise InvalidKeyInPlanesFile
+        for plane in iter_planes_from_csv(file_handle):
+            planes[plane.plane_number()] = plane
     except csv.Error:
         return None
     return planes
+
+
+def write_planes_to_csv(file_handle, planes):
+    """
+    Writes objects of class Plane from given iterable into csv file
+    under the header read by iter_planes_from_csv - rows are
+    generated while being written.
+    """
+    write_csv(file_handle, PLANES_FILE_HEADER, (
+        (
+            plane.plane_number(),
+            plane.economic_seats_number(),
+            plane.business_seats_number(),
+            plane.carrier()
+        )
+        for plane in planes
+    ))
@@ -0,0 +1,143 @@
+import asyncio
+import json
+import os
+import socket
+from errors import MalformedResponseError
+
+
+MALFORMED_REQUEST = 'malformed request'
+
+
+def parse_request(line):
+    """
+    Returns arguments sent in the request line or None if the line is not
+    a JSON list of strings.
+    """
+    try:
+        arguments = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(arguments, list):
+        return None
+    if not all(isinstance(argument, str) for argument in arguments):
+        return None
+    return arguments
+
+
+class QueryServer:
+    """
+    Class QueryServer - asyncio server answering queries over Unix socket.
+    Every request is a line holding JSON list of arguments of a single
+    operation, every response is a line holding JSON object with either
+    'output' or 'error'. A connection may send any number of requests.
+    Contains attributes:
+    :param socket_path: path of the Unix socket
+    :type socket_path: str
+
+    :param answer: function returning the output of the operation for
+    given list of arguments
+    :type answer: function
+
+    :param server: running asyncio server or None
+    :type server: asyncio.Server
+    """
+    def __init__(self, socket_path, answer):
+        """
+        Creates instance of QueryServer - it is not listening until started.
+        """
+        self._socket_path = str(socket_path)
+        self._answer = answer
+        self._server = None
+
+    def socket_path(self):
+        """
+        Returns path of the Unix socket.
+        """
+        return self._socket_path
+
+    async def _handle(self, reader, writer):
+        """
+        Answers requests sent by the client until it disconnects.
+        """
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                arguments = parse_request(line)
+                if arguments is None:
+                    response = {'error': MALFORMED_REQUEST}
+                else:
+                    response = {'output': self._answer(arguments)}
+                writer.write(json.dumps(response).encode() + b'\n')
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    def _remove_stale_socket(self):
+        """
+        Removes socket file left by server which is no longer running.
+        """
+        if not os.path.exists(self._socket_path):
+            return
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self._socket_path)
+        except ConnectionRefusedError:
+            os.remove(self._socket_path)
+        finally:
+            probe.close()
+
+    async def start(self):
+        """
+        Starts listening on the socket.
+        """
+        self._remove_stale_socket()
+        self._server = await asyncio.start_unix_server(
+            self._handle, self._socket_path
+        )
+
+    async def serve_forever(self):
+        """
+        Starts listening on the socket and answers queries until cancelled.
+        """
+        if self._server is None:
+            await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self):
+        """
+        Stops listening and removes the socket file.
+        """
+        if self._server is None:
+            return
+        self._server.close()
+        await self._server.wait_closed()
+        self._server = None
+        if os.path.exists(self._socket_path):
+            os.remove(self._socket_path)
+
+
+def ask_server(socket_path, arguments, timeout=5.0):
+    """
+    Returns the output of the operation answered by the server.
+    Raises OSError if no server is listening on the socket and
+    MalformedResponseError if the server does not answer properly.
+    """
+    request = json.dumps(list(arguments)).encode() + b'\n'
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.settimeout(timeout)
+        connection.connect(str(socket_path))
+        connection.sendall(request)
+        with connection.makefile('rb') as file_handle:
+            line = file_handle.readline()
+    try:
+        response = json.loads(line)
+        return response['output']
+    except (ValueError, TypeError, KeyError):
+        raise MalformedResponseError(socket_path)
@@ -0,0 +1,418 @@
+from flight import Flight
+from passenger import Passenger
+from plane import Plane
+from seat_occupancy import SeatOccupancy
+from ticket import Ticket
+from snapshot import source_stamps
+from atomic_file import atomic_open
+from collections.abc import Mapping
+import mmap
+import struct
+from errors import MalformedFileError, StaleIndexError
+from database import translated_read_errors
+
+
+INDEX_MAGIC = b'PIPRIDX\0'
+INDEX_VERSION = 1
+
+SECTIONS = ('flights', 'planes', 'tickets', 'passengers')
+
+_HEADER = struct.Struct('<8sH')
+_COUNT = struct.Struct('<Q')
+_SOURCE = struct.Struct('<qq')
+_LENGTH = struct.Struct('<I')
+_DIRECTORY_ENTRY = struct.Struct('<QQ')
+_INT_SLOT = struct.Struct('<qQ')
+_STR_SLOT = struct.Struct('<Q')
+_PLANE = struct.Struct('<qqI')
+_TICKET = struct.Struct('<qBqq')
+
+
+def _pack_str(value):
+    """
+    Returns value encoded as length-prefixed utf-8.
+    """
+    encoded = value.encode('utf-8')
+    return _LENGTH.pack(len(encoded)) + encoded
+
+
+def _unpack_str(buffer, offset):
+    """
+    Returns length-prefixed utf-8 bytes stored at offset and the offset
+    following them.
+    """
+    length, = _LENGTH.unpack_from(buffer, offset)
+    offset += _LENGTH.size
+    return buffer[offset:offset + length], offset + length
+
+
+def _pack_plane(plane):
+    """
+    Returns the record describing plane.
+    """
+    assistants = sorted(plane.busy_assistnats())
+    record = _PLANE.pack(
+        plane.economic_seats_number(),
+        plane.business_seats_number(),
+        len(assistants)
+    )
+    record += _pack_str(plane.carrier())
+    record += plane.economic_seats_occupancy().bitmap()
+    record += plane.business_seats_occupancy().bitmap()
+    record += b''.join(_pack_str(ticket_id) for ticket_id in assistants)
+    return record
+
+
+def _pack_ticket(ticket):
+    """
+    Returns the record describing ticket - starts with its key.
+    """
+    return _pack_str(ticket.ticket_id()) + _TICKET.pack(
+        ticket.plane_number(),
+        ticket.seat_class() == 'business',
+        ticket.seat_number(),
+        ticket.gate_number()
+    )
+
+
+def _pack_passenger(person):
+    """
+    Returns the record describing passenger - starts with its key.
+    """
+    record = _pack_str(person.ticket_id())
+    record += _pack_str(person.first_name())
+    record += _pack_str(person.last_name())
+    return record
+
+
+def write_index(file_handle, database, sources=()):
+    """
+    Writes the index of the database into seekable binary file handle.
+    Every section consists of records followed by a table of fixed size
+    slots sorted by key, which allows binary search over the slots.
+    Flights and planes are keyed by plane number, tickets and passengers
+    by ticket id.
+    """
+    file_handle.write(_HEADER.pack(INDEX_MAGIC, INDEX_VERSION))
+    stamps = source_stamps(sources)
+    file_handle.write(_COUNT.pack(len(stamps)))
+    for path, modification_time, size in stamps:
+        file_handle.write(_pack_str(path))
+        file_handle.write(_SOURCE.pack(modification_time, size))
+
+    directory_offset = file_handle.tell()
+    file_handle.write(b'\0' * _DIRECTORY_ENTRY.size * len(SECTIONS))
+    directory = []
+
+    slots = [
+        _INT_SLOT.pack(plane_number, 0)
+        for plane_number in sorted(database.flights())
+    ]
+    directory.append((len(slots), file_handle.tell()))
+    file_handle.write(b''.join(slots))
+
+    slots = []
+    for plane_number in sorted(database.planes()):
+        slots.append(_INT_SLOT.pack(plane_number, file_handle.tell()))
+        file_handle.write(_pack_plane(database.planes()[plane_number]))
+    directory.append((len(slots), file_handle.tell()))
+    file_handle.write(b''.join(slots))
+
+    for collection, pack in (
+        (database.tickets(), _pack_ticket),
+        (database.passengers(), _pack_passenger)
+    ):
+        slots = []
+        for key in sorted(collection, key=lambda key: key.encode('utf-8')):
+            slots.append(_STR_SLOT.pack(file_handle.tell()))
+            file_handle.write(pack(collection[key]))
+        directory.append((len(slots), file_handle.tell()))
+        file_handle.write(b''.join(slots))
+
+    file_handle.seek(directory_offset)
+    for count, slots_offset in directory:
+        file_handle.write(_DIRECTORY_ENTRY.pack(count, slots_offset))
+    file_handle.seek(0, 2)
+
+
+def build_index(database, path, sources=()):
+    """
+    Writes the index of the database into the file at given path.
+    """
+    with atomic_open(path, 'wb') as file_handle:
+        write_index(file_handle, database, sources)
+
+
+class _MappedSection(Mapping):
+    """
+    Read-only dictionary-like view of one section of the index.
+    Looking up a key touches only the pages of the slots visited by binary
+    search and the page of the found record.
+    """
+    def __init__(self, buffer, count, slots_offset, decode):
+        self._buffer = buffer
+        self._count = count
+        self._slots_offset = slots_offset
+        self._decode = decode
+
+    def _find(self, key):
+        """
+        Returns the offset of the record with given key or None.
+        """
+        raise NotImplementedError
+
+    def __getitem__(self, key):
+        offset = self._find(key)
+        if offset is None:
+            raise KeyError(key)
+        return self._decode(self._buffer, key, offset)
+
+    def __contains__(self, key):
+        return self._find(key) is not None
+
+    def __len__(self):
+        return self._count
+
+
+class _IntKeySection(_MappedSection):
+    """
+    Section keyed by plane number.
+    """
+    def _find(self, key):
+        if type(key) is not int:
+            return None
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            slot_key, offset = _INT_SLOT.unpack_from(
+                self._buffer,
+                self._slots_offset + middle * _INT_SLOT.size
+            )
+            if slot_key == key:
+                return offset
+            if slot_key < key:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield _INT_SLOT.unpack_from(
+                self._buffer,
+                self._slots_offset + index * _INT_SLOT.size
+            )[0]
+
+
+class _StrKeySection(_MappedSection):
+    """
+    Section keyed by ticket id - the key is stored at the beginning
+    of every record.
+    """
+    def _slot_offset(self, index):
+        return _STR_SLOT.unpack_from(
+            self._buffer,
+            self._slots_offset + index * _STR_SLOT.size
+        )[0]
+
+    def _find(self, key):
+        if not isinstance(key, str):
+            return None
+        encoded = key.encode('utf-8')
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            offset = self._slot_offset(middle)
+            slot_key, record_offset = _unpack_str(self._buffer, offset)
+            if slot_key == encoded:
+                return record_offset
+            if slot_key < encoded:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+    def __iter__(self):
+        for index in range(self._count):
+            slot_key, _ = _unpack_str(self._buffer, self._slot_offset(index))
+            yield slot_key.decode('utf-8')
+
+
+def _decode_flight(buffer, plane_number, offset):
+    return Flight.from_checked(plane_number)
+
+
+def _decode_plane(buffer, plane_number, offset):
+    economic, business, assistants_number = _PLANE.unpack_from(
+        buffer,
+        offset
+    )
+    carrier, offset = _unpack_str(buffer, offset + _PLANE.size)
+    occupancies = []
+    for seats_number in (economic, business):
+        size = (seats_number + 7) // 8
+        occupancies.append(SeatOccupancy.from_bitmap(
+            seats_number,
+            buffer[offset:offset + size]
+        ))
+        offset += size
+    assistants = set()
+    for _ in range(assistants_number):
+        ticket_id, offset = _unpack_str(buffer, offset)
+        assistants.add(ticket_id.decode('utf-8'))
+    return Plane.from_checked(
+        plane_number,
+        economic,
+        business,
+        carrier.decode('utf-8'),
+        occupancies[0],
+        occupancies[1],
+        assistants
+    )
+
+
+def _decode_ticket(buffer, ticket_id, offset):
+    plane_number, business, seat_number, gate_number = _TICKET.unpack_from(
+        buffer,
+        offset
+    )
+    return Ticket.from_checked(
+        ticket_id,
+        plane_number,
+        'business' if business else 'economic',
+        seat_number,
+        gate_number
+    )
+
+
+def _decode_passenger(buffer, ticket_id, offset):
+    first_name, offset = _unpack_str(buffer, offset)
+    last_name, offset = _unpack_str(buffer, offset)
+    return Passenger.from_checked(
+        first_name.decode('utf-8'),
+        last_name.decode('utf-8'),
+        ticket_id
+    )
+
+
+class ReadOnlyDatabase:
+    """
+    Class ReadOnlyDatabase - answers lookups from memory-mapped index file
+    built with build_index(). Offers the same collections as Database.
+    Contains attributes:
+    :param file_handle: opened index file
+    :type file_handle: file object
+
+    :param buffer: memory map of the index file
+    :type buffer: mmap.mmap
+
+    :param sections: dictionary-like views of flights, planes, tickets
+    and passengers
+    :type sections: dict
+    """
+    def __init__(self, path, sources=None):
+        """
+        Creates instance of ReadOnlyDatabase.
+        If sources are given, raises StaleIndexError when they are not
+        the files the index was built of or any of them has changed since.
+        """
+        with translated_read_errors(path):
+            self._file_handle = open(path, 'rb')
+        try:
+            self._buffer = mmap.mmap(
+                self._file_handle.fileno(),
+                0,
+                access=mmap.ACCESS_READ
+            )
+        except ValueError:
+            self._file_handle.close()
+            raise MalformedFileError
+        try:
+            self._sections = self._read_header(sources)
+        except (MalformedFileError, StaleIndexError):
+            self.close()
+            raise
+        except struct.error:
+            self.close()
+            raise MalformedFileError
+
+    def _read_header(self, sources):
+        """
+        Validates the header of the index and returns its sections.
+        """
+        magic, version = _HEADER.unpack_from(self._buffer, 0)
+        if magic != INDEX_MAGIC or version != INDEX_VERSION:
+            raise MalformedFileError
+        offset = _HEADER.size
+        stamps_number, = _COUNT.unpack_from(self._buffer, offset)
+        offset += _COUNT.size
+        stamps = []
+        for _ in range(stamps_number):
+            path, offset = _unpack_str(self._buffer, offset)
+            path = path.decode('utf-8')
+            stamps.append((path, *_SOURCE.unpack_from(self._buffer, offset)))
+            offset += _SOURCE.size
+        if sources is not None:
+            try:
+                if stamps != source_stamps(sources):
+                    raise StaleIndexError
+            except OSError:
+                raise StaleIndexError
+
+        section_types = (
+            (_IntKeySection, _decode_flight),
+            (_IntKeySection, _decode_plane),
+            (_StrKeySection, _decode_ticket),
+            (_StrKeySection, _decode_passenger)
+        )
+        sections = {}
+        for name, (section_type, decode) in zip(SECTIONS, section_types):
+            count, slots_offset = _DIRECTORY_ENTRY.unpack_from(
+                self._buffer,
+                offset
+            )
+            offset += _DIRECTORY_ENTRY.size
+            sections[name] = section_type(
+                self._buffer,
+                count,
+                slots_offset,
+                decode
+            )
+        return sections
+
+    def flights(self):
+        """
+        Returns read-only dictionary of flights.
+        """
+        return self._sections['flights']
+
+    def planes(self):
+        """
+        Returns read-only dictionary of planes.
+        """
+        return self._sections['planes']
+
+    def tickets(self):
+        """
+        Returns read-only dictionary of tickets.
+        """
+        return self._sections['tickets']
+
+    def passengers(self):
+        """
+        Returns read-only dictionary of passengers.
+        """
+        return self._sections['passengers']
+
+    def close(self):
+        """
+        Closes the memory map and the index file.
+        """
+        self._buffer.close()
+        self._file_handle.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.close()
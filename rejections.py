@@ -0,0 +1,41 @@
+from collections import Counter
+
+
+MALFORMED_ROW = 'malformed row'
+INVALID_PLANE_NUMBER = 'invalid plane number'
+INVALID_SEATS_NUMBER = 'invalid number of seats'
+INVALID_CARRIER = 'invalid carrier name'
+INVALID_TICKET_ID = 'invalid ticket id'
+INVALID_SEAT_CLASS = 'invalid seat class'
+INVALID_SEAT_NUMBER = 'invalid seat number'
+INVALID_GATE_NUMBER = 'invalid gate number'
+INVALID_FIRST_NAME = 'invalid first name'
+INVALID_LAST_NAME = 'invalid last name'
+DUPLICATE_KEY = 'already existing key'
+UNKNOWN_FLIGHT = 'lacking flight'
+UNKNOWN_TICKET = 'lacking ticket'
+OCCUPIED_SEAT = 'seat occupied'
+NO_FREE_SEAT = 'no free seat'
+
+
+class RejectionCounts(Counter):
+    """
+    Class RejectionCounts - dictionary mapping the reason of rejecting
+    a data row to the number of rows rejected for it.
+    Missing reasons count as 0, total() returns the number of all rejected
+    rows.
+    """
+    def reject(self, reason, line_number=None, row=None):
+        """
+        Counts the row rejected for given reason - the same method as
+        ImportReport has, so both can be passed to the csv readers.
+        """
+        self[reason] += 1
+
+    def __str__(self):
+        """
+        Returns the counts as 'reason: count' pairs.
+        """
+        return ', '.join(
+            f'{reason}: {count}' for reason, count in self.items() if count
+        )
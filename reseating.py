@@ -0,0 +1,73 @@
+from ticket import Ticket
+
+
+def _reseat_cabin(tickets, occupancy, plane_number, plan):
+    """
+    Seats the tickets of one class in the cabin of the new plane.
+    Tickets keep their seat numbers if the seats exist and are free, the
+    remaining ones get the lowest free seats in the order of their old
+    seat numbers. Appends the tickets to the kept, moved and unseated
+    lists of the plan.
+    """
+    kept, moved, unseated = plan
+    seats_number = occupancy.seats_number()
+    taken = bytearray(seats_number + 1)
+    taken[0] = 1
+    occupied = occupancy.occupied_mask()
+    while occupied:
+        lowest = occupied & -occupied
+        taken[lowest.bit_length()] = 1
+        occupied ^= lowest
+    moving = []
+    for ticket in tickets:
+        seat_num = ticket.seat_number()
+        if seat_num <= seats_number and not taken[seat_num]:
+            taken[seat_num] = 1
+            if ticket.plane_number() == plane_number:
+                kept.append(ticket)
+            else:
+                moved.append(Ticket.from_checked(
+                    ticket.ticket_id(),
+                    plane_number,
+                    ticket.seat_class(),
+                    seat_num,
+                    ticket.gate_number()
+                ))
+        else:
+            moving.append(ticket)
+    moving.sort(key=lambda ticket: ticket.seat_number())
+    free_seat = 0
+    for index, ticket in enumerate(moving):
+        free_seat = taken.find(0, free_seat + 1)
+        if free_seat == -1:
+            unseated.extend(moving[index:])
+            break
+        moved.append(Ticket.from_checked(
+            ticket.ticket_id(),
+            plane_number,
+            ticket.seat_class(),
+            free_seat,
+            ticket.gate_number()
+        ))
+
+
+def plan_reseating(tickets, new_plane):
+    """
+    Computes seats of given tickets on the new plane - keeps as many seat
+    numbers as possible and never changes the seat class. Seats already
+    occupied on the new plane are not given to any ticket.
+    Returns tuple of lists: kept tickets, tickets with new seats and
+    tickets for which there is no free seat of their class.
+    """
+    cabins = {'business': [], 'economic': []}
+    for ticket in tickets:
+        cabins[ticket.seat_class()].append(ticket)
+    plan = ([], [], [])
+    for seat_class, cabin_tickets in cabins.items():
+        _reseat_cabin(
+            cabin_tickets,
+            new_plane.seats_occupancy(seat_class),
+            new_plane.plane_number(),
+            plan
+        )
+    return plan
@@ -0,0 +1,176 @@
+from collections.abc import Mapping
+from heapq import heappop, heappush
+
+
+class SeatOccupancy(Mapping):
+    """
+    Class SeatOccupancy - compact occupancy store of one cabin of a plane.
+    Every seat is represented by a single bit - set bit means that the seat
+    is occupied.
+    Behaves like a dictionary mapping seat number to 'FREE' or 'OCCUPIED'.
+    Contains attributes:
+    :param seats_number: number of seats in the cabin
+    :type seats_number: int
+
+    :param bitmap: bits representing occupancy of the seats, seat number n
+    is represented by the bit n - 1
+    :type bitmap: bytearray
+
+    :param free_seats: min-heap of free seat numbers, built on the first
+    search for a free seat, entries of seats booked later are removed lazily
+    :type free_seats: list
+    """
+    def __init__(self, seats_number):
+        """
+        Creates instance of SeatOccupancy with all seats free.
+        """
+        self._seats_number = int(seats_number)
+        self._bitmap = bytearray((self._seats_number + 7) // 8)
+        self._free_seats = None
+
+    @classmethod
+    def from_bitmap(cls, seats_number, bitmap):
+        """
+        Creates instance of SeatOccupancy from bytes returned by bitmap().
+        """
+        occupancy = cls(seats_number)
+        if len(bitmap) != len(occupancy._bitmap):
+            raise ValueError('Bitmap does not match the number of seats.')
+        occupancy._bitmap[:] = bitmap
+        return occupancy
+
+    def _if_seat(self, seat_number):
+        """
+        Checks whether the seat_number belongs to the cabin.
+        """
+        return (
+            type(seat_number) is int and
+            0 < seat_number <= self._seats_number
+        )
+
+    def seats_number(self):
+        """
+        Returns the number of seats in the cabin.
+        """
+        return self._seats_number
+
+    def bitmap(self):
+        """
+        Returns bytes representing occupancy of the seats.
+        """
+        return bytes(self._bitmap)
+
+    def is_free(self, seat_number):
+        """
+        Returns True if the seat is free, otherwise returns False.
+        """
+        bit = seat_number - 1
+        return not self._bitmap[bit >> 3] & (1 << (bit & 7))
+
+    def book(self, seat_number):
+        """
+        Marks the seat as occupied.
+        """
+        bit = seat_number - 1
+        self._bitmap[bit >> 3] |= 1 << (bit & 7)
+
+    def release(self, seat_number):
+        """
+        Marks the seat as free.
+        """
+        bit = seat_number - 1
+        mask = 1 << (bit & 7)
+        if self._free_seats is not None and self._bitmap[bit >> 3] & mask:
+            heappush(self._free_seats, seat_number)
+        self._bitmap[bit >> 3] &= ~mask & 0xFF
+
+    def first_free_seat(self):
+        """
+        Returns the lowest free seat number or None if all seats are occupied.
+        """
+        if self._free_seats is None:
+            self._free_seats = [
+                seat for seat in self if self.is_free(seat)
+            ]
+        free_seats = self._free_seats
+        while free_seats and not self.is_free(free_seats[0]):
+            heappop(free_seats)
+        if free_seats:
+            return free_seats[0]
+        return None
+
+    def occupied_mask(self):
+        """
+        Returns the bitmap as a single int - bit n - 1 is set if the seat
+        number n is occupied.
+        """
+        return int.from_bytes(self._bitmap, 'little')
+
+    def book_mask(self, mask):
+        """
+        Marks as occupied every seat which bit is set in the mask.
+        """
+        if mask >> self._seats_number:
+            raise ValueError('Mask does not match the number of seats.')
+        occupied = self.occupied_mask() | mask
+        self._bitmap[:] = occupied.to_bytes(len(self._bitmap), 'little')
+
+    def release_mask(self, mask):
+        """
+        Marks as free every seat which bit is set in the mask.
+        """
+        if mask >> self._seats_number:
+            raise ValueError('Mask does not match the number of seats.')
+        occupied = self.occupied_mask()
+        released = occupied & mask
+        self._bitmap[:] = (occupied & ~mask).to_bytes(
+            len(self._bitmap),
+            'little'
+        )
+        while self._free_seats is not None and released:
+            lowest = released & -released
+            heappush(self._free_seats, lowest.bit_length())
+            released ^= lowest
+
+    def occupied_seats_number(self):
+        """
+        Returns the number of occupied seats - population count of the bitmap.
+        """
+        return self.occupied_mask().bit_count()
+
+    def free_seats_number(self):
+        """
+        Returns the number of free seats.
+        """
+        return self._seats_number - self.occupied_seats_number()
+
+    def __getitem__(self, seat_number):
+        """
+        Returns 'FREE' or 'OCCUPIED' for the given seat number.
+        """
+        if not self._if_seat(seat_number):
+            raise KeyError(seat_number)
+        return 'FREE' if self.is_free(seat_number) else 'OCCUPIED'
+
+    def __setitem__(self, seat_number, value):
+        """
+        Sets occupancy of the given seat - value must be either 'FREE'
+        or 'OCCUPIED'.
+        """
+        if not self._if_seat(seat_number):
+            raise KeyError(seat_number)
+        if value == 'OCCUPIED':
+            self.book(seat_number)
+        elif value == 'FREE':
+            self.release(seat_number)
+        else:
+            raise ValueError(value)
+
+    def __contains__(self, seat_number):
+        return self._if_seat(seat_number)
+
+    def __iter__(self):
+        return iter(range(1, self._seats_number + 1))
+
+    def __len__(self):
+        return self._seats_number
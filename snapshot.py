@@ -0,0 +1,292 @@
+from flight import Flight
+from passenger import Passenger
+from plane import Plane
+from seat_occupancy import SeatOccupancy
+from ticket import Ticket
+from array import array
+import os
+import struct
+import sys
+from errors import MalformedFileError, StaleSnapshotError
+
+
+SNAPSHOT_MAGIC = b'PIPRSNAP'
+SNAPSHOT_VERSION = 2
+
+_HEADER = struct.Struct('<8sH')
+_COUNT = struct.Struct('<Q')
+_SOURCE = struct.Struct('<qq')
+
+SEAT_CLASSES = ('economic', 'business')
+
+
+def source_stamps(sources):
+    """
+    Returns list of (path, modification time in ns, size) tuples describing
+    the current state of the source files.
+    """
+    stamps = []
+    for path in sources:
+        status = os.stat(path)
+        stamps.append((str(path), status.st_mtime_ns, status.st_size))
+    return stamps
+
+
+class _SnapshotWriter:
+    """
+    Writes columns of the snapshot into the binary file handle.
+    All numbers are stored as little-endian.
+    """
+    def __init__(self, file_handle):
+        self._file_handle = file_handle
+
+    def write_count(self, count):
+        self._file_handle.write(_COUNT.pack(count))
+
+    def write_bytes(self, data):
+        self.write_count(len(data))
+        self._file_handle.write(data)
+
+    def write_ints(self, values):
+        column = array('q', values)
+        if sys.byteorder == 'big':
+            column.byteswap()
+        self.write_bytes(column.tobytes())
+
+    def write_strings(self, values):
+        encoded = [value.encode('utf-8') for value in values]
+        self.write_ints(len(value) for value in encoded)
+        self.write_bytes(b''.join(encoded))
+
+
+class _SnapshotReader:
+    """
+    Reads columns of the snapshot from bytes.
+    Raises MalformedFileError if the data ends unexpectedly.
+    """
+    def __init__(self, data):
+        self._data = memoryview(data)
+        self._position = 0
+
+    def read_struct(self, layout):
+        if self._position + layout.size > len(self._data):
+            raise MalformedFileError
+        values = layout.unpack_from(self._data, self._position)
+        self._position += layout.size
+        return values
+
+    def read_count(self):
+        return self.read_struct(_COUNT)[0]
+
+    def read_bytes(self):
+        size = self.read_count()
+        if self._position + size > len(self._data):
+            raise MalformedFileError
+        data = self._data[self._position:self._position + size]
+        self._position += size
+        return data
+
+    def read_ints(self):
+        data = self.read_bytes()
+        if len(data) % 8:
+            raise MalformedFileError
+        column = array('q')
+        column.frombytes(data)
+        if sys.byteorder == 'big':
+            column.byteswap()
+        return column
+
+    def read_strings(self):
+        lengths = self.read_ints()
+        blob = bytes(self.read_bytes())
+        values = []
+        position = 0
+        for length in lengths:
+            values.append(blob[position:position + length].decode('utf-8'))
+            position += length
+        return values
+
+    def read_string(self):
+        return bytes(self.read_bytes()).decode('utf-8')
+
+
+def write_snapshot(file_handle, database, sources=()):
+    """
+    Writes the whole database into binary file handle.
+    Stamps of the source files are stored so that the snapshot can be
+    recognized as stale once any of them changes. Tickets which seats were
+    released are flagged, so that they are not restored as seat holders.
+    """
+    writer = _SnapshotWriter(file_handle)
+    file_handle.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION))
+
+    stamps = source_stamps(sources)
+    writer.write_count(len(stamps))
+    for path, modification_time, size in stamps:
+        writer.write_bytes(path.encode('utf-8'))
+        file_handle.write(_SOURCE.pack(modification_time, size))
+
+    writer.write_ints(database.flights())
+
+    planes = list(database.planes().values())
+    writer.write_ints(plane.plane_number() for plane in planes)
+    writer.write_ints(plane.economic_seats_number() for plane in planes)
+    writer.write_ints(plane.business_seats_number() for plane in planes)
+    writer.write_strings(plane.carrier() for plane in planes)
+    writer.write_bytes(b''.join(
+        plane.seats_occupancy(seat_class).bitmap()
+        for plane in planes
+        for seat_class in SEAT_CLASSES
+    ))
+    writer.write_ints(len(plane.busy_assistnats()) for plane in planes)
+    writer.write_strings(
+        ticket_id
+        for plane in planes
+        for ticket_id in sorted(plane.busy_assistnats())
+    )
+
+    tickets = list(database.tickets().values())
+    writer.write_strings(ticket.ticket_id() for ticket in tickets)
+    writer.write_ints(ticket.plane_number() for ticket in tickets)
+    writer.write_bytes(bytes(
+        ticket.seat_class() == 'business' for ticket in tickets
+    ))
+    writer.write_ints(ticket.seat_number() for ticket in tickets)
+    writer.write_ints(ticket.gate_number() for ticket in tickets)
+    writer.write_bytes(bytes(
+        not database.holds_seat(ticket.ticket_id()) for ticket in tickets
+    ))
+
+    passengers = list(database.passengers().values())
+    writer.write_strings(person.first_name() for person in passengers)
+    writer.write_strings(person.last_name() for person in passengers)
+    writer.write_strings(person.ticket_id() for person in passengers)
+
+
+def _read_planes(reader):
+    """
+    Reads planes columns and returns dictionary of restored planes.
+    """
+    numbers = reader.read_ints()
+    economic_numbers = reader.read_ints()
+    business_numbers = reader.read_ints()
+    carriers = reader.read_strings()
+    bitmaps = reader.read_bytes()
+    assistants_counts = reader.read_ints()
+    assistants = iter(reader.read_strings())
+
+    planes = {}
+    position = 0
+    for index, plane_number in enumerate(numbers):
+        occupancies = []
+        for seats_number in (
+            economic_numbers[index],
+            business_numbers[index]
+        ):
+            size = (seats_number + 7) // 8
+            if size < 0 or position + size > len(bitmaps):
+                raise MalformedFileError
+            occupancies.append(SeatOccupancy.from_bitmap(
+                seats_number,
+                bitmaps[position:position + size]
+            ))
+            position += size
+        planes[plane_number] = Plane.from_checked(
+            plane_number,
+            economic_numbers[index],
+            business_numbers[index],
+            carriers[index],
+            occupancies[0],
+            occupancies[1],
+            [next(assistants) for _ in range(assistants_counts[index])]
+        )
+    return planes
+
+
+def _read_tickets(reader):
+    """
+    Reads tickets columns and returns dictionary of restored tickets and
+    set of ids of the tickets which seats were released.
+    """
+    ids = reader.read_strings()
+    plane_numbers = reader.read_ints()
+    business_flags = reader.read_bytes()
+    seat_numbers = reader.read_ints()
+    gate_numbers = reader.read_ints()
+    released_flags = reader.read_bytes()
+    tickets = {}
+    released = set()
+    for index, ticket_id in enumerate(ids):
+        tickets[ticket_id] = Ticket.from_checked(
+            ticket_id,
+            plane_numbers[index],
+            'business' if business_flags[index] else 'economic',
+            seat_numbers[index],
+            gate_numbers[index]
+        )
+        if released_flags[index]:
+            released.add(ticket_id)
+    return tickets, released
+
+
+def _read_passengers(reader):
+    """
+    Reads passengers columns and returns dictionary of restored passengers.
+    """
+    first_names = reader.read_strings()
+    last_names = reader.read_strings()
+    ids = reader.read_strings()
+    passengers = {}
+    for index, ticket_id in enumerate(ids):
+        passengers[ticket_id] = Passenger.from_checked(
+            first_names[index],
+            last_names[index],
+            ticket_id
+        )
+    return passengers
+
+
+def _read_snapshot(data, sources):
+    """
+    Reads snapshot from bytes like read_snapshot() - columns that do not
+    match each other raise IndexError, StopIteration or ValueError.
+    """
+    reader = _SnapshotReader(data)
+    magic, version = reader.read_struct(_HEADER)
+    if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+        raise MalformedFileError
+
+    stamps = []
+    for _ in range(reader.read_count()):
+        path = reader.read_string()
+        stamps.append((path, *reader.read_struct(_SOURCE)))
+    if sources is not None:
+        try:
+            if stamps != source_stamps(sources):
+                raise StaleSnapshotError
+        except OSError:
+            raise StaleSnapshotError
+
+    flights = {
+        plane_number: Flight.from_checked(plane_number)
+        for plane_number in reader.read_ints()
+    }
+    planes = _read_planes(reader)
+    tickets, released = _read_tickets(reader)
+    passengers = _read_passengers(reader)
+    return flights, planes, tickets, passengers, released
+
+
+def read_snapshot(data, sources=None):
+    """
+    Reads snapshot from bytes and returns tuple of dictionaries of
+    flights, planes, tickets and passengers and set of ids of the tickets
+    which seats were released.
+    If sources are given, raises StaleSnapshotError when they are not
+    the files the snapshot was made of or any of them has changed since.
+    Raises MalformedFileError if the data is not a valid snapshot.
+    """
+    try:
+        return _read_snapshot(data, sources)
+    except (IndexError, StopIteration, ValueError):
+        raise MalformedFileError
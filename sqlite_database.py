@@ -0,0 +1,1208 @@
+from flight import Flight
+from passenger import Passenger
+from plane import Plane, ASSISTANTS_NUMBER
+from seat_occupancy import SeatOccupancy
+from ticket import Ticket
+from name_index import normalize_name, edit_distance
+from flight_io import FLIGHTS_FILE_HEADER
+from plane_io import PLANES_FILE_HEADER
+from ticket_io import TICKETS_FILE_HEADER
+from passenger_io import PASSENGERS_FILE_HEADER
+from csv_io import write_csv
+from atomic_file import atomic_open
+from database import (
+    CSV_READERS,
+    CSV_ROW_READERS,
+    LOADING_ORDER,
+    WRITE_BUFFER_SIZE,
+    translated_read_errors
+)
+from rejections import (
+    RejectionCounts,
+    DUPLICATE_KEY,
+    UNKNOWN_FLIGHT,
+    UNKNOWN_TICKET,
+    INVALID_SEAT_NUMBER,
+    OCCUPIED_SEAT
+)
+from collections.abc import Mapping
+from contextlib import contextmanager
+from itertools import islice
+import sqlite3
+import threading
+from errors import (
+    AllAssistantsAreBusyError,
+    ChosenPassengerDoesNotExist,
+    ChosenPassengerHasNotAskedForHelp,
+    ChosenSeatIsOccupied,
+    InvalidPassengerTicketID,
+    InvalidSeatClass,
+    InvalidSeatNumber,
+    LackingFlightObjectError,
+    LackingTicketObjectError,
+    NoFreeSeatsError,
+    PassengerAlreadyAskedForHelpError,
+    TicketAlreadyExistsError
+)
+
+
+BATCH_SIZE = 10000
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS flights (
+    plane_number INTEGER PRIMARY KEY
+);
+CREATE TABLE IF NOT EXISTS planes (
+    plane_number INTEGER PRIMARY KEY,
+    economic_seats_number INTEGER NOT NULL,
+    business_seats_number INTEGER NOT NULL,
+    carrier TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tickets (
+    ticket_id TEXT NOT NULL UNIQUE,
+    plane_number INTEGER NOT NULL,
+    seat_class TEXT NOT NULL,
+    seat_number INTEGER NOT NULL,
+    gate_number INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tickets_by_gate ON tickets (gate_number);
+CREATE TABLE IF NOT EXISTS seats (
+    plane_number INTEGER NOT NULL,
+    seat_class TEXT NOT NULL,
+    seat_number INTEGER NOT NULL,
+    ticket_id TEXT NOT NULL,
+    UNIQUE (plane_number, seat_class, seat_number)
+);
+CREATE TABLE IF NOT EXISTS assistance (
+    plane_number INTEGER NOT NULL,
+    ticket_id TEXT NOT NULL,
+    PRIMARY KEY (plane_number, ticket_id)
+);
+CREATE TABLE IF NOT EXISTS passengers (
+    ticket_id TEXT NOT NULL UNIQUE,
+    first_name TEXT NOT NULL,
+    last_name TEXT NOT NULL,
+    last_key TEXT NOT NULL,
+    first_last_key TEXT NOT NULL,
+    last_first_key TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS passengers_by_last ON passengers (last_key);
+CREATE INDEX IF NOT EXISTS passengers_by_first_last
+    ON passengers (first_last_key);
+CREATE INDEX IF NOT EXISTS passengers_by_last_first
+    ON passengers (last_first_key);
+CREATE TEMP TABLE IF NOT EXISTS batch_keys (
+    key PRIMARY KEY
+);
+CREATE TEMP TABLE IF NOT EXISTS batch_seats (
+    position INTEGER PRIMARY KEY,
+    plane_number INTEGER NOT NULL,
+    seat_class TEXT NOT NULL,
+    seat_number INTEGER NOT NULL
+);
+'''
+
+_TICKET_COLUMNS = ', '.join(f't.{column}' for column in TICKETS_FILE_HEADER)
+
+_HELD_SEAT = '''
+    s.ticket_id = t.ticket_id
+    AND s.plane_number = t.plane_number
+    AND s.seat_class = t.seat_class
+    AND s.seat_number = t.seat_number
+'''
+
+_FIRST_FREE_SEAT = '''
+SELECT MIN(candidate) FROM (
+    SELECT 1 AS candidate
+    UNION ALL
+    SELECT seat_number + 1 FROM seats
+    WHERE plane_number = :plane_number AND seat_class = :seat_class
+)
+WHERE candidate NOT IN (
+    SELECT seat_number FROM seats
+    WHERE plane_number = :plane_number AND seat_class = :seat_class
+)
+'''
+
+_FIND_PREFIX = '''
+SELECT first_name, last_name, ticket_id FROM (
+    SELECT *, last_key AS name_key FROM passengers
+    WHERE last_key >= :low AND last_key < :high
+    UNION ALL
+    SELECT *, first_last_key AS name_key FROM passengers
+    WHERE first_last_key >= :low AND first_last_key < :high
+    UNION ALL
+    SELECT *, last_first_key AS name_key FROM passengers
+    WHERE last_first_key >= :low AND last_first_key < :high
+)
+ORDER BY name_key
+'''
+
+_FIND_LENGTH = '''
+SELECT first_name, last_name, ticket_id, last_key, first_last_key,
+    last_first_key
+FROM passengers
+WHERE length(last_key) BETWEEN :low AND :high
+    OR length(first_last_key) BETWEEN :low AND :high
+    OR length(last_first_key) BETWEEN :low AND :high
+'''
+
+_INSERT_TICKET = '''
+INSERT INTO tickets (
+    ticket_id, plane_number, seat_class, seat_number, gate_number
+)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (ticket_id) DO UPDATE SET
+    plane_number = excluded.plane_number,
+    seat_class = excluded.seat_class,
+    seat_number = excluded.seat_number,
+    gate_number = excluded.gate_number
+'''
+
+_INSERT_SEAT = '''
+INSERT INTO seats (plane_number, seat_class, seat_number, ticket_id)
+VALUES (?, ?, ?, ?)
+'''
+
+_INSERT_PASSENGER = '''
+INSERT INTO passengers (
+    first_name, last_name, ticket_id, last_key, first_last_key,
+    last_first_key
+)
+VALUES (?, ?, ?, ?, ?, ?)
+'''
+
+_TAKEN_SEATS = '''
+SELECT b.position FROM temp.batch_seats AS b
+JOIN seats AS s
+    ON s.plane_number = b.plane_number
+    AND s.seat_class = b.seat_class
+    AND s.seat_number = b.seat_number
+'''
+
+_LAST_LETTER = '\U0010ffff'
+
+
+def _decode_ticket(row):
+    ticket_id, plane_number, seat_class, seat_number, gate_number = row
+    return Ticket.from_checked(
+        ticket_id,
+        plane_number,
+        seat_class,
+        seat_number,
+        gate_number
+    )
+
+
+def _decode_passenger(row):
+    first_name, last_name, ticket_id = row
+    return Passenger.from_checked(first_name, last_name, ticket_id)
+
+
+def _ticket_row(ticket):
+    """
+    Returns tuple of the columns of the tickets table describing ticket.
+    """
+    return (
+        ticket.ticket_id(),
+        ticket.plane_number(),
+        ticket.seat_class(),
+        ticket.seat_number(),
+        ticket.gate_number()
+    )
+
+
+def _seat_row(ticket):
+    """
+    Returns tuple of the columns of the seats table for the seat of ticket.
+    """
+    return (
+        ticket.plane_number(),
+        ticket.seat_class(),
+        ticket.seat_number(),
+        ticket.ticket_id()
+    )
+
+
+def _passenger_row(person):
+    """
+    Returns tuple of the columns of the passengers table describing
+    the passenger - names are also stored normalized, as NameIndex keeps
+    them, so that they can be searched by indexes.
+    """
+    first_name = normalize_name(person.first_name())
+    last_name = normalize_name(person.last_name())
+    return (
+        person.first_name(),
+        person.last_name(),
+        person.ticket_id(),
+        last_name,
+        f'{first_name} {last_name}',
+        f'{last_name} {first_name}'
+    )
+
+
+def _occupancy(seats_number, seat_numbers):
+    """
+    Returns SeatOccupancy with given seats occupied.
+    """
+    bitmap = bytearray((seats_number + 7) // 8)
+    for seat_number in seat_numbers:
+        bit = seat_number - 1
+        bitmap[bit >> 3] |= 1 << (bit & 7)
+    return SeatOccupancy.from_bitmap(seats_number, bitmap)
+
+
+def _batches(objects):
+    """
+    Yields lists of at most BATCH_SIZE objects from given iterable.
+    """
+    objects = iter(objects)
+    while True:
+        batch = list(islice(objects, BATCH_SIZE))
+        if not batch:
+            return
+        yield batch
+
+
+class _Table(Mapping):
+    """
+    Read-only dictionary-like view of one table of SqliteDatabase.
+    Every lookup is a query by the key, nothing is cached. Keys are
+    iterated in the order the rows were added, one page at a time.
+    """
+    def __init__(self, database, table, key_column, key_type, find):
+        self._database = database
+        self._table = table
+        self._key_column = key_column
+        self._key_type = key_type
+        self._find = find
+
+    def __getitem__(self, key):
+        found = None
+        if type(key) is self._key_type:
+            found = self._find(key)
+        if found is None:
+            raise KeyError(key)
+        return found
+
+    def __contains__(self, key):
+        if type(key) is not self._key_type:
+            return False
+        return self._database._exists(self._table, self._key_column, key)
+
+    def __iter__(self):
+        query = (
+            f'SELECT rowid, {self._key_column} FROM {self._table} '
+            'WHERE rowid > ? ORDER BY rowid LIMIT ?'
+        )
+        last_rowid = -1 << 63
+        while True:
+            rows = self._database._fetch_all(query, (last_rowid, BATCH_SIZE))
+            for _, key in rows:
+                yield key
+            if len(rows) < BATCH_SIZE:
+                return
+            last_rowid = rows[-1][0]
+
+    def __len__(self):
+        query = f'SELECT COUNT(*) FROM {self._table}'
+        return self._database._fetch_one(query)[0]
+
+
+class SqliteDatabase:
+    """
+    Class SqliteDatabase - keeps flights, planes, tickets and passengers
+    in SQLite file instead of the process memory. Offers the same methods
+    as Database, so both user interfaces work with it. Nothing is loaded
+    when the file is opened - lookups are queries by indexed columns and
+    every change is committed into the file at once.
+    Seats are booked by adding rows into the seats table, which is unique
+    by plane number, seat class and seat number.
+    Contains attributes:
+    :param path: path of the SQLite file
+    :type path: str
+
+    :param connection: connection to the SQLite file
+    :type connection: sqlite3.Connection
+
+    :param lock: lock held while the connection is used - it is shared
+    by all threads
+    :type lock: threading.RLock
+
+    :param tables: dictionary-like views of flights, planes, tickets
+    and passengers
+    :type tables: dict
+    """
+    def __init__(self, path):
+        """
+        Creates instance of SqliteDatabase - opens SQLite file at given
+        path and creates the tables missing in it.
+        """
+        self._path = str(path)
+        self._connection = sqlite3.connect(
+            self._path,
+            isolation_level=None,
+            check_same_thread=False
+        )
+        self._connection.execute('PRAGMA journal_mode = WAL')
+        self._connection.execute('PRAGMA synchronous = NORMAL')
+        self._connection.executescript(SCHEMA)
+        self._lock = threading.RLock()
+        self._tables = {
+            'flights': _Table(
+                self, 'flights', 'plane_number', int, self._flight
+            ),
+            'planes': _Table(
+                self, 'planes', 'plane_number', int, self._plane
+            ),
+            'tickets': _Table(
+                self, 'tickets', 'ticket_id', str, self._ticket
+            ),
+            'passengers': _Table(
+                self, 'passengers', 'ticket_id', str, self._passenger
+            )
+        }
+
+    def path(self):
+        """
+        Returns the path of the SQLite file.
+        """
+        return self._path
+
+    def close(self):
+        """
+        Closes the connection to the SQLite file.
+        """
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.close()
+
+    def _fetch_one(self, query, parameters=()):
+        with self._lock:
+            return self._connection.execute(query, parameters).fetchone()
+
+    def _fetch_all(self, query, parameters=()):
+        with self._lock:
+            return self._connection.execute(query, parameters).fetchall()
+
+    def _exists(self, table, column, key):
+        """
+        Returns True if the table has a row with given key.
+        """
+        query = f'SELECT 1 FROM {table} WHERE {column} = ?'
+        return self._fetch_one(query, (key,)) is not None
+
+    @contextmanager
+    def _transaction(self):
+        """
+        Runs the block in a transaction, committed when the block ends and
+        rolled back if it raises - other threads and processes see either
+        none or all of its changes. Transactions started inside the block
+        are a part of it.
+        """
+        with self._lock:
+            if self._connection.in_transaction:
+                yield
+                return
+            self._connection.execute('BEGIN IMMEDIATE')
+            try:
+                yield
+            except BaseException:
+                self._connection.execute('ROLLBACK')
+                raise
+            self._connection.execute('COMMIT')
+
+    def flights(self):
+        """
+        Returns read-only dictionary of flights contained in Database.
+        """
+        return self._tables['flights']
+
+    def planes(self):
+        """
+        Returns read-only dictionary of planes contained in Database -
+        planes are created with their current seats occupancy and
+        assistants, changing them does not change the Database.
+        """
+        return self._tables['planes']
+
+    def tickets(self):
+        """
+        Returns read-only dictionary of tickets contained in Database.
+        """
+        return self._tables['tickets']
+
+    def passengers(self):
+        """
+        Returns read-only dictionary of passengers contained in Database.
+        """
+        return self._tables['passengers']
+
+    def _flight(self, plane_number):
+        """
+        Returns the flight with given plane number or None.
+        """
+        if not self._exists('flights', 'plane_number', plane_number):
+            return None
+        return Flight.from_checked(plane_number)
+
+    def _plane(self, plane_number):
+        """
+        Returns the plane with given number or None.
+        """
+        with self._lock:
+            row = self._fetch_one(
+                'SELECT economic_seats_number, business_seats_number, '
+                'carrier FROM planes WHERE plane_number = ?',
+                (plane_number,)
+            )
+            if row is None:
+                return None
+            seats = self._fetch_all(
+                'SELECT seat_class, seat_number FROM seats '
+                'WHERE plane_number = ?',
+                (plane_number,)
+            )
+            assistants = self._fetch_all(
+                'SELECT ticket_id FROM assistance WHERE plane_number = ?',
+                (plane_number,)
+            )
+        economic, business, carrier = row
+        return Plane.from_checked(
+            plane_number,
+            economic,
+            business,
+            carrier,
+            _occupancy(economic, (
+                seat for seat_class, seat in seats if seat_class == 'economic'
+            )),
+            _occupancy(business, (
+                seat for seat_class, seat in seats if seat_class == 'business'
+            )),
+            [ticket_id for ticket_id, in assistants]
+        )
+
+    def _ticket(self, ticket_id):
+        """
+        Returns the ticket with given id or None.
+        """
+        row = self._fetch_one(
+            f'SELECT {_TICKET_COLUMNS} FROM tickets AS t '
+            'WHERE t.ticket_id = ?',
+            (ticket_id,)
+        )
+        return None if row is None else _decode_ticket(row)
+
+    def _passenger(self, ticket_id):
+        """
+        Returns the passenger with given ticket id or None.
+        """
+        row = self._fetch_one(
+            'SELECT first_name, last_name, ticket_id FROM passengers '
+            'WHERE ticket_id = ?',
+            (ticket_id,)
+        )
+        return None if row is None else _decode_passenger(row)
+
+    def _cabin_size(self, plane_number, seat_class):
+        """
+        Returns the number of seats of given class on given plane.
+        Raises KeyError if there is no such plane.
+        """
+        if seat_class not in ('economic', 'business'):
+            raise InvalidSeatClass
+        row = self._fetch_one(
+            f'SELECT {seat_class}_seats_number FROM planes '
+            'WHERE plane_number = ?',
+            (plane_number,)
+        )
+        if row is None:
+            raise KeyError(plane_number)
+        return row[0]
+
+    def _first_free_seat(self, plane_number, seat_class):
+        """
+        Returns the lowest free seat number of given class on given plane
+        or None if all seats are occupied.
+        """
+        seats_number = self._cabin_size(plane_number, seat_class)
+        seat_number, = self._fetch_one(_FIRST_FREE_SEAT, {
+            'plane_number': plane_number,
+            'seat_class': seat_class
+        })
+        if seat_number > seats_number:
+            return None
+        return seat_number
+
+    def _book(self, ticket):
+        """
+        Books the seat of the ticket and stores it.
+        Raises ChosenSeatIsOccupied if the seat is already booked.
+        """
+        try:
+            self._connection.execute(_INSERT_SEAT, _seat_row(ticket))
+        except sqlite3.IntegrityError:
+            raise ChosenSeatIsOccupied
+        self._connection.execute(_INSERT_TICKET, _ticket_row(ticket))
+
+    def add_flight(self, new_flight):
+        """
+        Adds new_flight into Database.
+        """
+        plane_number = new_flight.plane_number()
+        with self._transaction():
+            if self._exists('flights', 'plane_number', plane_number):
+                return 1
+            self._connection.execute(
+                'INSERT INTO flights (plane_number) VALUES (?)',
+                (plane_number,)
+            )
+        return 0
+
+    def add_plane(self, new_plane):
+        """
+        Adds new_plane into Database.
+        """
+        plane_number = new_plane.plane_number()
+        with self._transaction():
+            if self._exists('planes', 'plane_number', plane_number):
+                return 1
+            if not self._exists('flights', 'plane_number', plane_number):
+                raise LackingFlightObjectError
+            self._connection.execute(
+                'INSERT INTO planes (plane_number, economic_seats_number, '
+                'business_seats_number, carrier) VALUES (?, ?, ?, ?)',
+                (
+                    plane_number,
+                    new_plane.economic_seats_number(),
+                    new_plane.business_seats_number(),
+                    new_plane.carrier()
+                )
+            )
+        return 0
+
+    def add_passenger(self, new_passenger):
+        """
+        Adds new_passenger into Database.
+        """
+        ticket_id = new_passenger.ticket_id()
+        with self._transaction():
+            if self._exists('passengers', 'ticket_id', ticket_id):
+                return 1
+            if not self._exists('tickets', 'ticket_id', ticket_id):
+                raise LackingTicketObjectError
+            self._connection.execute(
+                _INSERT_PASSENGER,
+                _passenger_row(new_passenger)
+            )
+        return 0
+
+    def add_ticket(self, new_ticket):
+        """
+        Books the seat of new_ticket and adds it into Database.
+        """
+        plane_number = new_ticket.plane_number()
+        with self._transaction():
+            if self._exists('tickets', 'ticket_id', new_ticket.ticket_id()):
+                return 1
+            if not self._exists('flights', 'plane_number', plane_number):
+                raise LackingFlightObjectError
+            seats_number = self._cabin_size(
+                plane_number,
+                new_ticket.seat_class()
+            )
+            if new_ticket.seat_number() > seats_number:
+                raise InvalidSeatNumber
+            self._book(new_ticket)
+        return 0
+
+    def find_passengers(self, name_prefix):
+        """
+        Returns list of passengers which last name, 'first last' or
+        'last first' name starts with given prefix - case insensitive.
+        Uses indexes of normalized names.
+        """
+        low = normalize_name(name_prefix)
+        rows = self._fetch_all(_FIND_PREFIX, {
+            'low': low,
+            'high': low + _LAST_LETTER
+        })
+        found = {}
+        for row in rows:
+            if row[2] not in found:
+                found[row[2]] = _decode_passenger(row)
+        return list(found.values())
+
+    def find_passengers_fuzzy(self, name, max_distance=1):
+        """
+        Returns list of passengers which last name, 'first last' or
+        'last first' name differs from given name by at most max_distance
+        edits - case insensitive, the closest first.
+        Only names of matching length are compared.
+        """
+        name = normalize_name(name)
+        rows = self._fetch_all(_FIND_LENGTH, {
+            'low': len(name) - max_distance,
+            'high': len(name) + max_distance
+        })
+        matches = []
+        for row in rows:
+            distance = min(edit_distance(name, key) for key in row[3:])
+            if distance <= max_distance:
+                matches.append((distance, _decode_passenger(row[:3])))
+        matches.sort(key=lambda match: match[0])
+        return [person for _, person in matches]
+
+    def book_seat(self, used_ticket):
+        """
+        Books the seat of used_ticket and stores it.
+        """
+        with self._transaction():
+            seats_number = self._cabin_size(
+                used_ticket.plane_number(),
+                used_ticket.seat_class()
+            )
+            if used_ticket.seat_number() > seats_number:
+                raise InvalidSeatNumber
+            self._book(used_ticket)
+
+    def release_seat(self, used_ticket):
+        """
+        Releases given ticket's seat - unless the seat is held by another
+        ticket.
+        """
+        with self._transaction():
+            seats_number = self._cabin_size(
+                used_ticket.plane_number(),
+                used_ticket.seat_class()
+            )
+            if used_ticket.seat_number() > seats_number:
+                raise InvalidSeatNumber
+            self._connection.execute(
+                'DELETE FROM seats WHERE plane_number = ? '
+                'AND seat_class = ? AND seat_number = ? AND ticket_id = ?',
+                _seat_row(used_ticket)
+            )
+
+    def change_seat(self, ticket_id, new_class, new_seat):
+        """
+        Moves the ticket with given id to given seat of its plane - the new
+        seat is booked and the old one, if the ticket still holds it,
+        released in one transaction.
+        Returns the ticket with the new seat.
+        """
+        with self._transaction():
+            ticket = None
+            if isinstance(ticket_id, str):
+                ticket = self._ticket(ticket_id)
+            if ticket is None:
+                raise ChosenPassengerDoesNotExist
+            new_ticket = Ticket(
+                ticket_id,
+                ticket.plane_number(),
+                new_class,
+                new_seat,
+                ticket.gate_number()
+            )
+            seats_number = self._cabin_size(ticket.plane_number(), new_class)
+            if new_seat > seats_number:
+                raise InvalidSeatNumber
+            released = self._connection.execute(
+                'DELETE FROM seats WHERE plane_number = ? '
+                'AND seat_class = ? AND seat_number = ? AND ticket_id = ?',
+                _seat_row(ticket)
+            ).rowcount
+            old_seat = (ticket.seat_class(), ticket.seat_number())
+            if released and old_seat == (new_class, new_seat):
+                self._book(ticket)
+                return ticket
+            self._book(new_ticket)
+        return new_ticket
+
+    def tickets_on_plane(self, plane_number, seat_class=None):
+        """
+        Returns list of tickets holding a seat on given plane, optionally
+        only the tickets of given seat class.
+        """
+        query = (
+            f'SELECT {_TICKET_COLUMNS} FROM seats AS s '
+            f'JOIN tickets AS t ON {_HELD_SEAT} '
+            'WHERE s.plane_number = ?'
+        )
+        parameters = (plane_number,)
+        if seat_class is not None:
+            query += ' AND s.seat_class = ?'
+            parameters += (seat_class,)
+        query += ' ORDER BY t.rowid'
+        return [_decode_ticket(row) for row in self._fetch_all(
+            query,
+            parameters
+        )]
+
+    def tickets_at_gate(self, gate_number):
+        """
+        Returns list of tickets holding a seat and boarding at given gate.
+        """
+        query = (
+            f'SELECT {_TICKET_COLUMNS} FROM tickets AS t '
+            f'JOIN seats AS s ON {_HELD_SEAT} '
+            'WHERE t.gate_number = ? ORDER BY t.rowid'
+        )
+        return [_decode_ticket(row) for row in self._fetch_all(
+            query,
+            (gate_number,)
+        )]
+
+    def book_next_free_seat(self, ticket_id, plane_number, seat_class, gate):
+        """
+        Creates new ticket with the first free seat of given class on given
+        plane and adds it into Database.
+        Returns created ticket.
+        """
+        with self._transaction():
+            if self._exists('tickets', 'ticket_id', ticket_id):
+                raise TicketAlreadyExistsError
+            if not self._exists('flights', 'plane_number', plane_number):
+                raise LackingFlightObjectError
+            seat_number = self._first_free_seat(plane_number, seat_class)
+            if seat_number is None:
+                raise NoFreeSeatsError
+            new_ticket = Ticket(
+                ticket_id,
+                plane_number,
+                seat_class,
+                seat_number,
+                gate
+            )
+            self._book(new_ticket)
+        return new_ticket
+
+    def _check_assistance(self, passenger_ticket):
+        """
+        Checks whether the passenger with given ticket can ask or thank
+        for assistance. Returns the plane number and the ticket id.
+        """
+        ticket_id = passenger_ticket.ticket_id()
+        plane_number = passenger_ticket.plane_number()
+        if not self._exists('planes', 'plane_number', plane_number):
+            raise KeyError(plane_number)
+        if not self._exists('tickets', 'ticket_id', ticket_id):
+            raise ChosenPassengerDoesNotExist
+        if not ticket_id or not str(ticket_id):
+            raise InvalidPassengerTicketID
+        return plane_number, ticket_id
+
+    def ask_for_assistance(self, passenger_ticket):
+        """
+        Adds new passengers that require help if any assistant is free.
+        """
+        with self._transaction():
+            assistance = self._check_assistance(passenger_ticket)
+            if self._fetch_one(
+                'SELECT 1 FROM assistance '
+                'WHERE plane_number = ? AND ticket_id = ?',
+                assistance
+            ):
+                raise PassengerAlreadyAskedForHelpError
+            busy_assistants, = self._fetch_one(
+                'SELECT COUNT(*) FROM assistance WHERE plane_number = ?',
+                assistance[:1]
+            )
+            if busy_assistants >= ASSISTANTS_NUMBER:
+                raise AllAssistantsAreBusyError
+            self._connection.execute(
+                'INSERT INTO assistance (plane_number, ticket_id) '
+                'VALUES (?, ?)',
+                assistance
+            )
+
+    def thank_for_assistance(self, passenger_ticket):
+        """
+        Removes the passengers that no longer need help.
+        """
+        with self._transaction():
+            assistance = self._check_assistance(passenger_ticket)
+            removed = self._connection.execute(
+                'DELETE FROM assistance '
+                'WHERE plane_number = ? AND ticket_id = ?',
+                assistance
+            )
+            if not removed.rowcount:
+                raise ChosenPassengerHasNotAskedForHelp
+
+    def _matching_keys(self, table, column, keys):
+        """
+        Returns the set of given keys present in the column of the table -
+        the keys are compared at once through a temporary table.
+        """
+        self._connection.execute('DELETE FROM temp.batch_keys')
+        self._connection.executemany(
+            'INSERT OR IGNORE INTO temp.batch_keys (key) VALUES (?)',
+            ((key,) for key in keys)
+        )
+        return {key for key, in self._connection.execute(
+            f'SELECT {column} FROM {table} '
+            f'WHERE {column} IN (SELECT key FROM temp.batch_keys)'
+        )}
+
+    def _add_flights_batch(self, flights):
+        """
+        Adds the batch of flights with one executemany().
+        Returns list of (position in the batch, reason) of the omitted
+        flights, like every _add_*_batch method.
+        """
+        existing = self._matching_keys('flights', 'plane_number', (
+            flight.plane_number() for flight in flights
+        ))
+        rejected = []
+        rows = []
+        for position, flight in enumerate(flights):
+            plane_number = flight.plane_number()
+            if plane_number in existing:
+                rejected.append((position, DUPLICATE_KEY))
+                continue
+            existing.add(plane_number)
+            rows.append((plane_number,))
+        self._connection.executemany(
+            'INSERT INTO flights (plane_number) VALUES (?)',
+            rows
+        )
+        return rejected
+
+    def _add_planes_batch(self, planes):
+        """
+        Adds the batch of planes with one executemany().
+        """
+        plane_numbers = [plane.plane_number() for plane in planes]
+        existing = self._matching_keys('planes', 'plane_number', plane_numbers)
+        flights = self._matching_keys('flights', 'plane_number', plane_numbers)
+        rejected = []
+        rows = []
+        for position, plane in enumerate(planes):
+            plane_number = plane.plane_number()
+            if plane_number in existing:
+                rejected.append((position, DUPLICATE_KEY))
+            elif plane_number not in flights:
+                rejected.append((position, UNKNOWN_FLIGHT))
+            else:
+                existing.add(plane_number)
+                rows.append((
+                    plane_number,
+                    plane.economic_seats_number(),
+                    plane.business_seats_number(),
+                    plane.carrier()
+                ))
+        self._connection.executemany(
+            'INSERT INTO planes (plane_number, economic_seats_number, '
+            'business_seats_number, carrier) VALUES (?, ?, ?, ?)',
+            rows
+        )
+        return rejected
+
+    def _taken_seats(self, seat_rows):
+        """
+        Returns the set of positions of the rows of the seats table which
+        seats are already booked - the seats are compared at once through
+        a temporary table.
+        """
+        self._connection.execute('DELETE FROM temp.batch_seats')
+        self._connection.executemany(
+            'INSERT INTO temp.batch_seats '
+            '(position, plane_number, seat_class, seat_number) '
+            'VALUES (?, ?, ?, ?)',
+            (
+                (position, plane_number, seat_class, seat_number)
+                for position, (plane_number, seat_class, seat_number, _)
+                in enumerate(seat_rows)
+            )
+        )
+        return {position for position, in self._connection.execute(
+            _TAKEN_SEATS
+        )}
+
+    def _cabin_sizes(self, plane_numbers):
+        """
+        Returns dictionary mapping given plane numbers present in Database
+        to the numbers of their economic and business seats.
+        """
+        self._matching_keys('planes', 'plane_number', plane_numbers)
+        rows = self._connection.execute(
+            'SELECT plane_number, economic_seats_number, '
+            'business_seats_number FROM planes '
+            'WHERE plane_number IN (SELECT key FROM temp.batch_keys)'
+        )
+        return {
+            plane_number: {'economic': economic, 'business': business}
+            for plane_number, economic, business in rows
+        }
+
+    def _add_tickets_batch(self, tickets, reseat_occupied=False):
+        """
+        Books seats of the batch of tickets with one executemany() - every
+        ticket is checked against the seats booked before and the seats
+        of the preceding tickets of the batch.
+        If reseat_occupied is True tickets which seats are occupied get
+        the first free seat of their class.
+        """
+        existing = self._matching_keys('tickets', 'ticket_id', (
+            ticket.ticket_id() for ticket in tickets
+        ))
+        cabin_sizes = self._cabin_sizes({
+            ticket.plane_number() for ticket in tickets
+        })
+        seat_rows = [_seat_row(ticket) for ticket in tickets]
+        taken = self._taken_seats(seat_rows)
+        booked_seats = set()
+        rejected = []
+        occupied = []
+        booked = []
+        for position, ticket in enumerate(tickets):
+            ticket_id = ticket.ticket_id()
+            plane_cabins = cabin_sizes.get(ticket.plane_number())
+            if ticket_id in existing:
+                rejected.append((position, DUPLICATE_KEY))
+                continue
+            if plane_cabins is None:
+                rejected.append((position, UNKNOWN_FLIGHT))
+                continue
+            existing.add(ticket_id)
+            plane_number, seat_class, seat_number, _ = seat_rows[position]
+            seat = (plane_number, seat_class, seat_number)
+            if seat_number > plane_cabins[seat_class]:
+                rejected.append((position, INVALID_SEAT_NUMBER))
+            elif position in taken or seat in booked_seats:
+                occupied.append(position)
+            else:
+                booked_seats.add(seat)
+                booked.append(position)
+        self._connection.executemany(
+            _INSERT_SEAT,
+            (seat_rows[position] for position in booked)
+        )
+        self._connection.executemany(
+            _INSERT_TICKET,
+            (_ticket_row(tickets[position]) for position in booked)
+        )
+        for position in occupied:
+            ticket = tickets[position]
+            if reseat_occupied:
+                seat_number = self._first_free_seat(
+                    ticket.plane_number(),
+                    ticket.seat_class()
+                )
+                if seat_number is not None:
+                    self._book(Ticket(
+                        ticket.ticket_id(),
+                        ticket.plane_number(),
+                        ticket.seat_class(),
+                        seat_number,
+                        ticket.gate_number()
+                    ))
+                    continue
+            rejected.append((position, OCCUPIED_SEAT))
+        rejected.sort()
+        return rejected
+
+    def _add_passengers_batch(self, passengers):
+        """
+        Adds the batch of passengers with one executemany().
+        """
+        ticket_ids = [person.ticket_id() for person in passengers]
+        existing = self._matching_keys('passengers', 'ticket_id', ticket_ids)
+        tickets = self._matching_keys('tickets', 'ticket_id', ticket_ids)
+        rejected = []
+        rows = []
+        for position, person in enumerate(passengers):
+            ticket_id = person.ticket_id()
+            if ticket_id in existing:
+                rejected.append((position, DUPLICATE_KEY))
+            elif ticket_id not in tickets:
+                rejected.append((position, UNKNOWN_TICKET))
+            else:
+                existing.add(ticket_id)
+                rows.append(_passenger_row(person))
+        self._connection.executemany(_INSERT_PASSENGER, rows)
+        return rejected
+
+    def _add_batch(self, kind, objects, **options):
+        """
+        Adds the batch of objects of given kind - 'flights', 'planes',
+        'tickets' or 'passengers'.
+        """
+        adders = {
+            'flights': self._add_flights_batch,
+            'planes': self._add_planes_batch,
+            'tickets': self._add_tickets_batch,
+            'passengers': self._add_passengers_batch
+        }
+        return adders[kind](objects, **options)
+
+    def _add_all(self, kind, objects, **options):
+        """
+        Adds objects of given kind from the iterable in batches of
+        BATCH_SIZE, all in one transaction.
+        Returns RejectionCounts of the omitted objects.
+        """
+        rejections = RejectionCounts()
+        with self._transaction():
+            for batch in _batches(objects):
+                for _, reason in self._add_batch(kind, batch, **options):
+                    rejections[reason] += 1
+        return rejections
+
+    def add_flights(self, flights):
+        """
+        Adds flights from given iterable into Database.
+        Returns RejectionCounts of the omitted flights.
+        """
+        return self._add_all('flights', flights)
+
+    def add_planes(self, planes):
+        """
+        Adds planes from given iterable into Database.
+        Returns RejectionCounts of the omitted planes.
+        """
+        return self._add_all('planes', planes)
+
+    def add_tickets(self, tickets, reseat_occupied=False):
+        """
+        Adds tickets from given iterable into Database.
+        If reseat_occupied is True tickets which seats are already occupied
+        get the first free seat of their class instead of being omitted.
+        Returns RejectionCounts of the omitted tickets.
+        """
+        return self._add_all(
+            'tickets',
+            tickets,
+            reseat_occupied=reseat_occupied
+        )
+
+    def add_passengers(self, passengers):
+        """
+        Adds passengers from given iterable into Database.
+        Returns RejectionCounts of the omitted passengers.
+        """
+        return self._add_all('passengers', passengers)
+
+    def _read_file(self, kind, path, report=None, **options):
+        """
+        Reads objects of given kind from csv file and adds them into
+        Database in batches, all in one transaction - nothing is added if
+        the file turns out to be malformed.
+        If report is given every omitted row is passed to it - rows
+        rejected by Database are passed after the rows of their batch
+        rejected by the reader.
+        Returns RejectionCounts of the omitted rows.
+        """
+        with translated_read_errors(path):
+            with open(path, 'r') as file_handle:
+                if report is None:
+                    rejections = RejectionCounts()
+                    objects = CSV_READERS[kind](file_handle, rejections)
+                    rejections.update(self._add_all(kind, objects, **options))
+                    return rejections
+
+                report.set_source(path)
+                counts_before = report.counts().copy()
+                rows = CSV_ROW_READERS[kind](file_handle, report)
+                with self._transaction():
+                    for batch in _batches(rows):
+                        objects = [new_object for _, _, new_object in batch]
+                        for position, reason in self._add_batch(
+                            kind,
+                            objects,
+                            **options
+                        ):
+                            line_number, row, _ = batch[position]
+                            report.reject(reason, line_number, row)
+                return RejectionCounts(report.counts() - counts_before)
+
+    def read_flights(self, path, report=None):
+        """
+        Reads data from csv file and adds new objects of class Flight
+        that are not represented in database.
+        If report is given every omitted row is written into it.
+        Returns RejectionCounts of the omitted rows.
+        """
+        return self._read_file('flights', path, report)
+
+    def read_passengers(self, path, report=None):
+        """
+        Reads data from csv file and adds new objects of class Passenger
+        that are not represented in database.
+        If report is given every omitted row is written into it.
+        Returns RejectionCounts of the omitted rows.
+        """
+        return self._read_file('passengers', path, report)
+
+    def read_planes(self, path, report=None):
+        """
+        Reads data from csv file and adds new objects of class Plane
+        that are not represented in database.
+        If report is given every omitted row is written into it.
+        Returns RejectionCounts of the omitted rows.
+        """
+        return self._read_file('planes', path, report)
+
+    def read_tickets(self, path, reseat_occupied=False, report=None):
+        """
+        Reads data from csv file and adds new objects of class Ticket
+        that are not represented in database.
+        If reseat_occupied is True tickets which seats are already occupied
+        get the first free seat of their class instead of being omitted.
+        If report is given every omitted row is written into it.
+        Returns RejectionCounts of the omitted rows.
+        """
+        return self._read_file(
+            'tickets',
+            path,
+            report,
+            reseat_occupied=reseat_occupied
+        )
+
+    def read_files(self, paths, executor=None, report=None):
+        """
+        Reads csv files given in paths dictionary - keys are 'flights',
+        'planes', 'tickets' and 'passengers' - in order: flights, planes,
+        tickets, passengers.
+        Files are parsed in this process while their rows are written into
+        the SQLite file, so executor is not used - it is accepted for
+        compatibility with Database.
+        Returns dictionary with RejectionCounts of the omitted rows of each
+        file. Stops at the first file that cannot be read, files preceding
+        it are already added.
+        """
+        return {
+            kind: self._read_file(kind, paths[kind], report)
+            for kind in LOADING_ORDER
+            if kind in paths
+        }
+
+    def write_files(self, paths, buffer_size=WRITE_BUFFER_SIZE):
+        """
+        Writes the Database into csv files given in paths dictionary, like
+        Database.write_files() - rows are streamed from the SQLite file.
+        """
+        headers = {
+            'flights': FLIGHTS_FILE_HEADER,
+            'planes': PLANES_FILE_HEADER,
+            'tickets': TICKETS_FILE_HEADER,
+            'passengers': PASSENGERS_FILE_HEADER
+        }
+        for kind in LOADING_ORDER:
+            if kind not in paths:
+                continue
+            header = headers[kind]
+            query = f'SELECT {", ".join(header)} FROM {kind} ORDER BY rowid'
+            with atomic_open(
+                paths[kind], 'w', buffer_size, newline=''
+            ) as file_handle:
+                with self._lock:
+                    rows = self._connection.execute(query)
+                    write_csv(file_handle, header, rows)
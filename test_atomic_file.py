@@ -0,0 +1,23 @@
+from atomic_file import atomic_open
+import pytest
+
+
+def test_atomic_open_replaces_file(tmp_path):
+    path = tmp_path / 'data.txt'
+    path.write_text('old')
+    with atomic_open(path) as file_handle:
+        file_handle.write('new')
+        assert path.read_text() == 'old'
+    assert path.read_text() == 'new'
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_atomic_open_keeps_file_on_error(tmp_path):
+    path = tmp_path / 'data.bin'
+    path.write_bytes(b'old')
+    with pytest.raises(RuntimeError):
+        with atomic_open(path, 'wb') as file_handle:
+            file_handle.write(b'new')
+            raise RuntimeError
+    assert path.read_bytes() == b'old'
+    assert list(tmp_path.iterdir()) == [path]
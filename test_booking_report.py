@@ -0,0 +1,36 @@
+from booking_report import BookingReport
+from rejections import DUPLICATE_KEY, OCCUPIED_SEAT
+from ticket import Ticket
+
+
+def test_booking_report_init():
+    report = BookingReport()
+    assert report.booked() == []
+    assert report.conflicts() == []
+    assert not report.committed()
+
+
+def test_booking_report_conflicts_by_reason():
+    report = BookingReport()
+    report.add_conflict(Ticket('1', 1, 'economic', 1, 1), OCCUPIED_SEAT)
+    report.add_conflict(Ticket('2', 1, 'economic', 1, 1), OCCUPIED_SEAT)
+    report.add_conflict(Ticket('2', 1, 'economic', 2, 1), DUPLICATE_KEY)
+    assert report.conflicts_by_reason() == {
+        OCCUPIED_SEAT: 2,
+        DUPLICATE_KEY: 1
+    }
+
+
+def test_booking_report_mark_committed():
+    report = BookingReport()
+    ticket = Ticket('1', 1, 'economic', 1, 1)
+    report.mark_committed([ticket])
+    assert report.committed()
+    assert report.booked() == [ticket]
+
+
+def test_booking_report_str():
+    report = BookingReport()
+    report.add_conflict(Ticket('1', 1, 'economic', 1, 1), OCCUPIED_SEAT)
+    report.mark_committed([Ticket('2', 1, 'economic', 2, 1)])
+    assert str(report) == 'booked: 1, rejected: 1, seat occupied: 1'
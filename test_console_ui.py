@@ -1,8 +1,21 @@
 from console_ui import (
     load_data,
-    create_table
+    load_database,
+    open_index,
+    create_table,
+    default_files,
+    answer,
+    watch,
+    main
 )
 from database import Database
+from live_sync import LiveSync
+from query_server import QueryServer
+import console_ui
+import asyncio
+import os
+import shutil
+import threading
 
 
 def test_load_data():
@@ -14,6 +27,30 @@ def test_load_data():
     assert len(db.passengers()) == 10
 
 
+def test_load_database_saves_and_uses_snapshot(tmp_path):
+    path = tmp_path / 'database.snapshot'
+    db = load_database(path)
+    assert len(db.tickets()) == 10
+    assert path.exists()
+    db = load_database(path)
+    assert len(db.flights()) == 10
+    assert len(db.planes()) == 10
+    assert len(db.tickets()) == 10
+    assert len(db.passengers()) == 10
+
+
+def test_open_index_builds_index(tmp_path):
+    index_path = tmp_path / 'database.index'
+    snapshot_path = tmp_path / 'database.snapshot'
+    index = open_index(index_path, snapshot_path)
+    assert index_path.exists()
+    assert index.tickets()['3'].seat_number() == 20
+    index.close()
+    index = open_index(index_path, snapshot_path)
+    assert index.passengers()['1'].last_name() == 'Croft'
+    index.close()
+
+
 def test_create_table():
     data = {'key': '1'}
     table = create_table(data)
@@ -93,3 +130,154 @@ def test_departure_gate():
 """
 
     assert table == correct
+
+
+def test_find_passenger(capsys):
+    main(['console_ui.py', 'find_passenger', '--name', 'kowalsk'])
+    output = capsys.readouterr().out
+    assert 'Karolina Kowalska, ticket id number: 3' in output
+    assert 'Jan Kowalski, ticket id number: 4' in output
+
+
+def test_find_passenger_fuzzy(capsys):
+    main([
+        'console_ui.py', 'find_passenger', '--name', 'Zolkiewsky',
+        '--distance', '1'
+    ])
+    output = capsys.readouterr().out
+    assert output == 'Passenger: Stefan Zolkiewski, ticket id number: 10\n'
+
+
+def test_find_passenger_requires_name(capsys):
+    main(['console_ui.py', 'find_passenger'])
+    assert capsys.readouterr().out == 'name is required\n'
+
+
+def test_watch_answers_from_synced_database(tmp_path, capsys):
+    paths = {}
+    for kind, name in default_files.items():
+        paths[kind] = str(tmp_path / name)
+        shutil.copy(name, paths[kind])
+    sync = LiveSync(paths)
+    sync.poll()
+    lines = [
+        'check_gate --id 1',
+        '',
+        'unknown_operation',
+        'tickets --id 9',
+        'quit',
+        'flights'
+    ]
+    watch(sync, lines)
+    out = capsys.readouterr().out
+    assert '| gate number |' in out
+    assert 'unknown argument' in out
+    assert 'Ticket: id: 9,' in out
+    assert 'Flight' not in out
+
+
+def test_answer_reports_unknown_id(tmp_path):
+    paths = {}
+    for kind, name in default_files.items():
+        paths[kind] = str(tmp_path / name)
+        shutil.copy(name, paths[kind])
+    sync = LiveSync(paths)
+    sync.poll()
+    assert answer(sync, ['tickets', '--id', '0']) == 'not found\n'
+    assert 'error' in answer(sync, ['--distance'])
+
+
+def test_main_uses_running_server(tmp_path, monkeypatch, capsys):
+    path = tmp_path / 'database.sock'
+    server = QueryServer(path, lambda arguments: 'from server\n')
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(server.start())
+    thread = threading.Thread(target=loop.run_forever)
+    thread.start()
+    monkeypatch.setattr(console_ui, 'socket_file', str(path))
+    try:
+        main(['console_ui.py', 'tickets', '--id', '1'])
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.run_until_complete(server.close())
+        loop.close()
+    assert capsys.readouterr().out == 'from server\n'
+
+
+def test_watch_change_seat(tmp_path, capsys):
+    paths = {}
+    for kind, name in default_files.items():
+        paths[kind] = str(tmp_path / name)
+        shutil.copy(name, paths[kind])
+    sync = LiveSync(paths)
+    sync.poll()
+    lines = [
+        'change_seat --id 1 --seat_class economic --seat 7',
+        'change_seat --id 2 --seat_class economic --seat 7',
+        'change_seat --id 2'
+    ]
+    watch(sync, lines)
+    out = capsys.readouterr().out
+    assert 'seat class: economic, seat number: 7' in out
+    assert 'seat occupied' in out
+    assert 'seat class and seat are required' in out
+    assert sync.database().tickets()['1'].seat_number() == 7
+
+
+def test_main_sqlite_keeps_changes(tmp_path, capsys):
+    path = str(tmp_path / 'database.sqlite')
+    main([
+        'console_ui.py', 'change_seat', '--id', '1',
+        '--seat_class', 'economic', '--seat', '7', '--sqlite', path
+    ])
+    assert 'seat number: 7' in capsys.readouterr().out
+    main(['console_ui.py', 'tickets', '--id', '1', '--sqlite', path])
+    assert 'seat class: economic, seat number: 7' in capsys.readouterr().out
+    main(['console_ui.py', 'passengers', '--sqlite', path])
+    assert capsys.readouterr().out.count('\n') == 10
+
+
+def test_main_reads_only_needed_files(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(console_ui, 'socket_file', str(tmp_path / 'x.sock'))
+    monkeypatch.setattr(
+        console_ui,
+        'default_files',
+        dict(default_files, tickets=str(tmp_path / 'missing.csv'))
+    )
+    main(['console_ui.py', 'flights'])
+    assert capsys.readouterr().out.count('\n') == 10
+
+
+def test_main_looks_up_id_in_index(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(console_ui, 'socket_file', str(tmp_path / 'x.sock'))
+    snapshot_path = tmp_path / 'database.snapshot'
+    index_path = tmp_path / 'database.index'
+    monkeypatch.setattr(console_ui, 'snapshot_file', str(snapshot_path))
+    monkeypatch.setattr(console_ui, 'index_file', str(index_path))
+    paths = {}
+    for kind, name in default_files.items():
+        paths[kind] = str(tmp_path / name)
+        shutil.copy(name, paths[kind])
+    monkeypatch.setattr(console_ui, 'default_files', paths)
+    main(['console_ui.py', 'tickets', '--id', '4'])
+    assert 'seat number: 30' in capsys.readouterr().out
+    assert snapshot_path.exists()
+    assert index_path.exists()
+    monkeypatch.setattr(console_ui, 'load_database', None)
+    main(['console_ui.py', 'boarding_pass', '--id', '10'])
+    assert 'Zolkiewski' in capsys.readouterr().out
+
+
+def test_main_unvalidated_lookup_prints_note(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(console_ui, 'socket_file', str(tmp_path / 'x.sock'))
+    paths = {}
+    for kind, name in default_files.items():
+        paths[kind] = str(tmp_path / name)
+        shutil.copy(name, paths[kind])
+    monkeypatch.setattr(console_ui, 'default_files', paths)
+    monkeypatch.setattr(console_ui, 'open_index', None)
+    main(['console_ui.py', 'tickets', '--id', '4', '--unvalidated'])
+    output = capsys.readouterr().out
+    assert output.startswith(console_ui.unvalidated_note)
+    assert 'seat number: 30' in output
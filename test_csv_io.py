@@ -0,0 +1,36 @@
+from csv_io import read_header, parse_int
+import csv
+from io import StringIO
+import pytest
+
+
+def test_read_header():
+    reader = csv.reader(StringIO('a,b,c\n1,2,3\n'))
+    assert read_header(reader, ('c', 'a')) == (2, 0)
+    assert next(reader) == ['1', '2', '3']
+
+
+def test_read_header_missing_column():
+    reader = csv.reader(StringIO('a,b,c\n1,2,3\n'))
+    with pytest.raises(KeyError):
+        read_header(reader, ('a', 'd'))
+
+
+def test_read_header_empty_file():
+    reader = csv.reader(StringIO(''))
+    assert read_header(reader, ('a',)) is None
+
+
+def test_parse_int():
+    assert parse_int('12') == 12
+    assert parse_int(' 12 ') == 12
+    assert parse_int('-3') == -3
+    assert parse_int('+3') == 3
+
+
+def test_parse_int_invalid():
+    assert parse_int('') is None
+    assert parse_int('abc') is None
+    assert parse_int('1.5') is None
+    assert parse_int('+-3') is None
+    assert parse_int('9' * 5000) is None
@@ -0,0 +1,120 @@
+from csv_offset_index import (
+    CsvOffsetIndex,
+    OffsetIndexedDatabase,
+    offsets_path
+)
+from database import Database
+from errors import FilePathNotFoundError, InvalidFileHeaderError
+import os
+import shutil
+import pytest
+
+
+default_files = {
+    'flights': 'flights_database.csv',
+    'planes': 'planes_database.csv',
+    'tickets': 'tickets_database.csv',
+    'passengers': 'passengers_database.csv'
+}
+
+
+@pytest.fixture
+def paths(tmp_path):
+    copied = {}
+    for kind, name in default_files.items():
+        copied[kind] = str(tmp_path / name)
+        shutil.copy(name, copied[kind])
+    return copied
+
+
+def test_offset_index_same_as_database(paths):
+    expected = Database()
+    expected.read_files(paths)
+    with OffsetIndexedDatabase(paths) as db:
+        for number in expected.flights():
+            assert str(db.flights()[number]) == str(expected.flights()[number])
+            assert str(db.planes()[number]) == str(expected.planes()[number])
+        for key in expected.tickets():
+            assert str(db.tickets()[key]) == str(expected.tickets()[key])
+            found = db.passengers()[key]
+            assert str(found) == str(expected.passengers()[key])
+
+
+def test_offset_index_missing_keys(paths):
+    with CsvOffsetIndex('tickets', paths['tickets']) as index:
+        assert '11' not in index
+        assert 1 not in index
+        assert index.get('0') is None
+        with pytest.raises(KeyError):
+            index['11']
+    with CsvOffsetIndex('flights', paths['flights']) as index:
+        assert '1' not in index
+        assert 1 in index
+
+
+def test_offset_index_saves_sidecar_file(paths):
+    with CsvOffsetIndex('tickets', paths['tickets']) as index:
+        assert index['4'].seat_number() == 30
+    sidecar = offsets_path(paths['tickets'])
+    modification_time = os.stat(sidecar).st_mtime_ns
+    with CsvOffsetIndex('tickets', paths['tickets']) as index:
+        assert index['4'].seat_number() == 30
+    assert os.stat(sidecar).st_mtime_ns == modification_time
+
+
+def test_offset_index_rebuilt_after_change(paths):
+    with CsvOffsetIndex('tickets', paths['tickets']) as index:
+        assert '11' not in index
+    with open(paths['tickets'], 'a') as file_handle:
+        file_handle.write('11,2,economic,5,3\n')
+    with CsvOffsetIndex('tickets', paths['tickets']) as index:
+        assert index['11'].seat_number() == 5
+        assert index['1'].seat_number() == 1
+
+
+def test_offset_index_finds_first_valid_row(tmp_path):
+    path = tmp_path / 'tickets.csv'
+    path.write_text(
+        'ticket_id,plane_number,seat_class,seat_number,gate_number\n'
+        '1,1,economic,x,1\n'
+        '"1",1,economic,7,1\n'
+        '1,1,economic,8,1\n'
+        '"2\n3",1,economic,9,1\n'
+        '4,1\n'
+    )
+    with CsvOffsetIndex('tickets', path) as index:
+        assert index['1'].seat_number() == 7
+        assert index['2\n3'].seat_number() == 9
+        assert '4' not in index
+
+
+def test_offset_index_int_keys_canonical(tmp_path):
+    path = tmp_path / 'flights.csv'
+    path.write_text('plane_number\n 01\r\nx\n\n2\n')
+    with CsvOffsetIndex('flights', path) as index:
+        assert index[1].plane_number() == 1
+        assert index[2].plane_number() == 2
+
+
+def test_offset_index_without_writable_sidecar(paths, tmp_path):
+    index_path = tmp_path / 'missing' / 'tickets.offsets'
+    with CsvOffsetIndex('tickets', paths['tickets'], index_path) as index:
+        assert index['3'].gate_number() == 1
+    assert not os.path.exists(index_path)
+
+
+def test_offset_index_errors(tmp_path):
+    with pytest.raises(FilePathNotFoundError):
+        CsvOffsetIndex('tickets', tmp_path / 'some_database.csv')
+    with pytest.raises(InvalidFileHeaderError):
+        CsvOffsetIndex('passengers', 'invalid_header_test.csv', tmp_path / 'x')
+    path = tmp_path / 'empty.csv'
+    path.write_text('')
+    with CsvOffsetIndex('planes', path) as index:
+        assert 1 not in index
+
+
+def test_offset_indexed_database_opens_only_used_files(paths):
+    with OffsetIndexedDatabase(dict(paths, planes='missing.csv')) as db:
+        assert db.tickets()['10'].seat_number() == 6
+        assert not os.path.exists(offsets_path(paths['passengers']))
@@ -1,17 +1,40 @@
 from database import Database
+import database
+from rejections import (
+    RejectionCounts,
+    MALFORMED_ROW,
+    INVALID_PLANE_NUMBER,
+    DUPLICATE_KEY,
+    UNKNOWN_FLIGHT,
+    UNKNOWN_TICKET,
+    INVALID_SEAT_NUMBER,
+    INVALID_GATE_NUMBER,
+    OCCUPIED_SEAT,
+    NO_FREE_SEAT
+)
 from errors import (
     FilePathNotFoundError,
     FileIsADirectoryError,
     InvalidSeatNumber,
     InvalidFileHeaderError,
+    MalformedFileError,
     AllAssistantsAreBusyError,
     ChosenPassengerHasNotAskedForHelp,
-    ChosenSeatIsOccupied
+    ChosenSeatIsOccupied,
+    ChosenPassengerDoesNotExist,
+    LackingFlightObjectError,
+    NoFreeSeatsError,
+    TicketAlreadyExistsError
 )
 from flight import Flight
 from passenger import Passenger
 from plane import Plane
 from ticket import Ticket
+from ticket_store import TicketStore
+from import_report import ImportReport
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+import json
 import pytest
 
 
@@ -467,16 +490,793 @@ def test_database_thank_for_assistance_not_added_passenger():
 def test_database_add_plane_lacking_flights():
     db = Database()
     invalid_rows = db.read_planes('planes_database.csv')
-    assert invalid_rows == 10
+    assert invalid_rows == {UNKNOWN_FLIGHT: 10}
 
 
 def test_database_add_ticket_lacking_flights():
     db = Database()
     invalid_rows = db.read_tickets('tickets_database.csv')
-    assert invalid_rows == 10
+    assert invalid_rows == {UNKNOWN_FLIGHT: 10}
 
 
 def test_database_add_passenger_lacking_tickets():
     db = Database()
     invalid_rows = db.read_passengers('passengers_database.csv')
-    assert invalid_rows == 10
+    assert invalid_rows == {UNKNOWN_TICKET: 10}
+
+
+def test_database_book_next_free_seat():
+    db = Database()
+    db.read_flights('flights_database.csv')
+    db.read_planes('planes_database.csv')
+    db.read_tickets('tickets_database.csv')
+    ticket = db.book_next_free_seat('11', 1, 'business', 3)
+    assert ticket.seat_number() == 2
+    assert db.tickets()['11'] is ticket
+    assert db.planes()[1].business_seats_occupancy()[2] == 'OCCUPIED'
+    ticket = db.book_next_free_seat('12', 1, 'economic', 3)
+    assert ticket.seat_number() == 7
+
+
+def test_database_book_next_free_seat_after_release():
+    db = Database()
+    db.read_flights('flights_database.csv')
+    db.read_planes('planes_database.csv')
+    db.read_tickets('tickets_database.csv')
+    assert db.book_next_free_seat('11', 1, 'economic', 1).seat_number() == 7
+    db.release_seat(db.tickets()['5'])
+    assert db.book_next_free_seat('12', 1, 'economic', 1).seat_number() == 1
+
+
+def test_database_book_next_free_seat_plane_is_full():
+    db = Database()
+    db.add_flight(Flight(1))
+    db.add_plane(Plane(1, 1, 1, 'LOT'))
+    db.book_next_free_seat('1', 1, 'business', 1)
+    with pytest.raises(NoFreeSeatsError):
+        db.book_next_free_seat('2', 1, 'business', 1)
+    assert len(db.tickets()) == 1
+
+
+def test_database_book_next_free_seat_existing_ticket():
+    db = Database()
+    db.read_flights('flights_database.csv')
+    db.read_planes('planes_database.csv')
+    db.read_tickets('tickets_database.csv')
+    with pytest.raises(TicketAlreadyExistsError):
+        db.book_next_free_seat('1', 1, 'business', 1)
+
+
+def test_database_book_next_free_seat_lacking_flight():
+    db = Database()
+    with pytest.raises(LackingFlightObjectError):
+        db.book_next_free_seat('1', 1, 'business', 1)
+
+
+def test_database_read_tickets_reseat_occupied():
+    db = Database()
+    db.read_flights('flights_database.csv')
+    db.read_planes('planes_database.csv')
+    db.book_seat(Ticket('100', 1, 'business', 1, 1))
+    invalid_rows = db.read_tickets('tickets_database.csv')
+    assert invalid_rows == {OCCUPIED_SEAT: 1}
+    assert '1' not in db.tickets()
+
+    db = Database()
+    db.read_flights('flights_database.csv')
+    db.read_planes('planes_database.csv')
+    db.book_seat(Ticket('100', 1, 'business', 1, 1))
+    invalid_rows = db.read_tickets('tickets_database.csv', True)
+    assert invalid_rows.total() == 0
+    assert db.tickets()['1'].seat_number() == 2
+
+
+def test_database_read_tickets_malformed_file(tmp_path):
+    path = tmp_path / 'tickets.csv'
+    data = 'ticket_id,plane_number,seat_class,seat_number,gate_number\n'
+    data += '1,1,business,' + 'x' * 200000 + ',1\n'
+    path.write_text(data)
+    with pytest.raises(MalformedFileError):
+        Database().read_tickets(path)
+
+
+def test_database_add_tickets_from_iterable():
+    db = Database()
+    db.read_flights('flights_database.csv')
+    db.read_planes('planes_database.csv')
+    tickets = (
+        Ticket(str(num), 1, 'economic', num, 1) for num in range(1, 6)
+    )
+    assert db.add_tickets(tickets).total() == 0
+    assert len(db.tickets()) == 5
+    tickets = [
+        Ticket('6', 1, 'economic', 1, 1),
+        Ticket('7', 99, 'economic', 1, 1)
+    ]
+    assert db.add_tickets(tickets) == {OCCUPIED_SEAT: 1, UNKNOWN_FLIGHT: 1}
+
+
+default_files = {
+    'flights': 'flights_database.csv',
+    'planes': 'planes_database.csv',
+    'tickets': 'tickets_database.csv',
+    'passengers': 'passengers_database.csv'
+}
+
+
+def test_database_read_files():
+    db = Database()
+    results = db.read_files(default_files)
+    assert all(results[kind].total() == 0 for kind in results)
+    assert list(results) == ['flights', 'planes', 'tickets', 'passengers']
+    assert len(db.flights()) == 10
+    assert len(db.planes()) == 10
+    assert len(db.tickets()) == 10
+    assert len(db.passengers()) == 10
+    assert db.planes()[1].business_seats_occupancy()[20] == 'OCCUPIED'
+    assert db.passengers()['10'].last_name() == 'Zolkiewski'
+
+
+def test_database_read_files_same_counts_as_sequential(tmp_path):
+    flights = tmp_path / 'flights.csv'
+    flights.write_text('plane_number\n1\n2\n2\n')
+    paths = dict(default_files, flights=str(flights))
+
+    sequential = Database()
+    expected = {
+        'flights': sequential.read_flights(paths['flights']),
+        'planes': sequential.read_planes(paths['planes']),
+        'tickets': sequential.read_tickets(paths['tickets']),
+        'passengers': sequential.read_passengers(paths['passengers'])
+    }
+    db = Database()
+    with ThreadPoolExecutor() as executor:
+        assert db.read_files(paths, executor) == expected
+    assert expected == {
+        'flights': {DUPLICATE_KEY: 1},
+        'planes': {UNKNOWN_FLIGHT: 8},
+        'tickets': {},
+        'passengers': {}
+    }
+
+
+def test_database_read_files_without_files(monkeypatch):
+    db = Database()
+    assert db.read_files({}) == {}
+    assert db.read_files({'schedules': 'schedules.csv'}) == {}
+    monkeypatch.setattr(database.os, 'cpu_count', lambda: 2)
+    assert database.parser_count(default_files) == 2
+    monkeypatch.setattr(database.os, 'cpu_count', lambda: None)
+    assert database.parser_count(default_files) == 1
+
+
+def test_database_read_files_missing_file():
+    db = Database()
+    paths = dict(default_files, tickets='some_database.csv')
+    with pytest.raises(FilePathNotFoundError) as error:
+        db.read_files(paths)
+    assert error.value.args == ('some_database.csv',)
+    assert len(db.planes()) == 10
+    assert len(db.tickets()) == 0
+
+
+def test_database_read_files_invalid_header():
+    db = Database()
+    paths = dict(default_files, passengers='invalid_header_test.csv')
+    with pytest.raises(InvalidFileHeaderError):
+        db.read_files(paths)
+
+
+def test_database_write_files(tmp_path):
+    for columnar_tickets in (False, True):
+        db = Database(columnar_tickets=columnar_tickets)
+        db.read_files(default_files)
+        db.book_next_free_seat('11', 2, 'business', 1)
+        paths = {
+            kind: str(tmp_path / name)
+            for kind, name in default_files.items()
+        }
+        db.write_files(paths)
+        with open(paths['tickets'], 'r') as written:
+            with open(default_files['tickets'], 'r') as original:
+                expected = original.read() + '11,2,business,1,1\n'
+                assert written.read() == expected
+
+        read_back = Database()
+        results = read_back.read_files(paths)
+        assert all(results[kind].total() == 0 for kind in results)
+        assert read_back.flights().keys() == db.flights().keys()
+        assert read_back.planes().keys() == db.planes().keys()
+        assert read_back.tickets().keys() == db.tickets().keys()
+        assert read_back.passengers().keys() == db.passengers().keys()
+        assert read_back.tickets()['11'].seat_class() == 'business'
+
+
+def test_database_write_files_failure_keeps_file(tmp_path, monkeypatch):
+    import database
+
+    def broken_writer(file_handle, passengers):
+        file_handle.write('first_name,last_name,ticket_id\n')
+        raise OSError
+
+    db = Database()
+    db.read_files(default_files)
+    path = tmp_path / 'passengers.csv'
+    path.write_text('first_name,last_name,ticket_id\nJan,Nowak,1\n')
+    monkeypatch.setattr(database, 'write_passengers_to_csv', broken_writer)
+    with pytest.raises(OSError):
+        db.write_files({'passengers': str(path)})
+    assert path.read_text() == 'first_name,last_name,ticket_id\nJan,Nowak,1\n'
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_database_columnar_tickets():
+    db = Database(columnar_tickets=True)
+    db.read_files(default_files)
+    assert isinstance(db.tickets(), TicketStore)
+    assert len(db.tickets()) == 10
+    assert db.tickets()['3'].seat_number() == 20
+    assert db.tickets()['7'].seat_class() == 'economic'
+    assert db.passengers()['3'].first_name() == 'Karolina'
+    assert db.add_ticket(Ticket('3', 1, 'economic', 100, 1)) == 1
+    db.book_next_free_seat('11', 1, 'economic', 1)
+    assert db.tickets()['11'].seat_number() == 7
+
+
+def test_database_numbers_out_of_range(tmp_path):
+    path = tmp_path / 'tickets.csv'
+    path.write_text(
+        'ticket_id,plane_number,seat_class,seat_number,gate_number\n'
+        '11,1,business,3,99999999999999999999\n'
+        '12,1,business,4,9223372036854775807\n'
+    )
+    for columnar_tickets in (False, True):
+        db = Database(columnar_tickets=columnar_tickets)
+        db.read_files(default_files)
+        rejections = db.read_tickets(path)
+        assert rejections == {INVALID_GATE_NUMBER: 1}
+        assert '11' not in db.tickets()
+        assert db.tickets()['12'].gate_number() == 2 ** 63 - 1
+        assert db.planes()[1].business_seats_occupancy()[3] == 'FREE'
+        db.save_snapshot(tmp_path / 'database.snapshot')
+
+
+def ticket_ids(tickets):
+    return [ticket.ticket_id() for ticket in tickets]
+
+
+def test_database_secondary_indexes():
+    db = Database()
+    db.read_files(default_files)
+    db.book_seat(Ticket('11', 2, 'economic', 1, 4))
+    db.book_seat(Ticket('12', 1, 'business', 2, 4))
+    assert ticket_ids(db.tickets_on_plane(1)) == [
+        str(number) for number in range(1, 11)
+    ] + ['12']
+    assert ticket_ids(db.tickets_on_plane(1, 'business')) == [
+        '1', '2', '3', '4', '12'
+    ]
+    assert ticket_ids(db.tickets_on_plane(2)) == ['11']
+    assert ticket_ids(db.tickets_on_plane(2, 'business')) == []
+    assert ticket_ids(db.tickets_on_plane(3)) == []
+    assert ticket_ids(db.tickets_at_gate(4)) == ['11', '12']
+
+
+def test_database_secondary_indexes_release_seat():
+    db = Database()
+    db.read_files(default_files)
+    db.release_seat(db.tickets()['1'])
+    assert '1' not in ticket_ids(db.tickets_on_plane(1))
+    assert '1' not in ticket_ids(db.tickets_at_gate(1))
+    assert len(db.tickets_on_plane(1, 'business')) == 3
+
+
+def test_database_secondary_indexes_changed_seat():
+    db = Database()
+    db.read_files(default_files)
+    ticket = db.tickets()['1']
+    old_ticket = Ticket('1', 1, 'business', 1, 1)
+    ticket.set_seat_class('economic')
+    ticket.set_seat_number(100)
+    db.book_seat(ticket)
+    db.release_seat(old_ticket)
+    assert '1' not in ticket_ids(db.tickets_on_plane(1, 'business'))
+    assert '1' in ticket_ids(db.tickets_on_plane(1, 'economic'))
+    assert '1' in ticket_ids(db.tickets_at_gate(1))
+
+
+def test_database_secondary_indexes_after_snapshot(tmp_path):
+    db = Database()
+    db.read_files(default_files)
+    db.save_snapshot(tmp_path / 'database.snapshot')
+    db = Database(columnar_tickets=True)
+    db.load_snapshot(tmp_path / 'database.snapshot')
+    assert len(db.tickets_on_plane(1, 'economic')) == 6
+    assert len(db.tickets_at_gate(1)) == 10
+
+
+def passenger_ids(passengers):
+    return [person.ticket_id() for person in passengers]
+
+
+def test_database_find_passengers():
+    db = Database()
+    db.read_files(default_files)
+    assert sorted(passenger_ids(db.find_passengers('kowal'))) == ['3', '4']
+    assert sorted(passenger_ids(db.find_passengers('Jan'))) == ['4', '9']
+    assert passenger_ids(db.find_passengers('jan ch')) == ['9']
+    assert db.find_passengers('nobody') == []
+
+
+def test_database_find_passengers_fuzzy():
+    db = Database()
+    db.read_files(default_files)
+    assert passenger_ids(db.find_passengers_fuzzy('Jan Kowalsky')) == ['4']
+    assert passenger_ids(db.find_passengers_fuzzy('Zolkiewsky', 1)) == ['10']
+    assert db.find_passengers_fuzzy('Zolkiewsky', 0) == []
+
+
+def test_database_find_passengers_after_snapshot(tmp_path):
+    db = Database()
+    db.read_files(default_files)
+    db.save_snapshot(tmp_path / 'database.snapshot')
+    db = Database()
+    db.load_snapshot(tmp_path / 'database.snapshot')
+    assert passenger_ids(db.find_passengers('croft lara')) == ['1']
+
+
+def create_database_with_tickets():
+    db = Database()
+    db.read_files(default_files)
+    return db
+
+
+def test_database_book_tickets_bulk():
+    db = create_database_with_tickets()
+    tickets = [
+        Ticket('11', 2, 'economic', 1, 2),
+        Ticket('12', 2, 'economic', 2, 2),
+        Ticket('13', 2, 'business', 1, 2)
+    ]
+    report = db.book_tickets_bulk(tickets)
+    assert report.committed()
+    assert report.conflicts() == []
+    assert report.booked() == tickets
+    assert db.tickets()['12'] is tickets[1]
+    assert db.planes()[2].economic_seats_occupancy()[2] == 'OCCUPIED'
+    assert db.planes()[2].business_seats_occupancy()[1] == 'OCCUPIED'
+    assert ticket_ids(db.tickets_on_plane(2)) == ['11', '12', '13']
+
+
+def test_database_book_tickets_bulk_conflicts():
+    db = create_database_with_tickets()
+    tickets = [
+        Ticket('1', 2, 'economic', 1, 2),
+        Ticket('11', 99, 'economic', 1, 2),
+        Ticket('12', 1, 'business', 1, 1),
+        Ticket('13', 2, 'economic', 101, 2),
+        Ticket('14', 2, 'economic', 5, 2),
+        Ticket('15', 2, 'economic', 5, 2),
+        Ticket('14', 2, 'economic', 6, 2),
+        Ticket('16', 2, 'economic', 7, 2)
+    ]
+    report = db.book_tickets_bulk(tickets)
+    assert report.committed()
+    assert ticket_ids(report.booked()) == ['14', '16']
+    assert [
+        (ticket.ticket_id(), reason) for ticket, reason in report.conflicts()
+    ] == [
+        ('1', DUPLICATE_KEY),
+        ('11', UNKNOWN_FLIGHT),
+        ('14', DUPLICATE_KEY),
+        ('12', OCCUPIED_SEAT),
+        ('13', INVALID_SEAT_NUMBER),
+        ('15', OCCUPIED_SEAT)
+    ]
+    assert db.tickets()['1'].plane_number() == 1
+    assert db.planes()[2].economic_seats_occupancy().occupied_mask() == \
+        0b1010000
+
+
+def test_database_book_tickets_bulk_all_or_nothing():
+    db = create_database_with_tickets()
+    tickets = [
+        Ticket('11', 2, 'economic', 1, 2),
+        Ticket('12', 1, 'business', 1, 1)
+    ]
+    report = db.book_tickets_bulk(tickets, all_or_nothing=True)
+    assert not report.committed()
+    assert report.booked() == []
+    assert len(report.conflicts()) == 1
+    assert '11' not in db.tickets()
+    assert db.planes()[2].economic_seats_occupancy()[1] == 'FREE'
+
+
+def test_database_book_tickets_bulk_all_or_nothing_valid():
+    db = create_database_with_tickets()
+    report = db.book_tickets_bulk(
+        [Ticket('11', 2, 'economic', 1, 2)],
+        all_or_nothing=True
+    )
+    assert report.committed()
+    assert '11' in db.tickets()
+
+
+def test_database_book_tickets_bulk_unchecked_tickets():
+    db = Database(columnar_tickets=True)
+    db.read_files(default_files)
+    occupied = db.planes()[2].business_seats_occupancy().occupied_mask()
+    tickets = [
+        Ticket('11', 2, 'business', 1, 2),
+        Ticket.from_checked('12', 2, 'business', 2, 2 ** 64),
+        Ticket('13', 2, 'business', 3, 2)
+    ]
+    report = db.book_tickets_bulk(tickets)
+    assert ticket_ids(report.booked()) == ['11', '13']
+    assert report.conflicts() == [(tickets[1], INVALID_GATE_NUMBER)]
+    assert '12' not in db.tickets()
+    assert db.planes()[2].business_seats_occupancy().occupied_mask() == \
+        occupied | 0b101
+
+
+def test_database_add_tickets_counts_seats_out_of_range():
+    db = create_database_with_tickets()
+    invalid_rows = db.add_tickets([
+        Ticket('11', 2, 'business', 26, 2),
+        Ticket('12', 2, 'business', 25, 2)
+    ])
+    assert invalid_rows == {INVALID_SEAT_NUMBER: 1}
+    assert '12' in db.tickets()
+
+
+def test_database_add_tickets_huge_seat_numbers():
+    db = create_database_with_tickets()
+    invalid_rows = db.add_tickets([
+        Ticket('11', 2, 'economic', 2 * 10 ** 9, 2),
+        Ticket('12', 2, 'economic', 10 ** 18, 2),
+        Ticket('13', 2, 'economic', 50, 2)
+    ])
+    assert invalid_rows == {INVALID_SEAT_NUMBER: 2}
+    assert list(db.tickets_on_plane(2, 'economic'))[-1].ticket_id() == '13'
+
+
+def test_database_add_tickets_in_batches(monkeypatch):
+    db = create_database_with_tickets()
+    batch_sizes = []
+    book_tickets_batch = db._book_tickets_batch
+
+    def recording_book_tickets_batch(tickets, **options):
+        batch_sizes.append(len(tickets))
+        return book_tickets_batch(tickets, **options)
+
+    monkeypatch.setattr(database, 'TICKETS_BATCH_SIZE', 2)
+    monkeypatch.setattr(
+        db,
+        '_book_tickets_batch',
+        recording_book_tickets_batch
+    )
+    tickets = (
+        Ticket(str(num), 2, 'economic', num % 4 + 50, 1)
+        for num in range(11, 16)
+    )
+    assert db.add_tickets(tickets) == {OCCUPIED_SEAT: 1}
+    assert batch_sizes == [2, 2, 1]
+    assert db.tickets()['14'].seat_number() == 52
+    assert '15' not in db.tickets()
+
+
+def test_database_read_counts_rejection_reasons(tmp_path):
+    flights = tmp_path / 'flights.csv'
+    flights.write_text('gate,plane_number\n1\n0,x\n0,-1\n\n0,2\n0,2\n')
+    db = Database()
+    rejections = db.read_flights(flights)
+    assert isinstance(rejections, RejectionCounts)
+    assert rejections == {
+        MALFORMED_ROW: 1,
+        INVALID_PLANE_NUMBER: 2,
+        DUPLICATE_KEY: 1
+    }
+    assert rejections.total() == 4
+    assert list(db.flights()) == [2]
+
+
+def test_database_read_files_counts_rejection_reasons(tmp_path):
+    tickets = tmp_path / 'tickets.csv'
+    data = 'ticket_id,plane_number,seat_class,seat_number,gate_number\n'
+    data += '1,1,business,1,1\n'
+    data += '2,1,business,0,1\n'
+    data += '3,1,business,1,1\n'
+    tickets.write_text(data)
+    paths = dict(default_files, tickets=str(tickets))
+    db = Database()
+    with ThreadPoolExecutor() as executor:
+        results = db.read_files(paths, executor)
+    assert results['tickets'] == {INVALID_SEAT_NUMBER: 1, OCCUPIED_SEAT: 1}
+    assert results['passengers'] == {UNKNOWN_TICKET: 9}
+
+
+def test_database_read_tickets_with_report(tmp_path):
+    tickets = tmp_path / 'tickets.csv'
+    data = 'ticket_id,plane_number,seat_class,seat_number,gate_number\n'
+    data += '11,1,business,1,1\n'
+    data += '12,1,business,0,1\n'
+    data += '13,99,business,2,1\n'
+    data += '14,1,business,2,1\n'
+    data += '1,1,business,3,1\n'
+    tickets.write_text(data)
+    db = create_database_with_tickets()
+    report_file = StringIO()
+    report = ImportReport(report_file)
+    rejections = db.read_tickets(tickets, report=report)
+    assert rejections == {
+        OCCUPIED_SEAT: 1,
+        INVALID_SEAT_NUMBER: 1,
+        UNKNOWN_FLIGHT: 1,
+        DUPLICATE_KEY: 1
+    }
+    records = [
+        json.loads(line) for line in report_file.getvalue().splitlines()
+    ]
+    assert [(record['line'], record['reason']) for record in records] == [
+        (2, OCCUPIED_SEAT),
+        (3, INVALID_SEAT_NUMBER),
+        (4, UNKNOWN_FLIGHT),
+        (6, DUPLICATE_KEY)
+    ]
+    assert records[0]['source'] == str(tickets)
+    assert records[0]['row'] == ['11', '1', 'business', '1', '1']
+    assert '14' in db.tickets()
+
+
+def test_database_read_files_with_report(tmp_path):
+    flights = tmp_path / 'flights.csv'
+    flights.write_text('plane_number\n1\n2\n2\nx\n')
+    paths = dict(default_files, flights=str(flights))
+    report_file = StringIO()
+    db = Database()
+    results = db.read_files(paths, report=ImportReport(report_file))
+    assert results == Database().read_files(paths)
+    lines = report_file.getvalue().splitlines()
+    assert len(lines) == sum(counts.total() for counts in results.values())
+    assert json.loads(lines[0])['line'] == 4
+    assert len(db.tickets()) == 10
+
+
+def test_database_change_seat():
+    db = create_database_with_tickets()
+    ticket = db.change_seat('1', 'economic', 30)
+    assert ticket.seat_class() == 'economic'
+    assert ticket.seat_number() == 30
+    assert db.tickets()['1'] is ticket
+    assert db.planes()[1].business_seats_occupancy()[1] == 'FREE'
+    assert db.planes()[1].economic_seats_occupancy()[30] == 'OCCUPIED'
+    assert '1' in ticket_ids(db.tickets_on_plane(1, 'economic'))
+    assert '1' not in ticket_ids(db.tickets_on_plane(1, 'business'))
+
+
+def test_database_change_seat_columnar():
+    db = Database(columnar_tickets=True)
+    db.read_files(default_files)
+    db.change_seat('1', 'business', 2)
+    assert db.tickets()['1'].seat_number() == 2
+    assert db.planes()[1].business_seats_occupancy()[1] == 'FREE'
+
+
+def test_database_change_seat_same_seat():
+    db = create_database_with_tickets()
+    ticket = db.tickets()['1']
+    assert db.change_seat('1', 'business', 1) is ticket
+    assert db.planes()[1].business_seats_occupancy()[1] == 'OCCUPIED'
+
+
+def test_database_change_seat_rejected():
+    db = create_database_with_tickets()
+    with pytest.raises(ChosenSeatIsOccupied):
+        db.change_seat('1', 'business', 10)
+    with pytest.raises(InvalidSeatNumber):
+        db.change_seat('1', 'business', 500)
+    with pytest.raises(ChosenPassengerDoesNotExist):
+        db.change_seat('11', 'business', 2)
+    assert db.tickets()['1'].seat_number() == 1
+    assert db.planes()[1].business_seats_occupancy()[1] == 'OCCUPIED'
+    assert db.planes()[1].business_seats_occupancy()[10] == 'OCCUPIED'
+
+
+def test_database_plane_lock():
+    db = create_database_with_tickets()
+    assert db.plane_lock(1) is db.plane_lock(1)
+    assert db.plane_lock(1) is not db.plane_lock(2)
+
+
+def test_database_concurrent_booking_no_double_bookings():
+    db = Database()
+    db.add_flight(Flight(1))
+    db.add_plane(Plane(1, 20, 20, 'LOT'))
+    seats = [
+        (seat_class, seat_num)
+        for seat_class in ('business', 'economic')
+        for seat_num in range(1, 21)
+    ]
+
+    def book(desk):
+        booked = []
+        for index, (seat_class, seat_num) in enumerate(seats * 5):
+            ticket = Ticket(f'{desk}-{index}', 1, seat_class, seat_num, 1)
+            try:
+                db.book_seat(ticket)
+            except ChosenSeatIsOccupied:
+                continue
+            booked.append(ticket.ticket_id())
+            if index % 3 == 0:
+                db.release_seat(db.tickets().pop(ticket.ticket_id()))
+                booked.pop()
+            elif index % 3 == 1:
+                try:
+                    db.change_seat(ticket.ticket_id(), 'economic', 20)
+                except ChosenSeatIsOccupied:
+                    pass
+        return booked
+
+    with ThreadPoolExecutor(8) as executor:
+        booked = sum(executor.map(book, range(8)), [])
+    held = [
+        (ticket.seat_class(), ticket.seat_number())
+        for ticket in db.tickets().values()
+    ]
+    assert len(held) == len(set(held)) == len(booked)
+    plane = db.planes()[1]
+    for seat_class, seat_num in seats:
+        occupied = plane.seats_occupancy(seat_class)[seat_num] == 'OCCUPIED'
+        assert occupied == ((seat_class, seat_num) in held)
+
+
+def test_database_change_seats():
+    db = create_database_with_tickets()
+    tickets = [
+        Ticket('1', 1, 'business', 10, 1),
+        Ticket('2', 1, 'business', 1, 1),
+        Ticket('5', 2, 'economic', 1, 1)
+    ]
+    report = db.change_seats(tickets)
+    assert report.committed()
+    assert report.conflicts() == []
+    assert report.booked() == tickets
+    assert db.tickets()['1'].seat_number() == 10
+    assert db.tickets()['2'].seat_number() == 1
+    assert db.tickets()['5'].plane_number() == 2
+    assert db.planes()[1].business_seats_occupancy()[1] == 'OCCUPIED'
+    assert db.planes()[1].business_seats_occupancy()[10] == 'OCCUPIED'
+    assert db.planes()[1].economic_seats_occupancy()[1] == 'FREE'
+    assert db.planes()[2].economic_seats_occupancy()[1] == 'OCCUPIED'
+    assert '5' in ticket_ids(db.tickets_on_plane(2))
+    assert '5' not in ticket_ids(db.tickets_on_plane(1))
+
+
+def test_database_change_seats_conflicts():
+    db = create_database_with_tickets()
+    tickets = [
+        Ticket('11', 1, 'business', 2, 1),
+        Ticket('1', 1, 'business', 10, 1),
+        Ticket('1', 1, 'business', 3, 1),
+        Ticket('3', 1, 'business', 500, 1),
+        Ticket('4', 1, 'business', 4, 1)
+    ]
+    report = db.change_seats(tickets)
+    assert report.committed()
+    assert report.conflicts() == [
+        (tickets[0], UNKNOWN_TICKET),
+        (tickets[2], DUPLICATE_KEY),
+        (tickets[3], INVALID_SEAT_NUMBER),
+        (tickets[1], OCCUPIED_SEAT)
+    ]
+    assert report.booked() == [tickets[4]]
+    assert db.tickets()['1'].seat_number() == 1
+    assert db.tickets()['4'].seat_number() == 4
+
+
+def test_database_change_seats_rejection_blocks_swap():
+    db = create_database_with_tickets()
+    occupancy = db.planes()[1].business_seats_occupancy()
+    tickets = [
+        Ticket('1', 1, 'business', 10, 1),
+        Ticket('2', 1, 'business', 20, 1)
+    ]
+    report = db.change_seats(tickets)
+    assert report.conflicts() == [
+        (tickets[1], OCCUPIED_SEAT),
+        (tickets[0], OCCUPIED_SEAT)
+    ]
+    assert report.booked() == []
+    assert db.tickets()['1'].seat_number() == 1
+    assert occupancy[1] == 'OCCUPIED'
+
+
+def test_database_change_seats_all_or_nothing():
+    db = create_database_with_tickets()
+    tickets = [
+        Ticket('1', 1, 'business', 40, 1),
+        Ticket('2', 1, 'business', 500, 1)
+    ]
+    report = db.change_seats(tickets, all_or_nothing=True)
+    assert not report.committed()
+    assert db.tickets()['1'].seat_number() == 1
+    assert db.planes()[1].business_seats_occupancy()[40] == 'FREE'
+
+
+def test_database_change_seats_other_plane_ends_assistance():
+    db = create_database_with_tickets()
+    db.ask_for_assistance(db.tickets()['5'])
+    db.change_seats([Ticket('5', 2, 'economic', 1, 1)])
+    assert db.planes()[1].busy_assistnats() == set()
+
+
+def test_database_reassign_plane():
+    db = create_database_with_tickets()
+    db.ask_for_assistance(db.tickets()['1'])
+    new_plane = Plane(1, 6, 15, 'LOT')
+    report = db.reassign_plane(new_plane)
+    assert report.committed()
+    assert ticket_ids(report.booked()) == ['3', '4']
+    assert db.planes()[1] is new_plane
+    assert db.tickets()['1'].seat_number() == 1
+    assert db.tickets()['2'].seat_number() == 10
+    assert db.tickets()['3'].seat_number() == 2
+    assert db.tickets()['4'].seat_number() == 3
+    assert db.tickets()['10'].seat_number() == 6
+    assert new_plane.business_seats_occupancy().occupied_seats_number() == 4
+    assert new_plane.economic_seats_occupancy().free_seats_number() == 0
+    assert new_plane.busy_assistnats() == {'1'}
+    assert len(db.tickets_on_plane(1)) == 10
+
+
+def test_database_reassign_plane_not_enough_seats():
+    db = create_database_with_tickets()
+    old_plane = db.planes()[1]
+    report = db.reassign_plane(Plane(1, 5, 50, 'LOT'))
+    assert ticket_ids(ticket for ticket, _ in report.conflicts()) == ['10']
+    assert not report.committed()
+    assert report.conflicts_by_reason() == {NO_FREE_SEAT: 1}
+    assert db.planes()[1] is old_plane
+    assert db.tickets()['10'].seat_number() == 6
+
+
+def test_database_reassign_plane_unknown_flight():
+    db = create_database_with_tickets()
+    with pytest.raises(LackingFlightObjectError):
+        db.reassign_plane(Plane(100, 5, 5, 'LOT'))
+
+
+def test_database_change_seat_after_release():
+    db = Database()
+    db.add_flight(Flight(1))
+    db.add_plane(Plane(1, 10, 2, 'LOT'))
+    db.book_seat(Ticket('A', 1, 'economic', 1, 1))
+    db.release_seat(db.tickets()['A'])
+    db.book_seat(Ticket('B', 1, 'economic', 1, 1))
+    assert db.change_seat('A', 'economic', 5).seat_number() == 5
+    occupancy = db.planes()[1].economic_seats_occupancy()
+    assert occupancy[1] == 'OCCUPIED'
+    assert occupancy[5] == 'OCCUPIED'
+    with pytest.raises(ChosenSeatIsOccupied):
+        db.book_seat(Ticket('C', 1, 'economic', 1, 1))
+
+
+def test_database_change_seat_after_release_and_snapshot(tmp_path):
+    path = tmp_path / 'database.snapshot'
+    db = Database()
+    db.add_flight(Flight(1))
+    db.add_plane(Plane(1, 200, 2, 'LOT'))
+    db.book_seat(Ticket('A', 1, 'economic', 100, 1))
+    db.release_seat(db.tickets()['A'])
+    db.book_seat(Ticket('B', 1, 'economic', 100, 1))
+    db.save_snapshot(path)
+    db = Database()
+    db.load_snapshot(path)
+    assert ticket_ids(db.tickets_on_plane(1)) == ['B']
+    assert db.change_seat('A', 'economic', 101).seat_number() == 101
+    occupancy = db.planes()[1].economic_seats_occupancy()
+    assert occupancy[100] == 'OCCUPIED'
+    assert occupancy[101] == 'OCCUPIED'
+    assert ticket_ids(db.tickets_on_plane(1)) == ['B', 'A']
+    with pytest.raises(ChosenSeatIsOccupied):
+        db.book_seat(Ticket('C', 1, 'economic', 100, 1))
@@ -1,4 +1,5 @@
 from flight import Flight
+from rejections import INVALID_PLANE_NUMBER
 from errors import InvalidPlaneNumber
 import pytest
 
@@ -21,3 +22,19 @@ def test_flight_plane_number_is_negative():
 def test_flight_str():
     fl = Flight(456)
     assert str(fl) == 'Flight: plane number: 456'
+
+
+def test_flight_rejection_reason():
+    assert Flight.rejection_reason(12) is None
+    assert Flight.rejection_reason(0) == INVALID_PLANE_NUMBER
+    assert Flight.rejection_reason('12') == INVALID_PLANE_NUMBER
+    assert Flight.rejection_reason(None) == INVALID_PLANE_NUMBER
+
+
+def test_flight_from_checked():
+    assert Flight.from_checked(12).plane_number() == 12
+
+
+def test_flight_invalid_type():
+    with pytest.raises(InvalidPlaneNumber):
+        Flight(None)
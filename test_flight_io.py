@@ -1,4 +1,4 @@
-from flight_io import read_flights_from_csv
+from flight_io import read_flights_from_csv, write_flights_to_csv
 from errors import InvalidKeyInFlightsFile
 from io import StringIO
 import pytest
@@ -52,3 +52,12 @@ def test_read_passengers_from_csv_invalid_row():
     file_handle = StringIO(data)
     with pytest.raises(InvalidKeyInFlightsFile):
         read_flights_from_csv(file_handle)
+
+
+def test_write_flights_to_csv():
+    with open('flights_database.csv', 'r') as file_handle:
+        flights = read_flights_from_csv(file_handle)
+    file_handle = StringIO(newline='')
+    write_flights_to_csv(file_handle, flights.values())
+    file_handle.seek(0)
+    assert read_flights_from_csv(file_handle).keys() == flights.keys()
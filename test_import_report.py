@@ -0,0 +1,60 @@
+from import_report import ImportReport, open_import_report
+from rejections import DUPLICATE_KEY, MALFORMED_ROW
+from io import StringIO
+import csv
+import json
+import pytest
+
+
+def test_import_report_jsonl():
+    file_handle = StringIO()
+    report = ImportReport(file_handle)
+    report.set_source('flights.csv')
+    report.reject(DUPLICATE_KEY, 3, ['1'])
+    report.reject(MALFORMED_ROW, 5, [])
+    records = [
+        json.loads(line) for line in file_handle.getvalue().splitlines()
+    ]
+    assert records == [
+        {
+            'source': 'flights.csv',
+            'line': 3,
+            'reason': DUPLICATE_KEY,
+            'row': ['1']
+        },
+        {
+            'source': 'flights.csv',
+            'line': 5,
+            'reason': MALFORMED_ROW,
+            'row': []
+        }
+    ]
+    assert report.counts() == {DUPLICATE_KEY: 1, MALFORMED_ROW: 1}
+
+
+def test_import_report_csv():
+    file_handle = StringIO()
+    report = ImportReport(file_handle, 'csv')
+    report.set_source('tickets.csv')
+    report.reject(DUPLICATE_KEY, 2, ['1', '1', 'business', '1', '1'])
+    rows = list(csv.reader(StringIO(file_handle.getvalue())))
+    assert rows == [
+        ['source', 'line', 'reason', 'row'],
+        ['tickets.csv', '2', DUPLICATE_KEY, '1', '1', 'business', '1', '1']
+    ]
+
+
+def test_import_report_invalid_format():
+    with pytest.raises(ValueError):
+        ImportReport(StringIO(), 'xml')
+
+
+def test_open_import_report(tmp_path):
+    with open_import_report(tmp_path / 'report.jsonl') as report:
+        report.reject(DUPLICATE_KEY, 2, ['1'])
+    with open_import_report(tmp_path / 'report.csv') as report:
+        report.reject(DUPLICATE_KEY, 2, ['1'])
+    data = (tmp_path / 'report.jsonl').read_text()
+    assert json.loads(data)['line'] == 2
+    data = (tmp_path / 'report.csv').read_text()
+    assert data.splitlines()[1] == f',2,{DUPLICATE_KEY},1'
@@ -0,0 +1,184 @@
+from incremental_loader import IncrementalLoader
+import incremental_loader
+from rejections import DUPLICATE_KEY
+from errors import FilePathNotFoundError
+import os
+import shutil
+import pytest
+
+
+default_files = {
+    'flights': 'flights_database.csv',
+    'planes': 'planes_database.csv',
+    'tickets': 'tickets_database.csv',
+    'passengers': 'passengers_database.csv'
+}
+
+
+def copy_default_files(directory):
+    paths = {}
+    for kind, name in default_files.items():
+        paths[kind] = str(directory / name)
+        shutil.copy(name, paths[kind])
+    return paths
+
+
+def append(path, data):
+    with open(path, 'a') as file_handle:
+        file_handle.write(data)
+
+
+def test_incremental_loader_first_reload(tmp_path):
+    loader = IncrementalLoader(copy_default_files(tmp_path))
+    results = loader.reload()
+    assert all(results[kind].total() == 0 for kind in results)
+    assert loader.reloaded_fully()
+    assert len(loader.database().tickets()) == 10
+    assert len(loader.database().passengers()) == 10
+
+
+def test_incremental_loader_applies_appended_rows(tmp_path):
+    paths = copy_default_files(tmp_path)
+    loader = IncrementalLoader(paths)
+    loader.reload()
+    database = loader.database()
+    append(paths['tickets'], '11,1,economic,7,2\n1,1,economic,8,2\n')
+    append(paths['passengers'], 'Jan,Nowak,11\n')
+    results = loader.reload()
+    assert not loader.reloaded_fully()
+    assert loader.database() is database
+    assert results['tickets'] == {DUPLICATE_KEY: 1}
+    assert results['passengers'].total() == 0
+    assert database.tickets()['11'].seat_number() == 7
+    assert database.passengers()['11'].last_name() == 'Nowak'
+    assert database.planes()[1].economic_seats_occupancy()[7] == 'OCCUPIED'
+
+
+def test_incremental_loader_nothing_appended(tmp_path):
+    loader = IncrementalLoader(copy_default_files(tmp_path))
+    loader.reload()
+    results = loader.reload()
+    assert not loader.reloaded_fully()
+    assert all(results[kind].total() == 0 for kind in results)
+    assert len(loader.database().tickets()) == 10
+
+
+def test_incremental_loader_waits_for_complete_line(tmp_path):
+    paths = copy_default_files(tmp_path)
+    loader = IncrementalLoader(paths)
+    loader.reload()
+    append(paths['tickets'], '11,1,economic,7')
+    loader.reload()
+    assert '11' not in loader.database().tickets()
+    append(paths['tickets'], ',2\n')
+    loader.reload()
+    assert loader.database().tickets()['11'].gate_number() == 2
+
+
+def test_incremental_loader_truncated_file(tmp_path):
+    paths = copy_default_files(tmp_path)
+    loader = IncrementalLoader(paths)
+    loader.reload()
+    database = loader.database()
+    with open(paths['tickets'], 'w') as file_handle:
+        file_handle.write(
+            'ticket_id,plane_number,seat_class,seat_number,gate_number\n'
+            '1,1,business,1,1\n'
+        )
+    loader.reload()
+    assert loader.reloaded_fully()
+    assert loader.database() is not database
+    assert list(loader.database().tickets()) == ['1']
+    assert list(loader.database().passengers()) == ['1']
+
+
+def test_incremental_loader_rewritten_file(tmp_path):
+    paths = copy_default_files(tmp_path)
+    loader = IncrementalLoader(paths)
+    loader.reload()
+    with open(paths['passengers'], 'r') as file_handle:
+        data = file_handle.read()
+    data = data.replace('Lara,Croft', 'Lara,Kroft')
+    replacement = tmp_path / 'passengers.tmp'
+    replacement.write_text(data + 'Jan,Nowak,11\n')
+    os.replace(replacement, paths['passengers'])
+    loader.reload()
+    assert loader.reloaded_fully()
+    assert loader.database().passengers()['1'].last_name() == 'Kroft'
+
+
+def test_incremental_loader_changed_in_place(tmp_path):
+    paths = copy_default_files(tmp_path)
+    loader = IncrementalLoader(paths)
+    loader.reload()
+    with open(paths['passengers'], 'r+') as file_handle:
+        data = file_handle.read()
+        file_handle.seek(0)
+        file_handle.write(data.replace('Stefan', 'Stefek'))
+    loader.reload()
+    assert loader.reloaded_fully()
+    assert loader.database().passengers()['10'].first_name() == 'Stefek'
+
+
+def test_incremental_loader_changed_in_the_tail(tmp_path):
+    paths = copy_default_files(tmp_path)
+    with open(paths['tickets'], 'a') as file_handle:
+        file_handle.write('11,1,economic,invalid seat,1\n' * 500)
+    loader = IncrementalLoader(paths)
+    loader.reload()
+    with open(paths['tickets'], 'r+') as file_handle:
+        data = file_handle.read()
+        file_handle.seek(0)
+        file_handle.write(data.replace(
+            '\n2,1,business,10,1',
+            '\n2,1,business,10,2'
+        ))
+    assert os.path.getsize(paths['tickets']) == len(data)
+    loader.reload()
+    assert loader.reloaded_fully()
+    assert loader.database().tickets()['2'].gate_number() == 2
+
+
+def test_incremental_loader_compares_only_tail(tmp_path, monkeypatch):
+    monkeypatch.setattr(incremental_loader, 'TAIL_SIZE', 64)
+    paths = copy_default_files(tmp_path)
+    loader = IncrementalLoader(paths)
+    loader.reload()
+    with open(paths['tickets'], 'r+') as file_handle:
+        data = file_handle.read()
+        file_handle.seek(0)
+        file_handle.write(data.replace(
+            '\n2,1,business,10,1',
+            '\n2,1,business,10,2'
+        ))
+    loader.reload()
+    assert not loader.reloaded_fully()
+    assert loader.database().tickets()['2'].gate_number() == 1
+    with open(paths['tickets'], 'r+') as file_handle:
+        file_handle.write(data.replace(
+            '\n10,',
+            '\n12,'
+        ))
+    loader.reload()
+    assert loader.reloaded_fully()
+    assert '12' in loader.database().tickets()
+
+
+def test_incremental_loader_touched_file(tmp_path):
+    paths = copy_default_files(tmp_path)
+    loader = IncrementalLoader(paths)
+    loader.reload()
+    database = loader.database()
+    os.utime(paths['tickets'], ns=(1, 1))
+    loader.reload()
+    assert not loader.reloaded_fully()
+    assert loader.database() is database
+
+
+def test_incremental_loader_missing_file(tmp_path):
+    paths = copy_default_files(tmp_path)
+    loader = IncrementalLoader(paths)
+    loader.reload()
+    os.remove(paths['flights'])
+    with pytest.raises(FilePathNotFoundError):
+        loader.reload()
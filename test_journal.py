@@ -0,0 +1,258 @@
+from journal import Journal, replay_record
+from database import Database
+from flight import Flight
+from passenger import Passenger
+from plane import Plane
+from ticket import Ticket
+from errors import (
+    ChosenSeatIsOccupied,
+    FilePathNotFoundError,
+    MalformedFileError
+)
+import json
+import os
+import shutil
+import pytest
+
+
+default_files = {
+    'flights': 'flights_database.csv',
+    'planes': 'planes_database.csv',
+    'tickets': 'tickets_database.csv',
+    'passengers': 'passengers_database.csv'
+}
+
+
+def make_changes(database):
+    database.add_flight(Flight(1))
+    database.add_plane(Plane(1, 10, 5, 'lot'))
+    database.add_ticket(Ticket('1', 1, 'economic', 1, 2))
+    database.book_seat(Ticket('2', 1, 'business', 2, 2))
+    database.book_next_free_seat('3', 1, 'economic', 2)
+    database.add_passenger(Passenger('Jan', 'Nowak', '1'))
+    database.change_seat('1', 'economic', 7)
+    database.ask_for_assistance(database.tickets()['1'])
+    database.ask_for_assistance(database.tickets()['2'])
+    database.thank_for_assistance(database.tickets()['2'])
+    database.release_seat(database.tickets()['3'])
+
+
+def assert_changed(database):
+    plane = database.planes()[1]
+    assert list(database.flights()) == [1]
+    assert plane.carrier() == 'LOT'
+    assert database.tickets()['1'].seat_number() == 7
+    assert database.tickets()['2'].seat_class() == 'business'
+    assert database.passengers()['1'].last_name() == 'Nowak'
+    assert database.find_passengers('nowak')[0].ticket_id() == '1'
+    assert plane.busy_assistnats() == {'1'}
+    assert plane.economic_seats_occupancy().occupied_mask() == 1 << 6
+    assert plane.business_seats_occupancy().occupied_mask() == 1 << 1
+
+
+def test_journal_recover_replays_changes(tmp_path):
+    path = tmp_path / 'database.journal'
+    database = Database()
+    journal = Journal(path)
+    assert journal.recover(database) == 0
+    assert database.journal() is journal
+    make_changes(database)
+    assert journal.records() == 11
+    journal.close()
+
+    recovered = Database()
+    journal = Journal(path)
+    assert journal.recover(recovered) == 11
+    assert_changed(recovered)
+    journal.close()
+
+
+def test_journal_does_not_record_failed_changes(tmp_path):
+    path = tmp_path / 'database.journal'
+    database = Database()
+    journal = Journal(path)
+    journal.recover(database)
+    database.add_flight(Flight(1))
+    database.add_flight(Flight(1))
+    database.add_plane(Plane(1, 10, 5, 'LOT'))
+    database.book_seat(Ticket('1', 1, 'economic', 1, 2))
+    with pytest.raises(ChosenSeatIsOccupied):
+        database.book_seat(Ticket('2', 1, 'economic', 1, 2))
+    assert journal.records() == 3
+    journal.close()
+
+
+def test_journal_drops_incomplete_line(tmp_path):
+    path = tmp_path / 'database.journal'
+    database = Database()
+    journal = Journal(path)
+    journal.recover(database)
+    database.add_flight(Flight(1))
+    journal.close()
+    with open(path, 'ab') as file_handle:
+        file_handle.write(b'["add_flight",')
+    recovered = Database()
+    journal = Journal(path)
+    assert journal.recover(recovered) == 1
+    assert list(recovered.flights()) == [1]
+    recovered.add_flight(Flight(2))
+    journal.close()
+    recovered = Database()
+    assert Journal(path).recover(recovered) == 2
+    assert list(recovered.flights()) == [1, 2]
+
+
+def test_journal_records_objects_read_from_files(tmp_path):
+    path = tmp_path / 'database.journal'
+    paths = {}
+    for kind, name in default_files.items():
+        paths[kind] = str(tmp_path / name)
+        shutil.copy(name, paths[kind])
+    database = Database()
+    journal = Journal(path)
+    journal.recover(database)
+    database.read_files(paths)
+    with pytest.raises(FilePathNotFoundError):
+        database.read_flights(tmp_path / 'missing.csv')
+    database.change_seat('1', 'business', 2)
+    database.book_seat(Ticket('11', 2, 'economic', 5, 3))
+    journal.close()
+    with open(paths['tickets'], 'a') as file_handle:
+        file_handle.write('12,2,economic,5,3\n')
+    recovered = Database()
+    assert Journal(path).recover(recovered) == 6
+    assert not os.path.exists(journal.base_path())
+    assert len(recovered.tickets()) == 11
+    assert recovered.tickets()['1'].seat_number() == 2
+    assert recovered.tickets()['11'].seat_number() == 5
+
+
+def test_journal_records_only_accepted_rows(tmp_path):
+    path = tmp_path / 'database.journal'
+    tickets_path = tmp_path / 'tickets.csv'
+    tickets_path.write_text(
+        'ticket_id,plane_number,seat_class,seat_number,gate_number\n'
+        '1,1,economic,1,99999999999999999999\n'
+        '2,1,economic,2,3\n'
+    )
+    database = Database(columnar_tickets=False)
+    journal = Journal(path)
+    journal.recover(database)
+    database.add_flights([Flight(1)])
+    database.add_planes([Plane(1, 10, 5, 'LOT')])
+    rejections = database.read_tickets(tickets_path)
+    assert rejections.total() == 1
+    journal.close()
+    recovered = Database()
+    assert Journal(path).recover(recovered) == 3
+    assert set(recovered.tickets()) == {'2'}
+    assert recovered.planes()[1].carrier() == 'LOT'
+
+
+def test_journal_replays_batch_operations(tmp_path):
+    path = tmp_path / 'database.journal'
+    database = Database()
+    journal = Journal(path)
+    journal.recover(database)
+    database.add_flight(Flight(1))
+    database.add_plane(Plane(1, 10, 5, 'LOT'))
+    database.book_tickets_bulk([
+        Ticket('1', 1, 'economic', 1, 2),
+        Ticket('2', 1, 'economic', 1, 2),
+        Ticket('3', 1, 'business', 5, 2)
+    ])
+    database.change_seats([
+        Ticket('1', 1, 'business', 5, 2),
+        Ticket('3', 1, 'economic', 1, 2)
+    ])
+    database.reassign_plane(Plane(1, 8, 1, 'LOT'))
+    journal.close()
+    recovered = Database()
+    assert Journal(path).recover(recovered) == 5
+    assert sorted(recovered.tickets()) == ['1', '3']
+    assert recovered.tickets()['1'].seat_number() == 1
+    assert recovered.tickets()['1'].seat_class() == 'business'
+    assert recovered.tickets()['3'].seat_class() == 'economic'
+    assert recovered.planes()[1].economic_seats_number() == 8
+
+
+def test_journal_batch_not_replayed_is_malformed(tmp_path):
+    path = tmp_path / 'database.journal'
+    with open(path, 'w') as file_handle:
+        file_handle.write(json.dumps({'base': None}) + '\n')
+        file_handle.write(
+            '["book_tickets_bulk",[["1",1,"economic",1,1]]]\n'
+        )
+    with pytest.raises(MalformedFileError):
+        Journal(path).recover(Database())
+
+
+def test_journal_compact(tmp_path):
+    path = tmp_path / 'database.journal'
+    database = Database()
+    journal = Journal(path, compact_every=5)
+    journal.recover(database)
+    database.add_flight(Flight(1))
+    assert not journal.compact_if_due(database)
+    database.add_plane(Plane(1, 10, 5, 'LOT'))
+    for ticket_id in range(1, 4):
+        database.book_next_free_seat(str(ticket_id), 1, 'economic', 2)
+    assert journal.compact_if_due(database)
+    assert journal.records() == 0
+    assert os.path.exists(journal.base_path())
+    database.change_seat('1', 'business', 1)
+    journal.close()
+    with open(path) as file_handle:
+        assert len(file_handle.readlines()) == 2
+
+    recovered = Database()
+    assert Journal(path).recover(recovered) == 1
+    assert len(recovered.tickets()) == 3
+    assert recovered.tickets()['1'].seat_class() == 'business'
+    assert recovered.planes()[1].economic_seats_occupancy()[1] == 'FREE'
+
+
+def test_journal_started_before_base_is_dropped(tmp_path):
+    path = tmp_path / 'database.journal'
+    database = Database()
+    journal = Journal(path)
+    journal.recover(database)
+    database.add_flight(Flight(1))
+    journal.sync()
+    with open(path, 'rb') as file_handle:
+        before_compaction = file_handle.read()
+    journal.compact(database)
+    journal.close()
+    with open(path, 'wb') as file_handle:
+        file_handle.write(before_compaction)
+    recovered = Database()
+    assert Journal(path).recover(recovered) == 0
+    assert list(recovered.flights()) == [1]
+
+
+def test_journal_syncs_in_batches(tmp_path, monkeypatch):
+    synced = []
+    monkeypatch.setattr(os, 'fsync', lambda descriptor: synced.append(1))
+    database = Database()
+    journal = Journal(tmp_path / 'database.journal', sync_every=3)
+    journal.recover(database)
+    synced.clear()
+    for plane_number in range(1, 8):
+        database.add_flight(Flight(plane_number))
+    assert len(synced) == 2
+    journal.close()
+    assert len(synced) == 3
+
+
+def test_journal_malformed(tmp_path):
+    path = tmp_path / 'database.journal'
+    with open(path, 'w') as file_handle:
+        file_handle.write(json.dumps({'base': None}) + '\n')
+        file_handle.write('["book_seat","1",1,"economic",1,1]\n')
+    with pytest.raises(MalformedFileError):
+        Journal(path).recover(Database())
+
+
+def test_replay_record_unknown_operation():
+    with pytest.raises(ValueError):
+        replay_record(Database(), ['drop_database'])
@@ -0,0 +1,83 @@
+from lazy_database import LazyDatabase
+from database import Database
+from ticket import Ticket
+from rejections import DUPLICATE_KEY
+from errors import FilePathNotFoundError
+import shutil
+import pytest
+
+
+default_files = {
+    'flights': 'flights_database.csv',
+    'planes': 'planes_database.csv',
+    'tickets': 'tickets_database.csv',
+    'passengers': 'passengers_database.csv'
+}
+
+
+def test_lazy_database_reads_nothing_on_init():
+    db = LazyDatabase(default_files)
+    assert db.loaded() == ()
+    assert db.rejections() == {}
+
+
+def test_lazy_database_reads_only_needed_files():
+    db = LazyDatabase(dict(default_files, tickets='some_database.csv'))
+    assert len(db.flights()) == 10
+    assert db.loaded() == ('flights',)
+    assert db.planes()[1].carrier() == 'LOT'
+    assert db.loaded() == ('flights', 'planes')
+
+
+def test_lazy_database_reads_dependencies():
+    db = LazyDatabase(default_files)
+    found = db.find_passengers('kowalsk')
+    assert [person.ticket_id() for person in found] == ['3', '4']
+    assert db.loaded() == ('flights', 'planes', 'tickets', 'passengers')
+    assert db.planes()[1].business_seats_occupancy()[20] == 'OCCUPIED'
+    assert all(counts.total() == 0 for counts in db.rejections().values())
+
+
+def test_lazy_database_same_as_database():
+    expected = Database()
+    expected.read_files(default_files)
+    db = LazyDatabase(default_files)
+    assert list(db.passengers()) == list(expected.passengers())
+    assert list(db.tickets()) == list(expected.tickets())
+    for number in expected.planes():
+        assert str(db.planes()[number]) == str(expected.planes()[number])
+
+
+def test_lazy_database_changes_before_access():
+    db = LazyDatabase(default_files)
+    assert db.add_ticket(Ticket('1', 1, 'economic', 100, 1)) == 1
+    ticket = db.book_next_free_seat('11', 1, 'business', 2)
+    assert ticket.seat_number() == 2
+    assert db.loaded() == ('flights', 'planes', 'tickets')
+    assert len(db.tickets()) == 11
+
+
+def test_lazy_database_read_files_after_own_files():
+    db = LazyDatabase(default_files)
+    results = db.read_files({'flights': default_files['flights']})
+    assert results['flights'] == {DUPLICATE_KEY: 10}
+    assert db.loaded() == ('flights',)
+
+
+def test_lazy_database_missing_file_read_again(tmp_path):
+    path = tmp_path / 'tickets_database.csv'
+    db = LazyDatabase(dict(default_files, tickets=str(path)))
+    with pytest.raises(FilePathNotFoundError):
+        db.tickets()
+    assert db.loaded() == ('flights', 'planes')
+    shutil.copy(default_files['tickets'], path)
+    assert len(db.tickets()) == 10
+
+
+def test_lazy_database_snapshot(tmp_path):
+    path = tmp_path / 'database.snapshot'
+    LazyDatabase(default_files).save_snapshot(path)
+    db = LazyDatabase({})
+    db.load_snapshot(path)
+    assert db.loaded() == ('flights', 'planes', 'tickets', 'passengers')
+    assert len(db.passengers()) == 10
@@ -0,0 +1,108 @@
+from live_sync import LiveSync
+from errors import FilePathNotFoundError
+import os
+import shutil
+import threading
+
+
+default_files = {
+    'flights': 'flights_database.csv',
+    'planes': 'planes_database.csv',
+    'tickets': 'tickets_database.csv',
+    'passengers': 'passengers_database.csv'
+}
+
+
+def copy_default_files(directory):
+    paths = {}
+    for kind, name in default_files.items():
+        paths[kind] = str(directory / name)
+        shutil.copy(name, paths[kind])
+    return paths
+
+
+def append(path, data):
+    with open(path, 'a') as file_handle:
+        file_handle.write(data)
+
+
+def test_live_sync_first_poll(tmp_path):
+    sync = LiveSync(copy_default_files(tmp_path))
+    assert sync.poll()
+    assert len(sync.database().tickets()) == 10
+    assert sync.last_error() is None
+
+
+def test_live_sync_nothing_changed(tmp_path):
+    sync = LiveSync(copy_default_files(tmp_path))
+    sync.poll()
+    database = sync.database()
+    assert not sync.poll()
+    assert sync.database() is database
+
+
+def test_live_sync_applies_appended_rows(tmp_path):
+    paths = copy_default_files(tmp_path)
+    sync = LiveSync(paths)
+    sync.poll()
+    database = sync.database()
+    database.ask_for_assistance(database.tickets()['1'])
+    append(paths['tickets'], '11,1,economic,7,2\n')
+    append(paths['passengers'], 'Jan,Nowak,11\n')
+    assert sync.poll()
+    assert sync.database() is database
+    assert database.tickets()['11'].seat_number() == 7
+    assert database.find_passengers('nowak')[0].ticket_id() == '11'
+    assert database.planes()[1].economic_seats_occupancy()[7] == 'OCCUPIED'
+    assert database.planes()[1].busy_assistnats() == {'1'}
+
+
+def test_live_sync_full_reload_keeps_assistance(tmp_path):
+    paths = copy_default_files(tmp_path)
+    sync = LiveSync(paths)
+    sync.poll()
+    old_database = sync.database()
+    old_database.ask_for_assistance(old_database.tickets()['1'])
+    old_database.ask_for_assistance(old_database.tickets()['2'])
+    with open(paths['tickets']) as file_handle:
+        lines = file_handle.readlines()
+    with open(paths['tickets'], 'w') as file_handle:
+        file_handle.writelines(line for line in lines if line[:2] != '2,')
+    assert sync.poll()
+    database = sync.database()
+    assert database is not old_database
+    assert '2' not in database.tickets()
+    assert database.planes()[1].busy_assistnats() == {'1'}
+
+
+def test_live_sync_keeps_database_when_files_missing(tmp_path):
+    paths = copy_default_files(tmp_path)
+    sync = LiveSync(paths)
+    sync.poll()
+    database = sync.database()
+    os.remove(paths['tickets'])
+    assert not sync.poll()
+    assert isinstance(sync.last_error(), FilePathNotFoundError)
+    assert sync.database() is database
+    assert len(database.tickets()) == 10
+    with open(paths['tickets'], 'w') as file_handle:
+        file_handle.write('ticket_id,plane_number,seat_class,')
+        file_handle.write('seat_number,gate_number\n11,1,economic,7,2\n')
+    assert sync.poll()
+    assert sync.last_error() is None
+    assert list(sync.database().tickets()) == ['11']
+
+
+def test_live_sync_polls_in_background(tmp_path):
+    paths = copy_default_files(tmp_path)
+    with LiveSync(paths, poll_interval=0.01) as sync:
+        assert len(sync.database().tickets()) == 10
+        append(paths['tickets'], '11,1,economic,7,2\n')
+        for _ in range(500):
+            with sync.lock():
+                if '11' in sync.database().tickets():
+                    break
+            threading.Event().wait(0.01)
+        with sync.lock():
+            assert '11' in sync.database().tickets()
+    assert sync._thread is None
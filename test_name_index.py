@@ -0,0 +1,76 @@
+from name_index import NameIndex, normalize_name, edit_distance
+from passenger import Passenger
+
+
+def create_index():
+    index = NameIndex()
+    index.add(Passenger('Jan', 'Kowalski', '1'))
+    index.add(Passenger('Karolina', 'Kowalska', '2'))
+    index.add(Passenger('Adam', 'Nowak', '3'))
+    return index
+
+
+def test_normalize_name():
+    assert normalize_name('  Jan   KOWALSKI ') == 'jan kowalski'
+
+
+def test_find_prefix_last_name():
+    index = create_index()
+    assert sorted(index.find_prefix('kowal')) == ['1', '2']
+
+
+def test_find_prefix_first_and_last_name():
+    index = create_index()
+    assert index.find_prefix('Jan K') == ['1']
+    assert index.find_prefix('nowak a') == ['3']
+
+
+def test_find_prefix_whole_name():
+    index = create_index()
+    assert index.find_prefix('Adam Nowak') == ['3']
+
+
+def test_find_prefix_does_not_repeat_passengers():
+    index = create_index()
+    assert sorted(index.find_prefix('k')) == ['1', '2']
+
+
+def test_find_prefix_not_found():
+    index = create_index()
+    assert index.find_prefix('zol') == []
+
+
+def test_find_prefix_empty_returns_everyone():
+    index = create_index()
+    assert sorted(index.find_prefix('')) == ['1', '2', '3']
+
+
+def test_find_fuzzy_exact():
+    index = create_index()
+    assert index.find_fuzzy('nowak', 0) == ['3']
+
+
+def test_find_fuzzy_typo():
+    index = create_index()
+    assert sorted(index.find_fuzzy('Kowalsky')) == ['1', '2']
+    assert index.find_fuzzy('jan kowalsky') == ['1']
+
+
+def test_find_fuzzy_closest_first():
+    index = create_index()
+    assert index.find_fuzzy('kowalska', 1) == ['2', '1']
+    assert index.find_fuzzy('kowalski', 1) == ['1', '2']
+
+
+def test_find_fuzzy_too_far():
+    index = create_index()
+    assert index.find_fuzzy('kovalsky', 1) == []
+    assert sorted(index.find_fuzzy('kovalsky', 2)) == ['1', '2']
+    assert index.find_fuzzy('nowicki', 2) == []
+
+
+def test_edit_distance():
+    assert edit_distance('croft', 'croft') == 0
+    assert edit_distance('croft', 'kroft') == 1
+    assert edit_distance('croft', 'cort') == 2
+    assert edit_distance('', 'abc') == 3
@@ -1,4 +1,9 @@
 from passenger import Passenger
+from rejections import (
+    INVALID_FIRST_NAME,
+    INVALID_LAST_NAME,
+    INVALID_TICKET_ID
+)
 from errors import (
     InvalidPassengerFirstName,
     InvalidPassengerLastName,
@@ -48,3 +53,22 @@ def test_passenger_str():
     person = Passenger('John', 'McClayne', 49)
     description = 'Passenger: John McClayne, ticket id number: 49'
     assert str(person) == description
+
+
+def test_passenger_has_no_instance_dict():
+    person = Passenger('Jan', 'Kowalski', '1')
+    assert not hasattr(person, '__dict__')
+    with pytest.raises(AttributeError):
+        person.name = 'Jan Kowalski'
+
+
+def test_passenger_rejection_reason():
+    assert Passenger.rejection_reason('Jan', 'Nowak', '1') is None
+    assert Passenger.rejection_reason('', 'Nowak', '1') == INVALID_FIRST_NAME
+    assert Passenger.rejection_reason('Jan', '', '1') == INVALID_LAST_NAME
+    assert Passenger.rejection_reason('Jan', 'Nowak', '') == INVALID_TICKET_ID
+
+
+def test_passenger_from_checked():
+    person = Passenger.from_checked('Jan', 'Nowak', '1')
+    assert str(person) == str(Passenger('Jan', 'Nowak', '1'))
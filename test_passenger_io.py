@@ -1,4 +1,7 @@
-from passenger_io import read_passengers_from_csv
+from passenger_io import (
+    read_passengers_from_csv,
+    write_passengers_to_csv
+)
 from errors import InvalidKeyInPassengersFile
 import pytest
 from io import StringIO
@@ -28,3 +31,16 @@ def test_read_passengers_from_csv_omit_invalid_data_line():
     file_handle = StringIO(data)
     passengers = read_passengers_from_csv(file_handle)
     assert len(passengers) == 2
+
+
+def test_write_passengers_to_csv():
+    passengers = read_passengers_from_csv(StringIO(
+        'first_name,last_name,ticket_id\n'
+        '"Kowalski, Jan",Nowak,1\n'
+    ))
+    file_handle = StringIO(newline='')
+    write_passengers_to_csv(file_handle, passengers.values())
+    assert file_handle.getvalue() == (
+        'first_name,last_name,ticket_id\n'
+        '"Kowalski, Jan",Nowak,1\n'
+    )
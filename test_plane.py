@@ -1,8 +1,17 @@
 from plane import Plane
+from rejections import (
+    INVALID_PLANE_NUMBER,
+    INVALID_SEATS_NUMBER,
+    INVALID_CARRIER
+)
 from errors import (
     InvalidNumberOfSeats,
     InvalidCarrierName,
-    InvalidPlaneNumber
+    InvalidPlaneNumber,
+    InvalidSeatClass,
+    PassengerAlreadyAskedForHelpError,
+    AllAssistantsAreBusyError,
+    ChosenPassengerHasNotAskedForHelp
 )
 import pytest
 
@@ -91,3 +100,55 @@ def test_plane_str():
     description += ', business seats number: 10, carrier: LOT'
     str_plane = str(plane)
     assert str_plane == description
+
+
+def test_plane_seats_occupancy_by_class():
+    plane = Plane(1223, 245, 50, 'lot')
+    economic = plane.economic_seats_occupancy()
+    business = plane.business_seats_occupancy()
+    assert plane.seats_occupancy('economic') is economic
+    assert plane.seats_occupancy('business') is business
+    assert len(plane.seats_occupancy('economic')) == 245
+    assert len(plane.seats_occupancy('business')) == 50
+
+
+def test_plane_seats_occupancy_invalid_class():
+    plane = Plane(1223, 245, 50, 'lot')
+    with pytest.raises(InvalidSeatClass):
+        plane.seats_occupancy('first')
+
+
+def test_plane_rejection_reason():
+    assert Plane.rejection_reason(1, 200, 50, 'Lot') is None
+    assert Plane.rejection_reason(-1, 200, 50, 'Lot') == INVALID_PLANE_NUMBER
+    assert Plane.rejection_reason(1, 0, 50, 'Lot') == INVALID_SEATS_NUMBER
+    assert Plane.rejection_reason(1, 200, None, 'Lot') == INVALID_SEATS_NUMBER
+    assert Plane.rejection_reason(1, 200, 50, '') == INVALID_CARRIER
+
+
+def test_plane_from_checked():
+    plane = Plane.from_checked(1, 200, 50, 'Lot')
+    assert str(plane) == str(Plane(1, 200, 50, 'Lot'))
+    assert plane.economic_seats_occupancy().free_seats_number() == 200
+    assert plane.busy_assistnats() == set()
+
+
+def test_plane_ask_for_assistance():
+    plane = Plane(1, 10, 5, 'LOT')
+    plane.ask_for_assistance('1')
+    plane.ask_for_assistance('2')
+    plane.ask_for_assistance('3')
+    assert plane.busy_assistnats() == {'1', '2', '3'}
+    with pytest.raises(PassengerAlreadyAskedForHelpError):
+        plane.ask_for_assistance('1')
+    with pytest.raises(AllAssistantsAreBusyError):
+        plane.ask_for_assistance('4')
+
+
+def test_plane_thank_for_assistance():
+    plane = Plane(1, 10, 5, 'LOT')
+    plane.ask_for_assistance('1')
+    plane.thank_for_assistance('1')
+    assert plane.busy_assistnats() == set()
+    with pytest.raises(ChosenPassengerHasNotAskedForHelp):
+        plane.thank_for_assistance('1')
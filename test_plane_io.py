@@ -1,4 +1,4 @@
-from plane_io import read_planes_from_csv
+from plane_io import read_planes_from_csv, write_planes_to_csv
 from errors import InvalidKeyInPlanesFile
 from io import StringIO
 import pytest
@@ -98,3 +98,19 @@ def test_read_planes_from_csv_invalid_carrier():
     file_handle = StringIO(data)
     with pytest.raises(InvalidKeyInPlanesFile):
         read_planes_from_csv(file_handle)
+
+
+def test_write_planes_to_csv():
+    with open('planes_database.csv', 'r') as file_handle:
+        planes = read_planes_from_csv(file_handle)
+    file_handle = StringIO(newline='')
+    write_planes_to_csv(file_handle, planes.values())
+    file_handle.seek(0)
+    written = read_planes_from_csv(file_handle)
+    assert written.keys() == planes.keys()
+    for number, plane in planes.items():
+        assert written[number].carrier() == plane.carrier()
+        assert (
+            written[number].business_seats_number()
+            == plane.business_seats_number()
+        )
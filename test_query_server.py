@@ -0,0 +1,94 @@
+from query_server import QueryServer, ask_server, parse_request
+from errors import MalformedResponseError
+import asyncio
+import json
+import socket
+import threading
+import pytest
+
+
+def start_server(server):
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(server.start())
+    thread = threading.Thread(target=loop.run_forever)
+    thread.start()
+    return loop, thread
+
+
+def stop_server(server, loop, thread):
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.run_until_complete(server.close())
+    loop.close()
+
+
+def test_parse_request():
+    assert parse_request(b'["tickets", "--id", "1"]\n') == [
+        'tickets', '--id', '1'
+    ]
+    assert parse_request(b'[]') == []
+    assert parse_request(b'{"id": 1}') is None
+    assert parse_request(b'["tickets", 1]') is None
+    assert parse_request(b'tickets') is None
+
+
+def test_query_server_answers(tmp_path):
+    path = tmp_path / 'database.sock'
+    server = QueryServer(path, lambda arguments: ' '.join(arguments))
+    loop, thread = start_server(server)
+    try:
+        assert ask_server(path, ['tickets', '--id', '1']) == 'tickets --id 1'
+        assert ask_server(path, []) == ''
+    finally:
+        stop_server(server, loop, thread)
+    assert not path.exists()
+
+
+def test_query_server_many_requests_on_connection(tmp_path):
+    path = tmp_path / 'database.sock'
+    server = QueryServer(path, lambda arguments: len(arguments))
+    loop, thread = start_server(server)
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.connect(str(path))
+            connection.sendall(b'["a"]\n["a", "b"]\nnot json\n')
+            with connection.makefile('rb') as file_handle:
+                responses = [
+                    json.loads(file_handle.readline()) for _ in range(3)
+                ]
+    finally:
+        stop_server(server, loop, thread)
+    assert responses == [
+        {'output': 1},
+        {'output': 2},
+        {'error': 'malformed request'}
+    ]
+
+
+def test_query_server_removes_stale_socket(tmp_path):
+    path = tmp_path / 'database.sock'
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(path))
+    stale.close()
+    server = QueryServer(path, lambda arguments: 'ok')
+    loop, thread = start_server(server)
+    try:
+        assert ask_server(path, ['flights']) == 'ok'
+    finally:
+        stop_server(server, loop, thread)
+
+
+def test_ask_server_not_running(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        ask_server(tmp_path / 'database.sock', ['flights'])
+
+
+def test_ask_server_malformed_response(tmp_path):
+    path = tmp_path / 'database.sock'
+    server = QueryServer(path, lambda arguments: 'ok')
+    loop, thread = start_server(server)
+    try:
+        with pytest.raises(MalformedResponseError):
+            ask_server(path, ['flights', 1])
+    finally:
+        stop_server(server, loop, thread)
@@ -0,0 +1,116 @@
+from database import Database
+from readonly_database import ReadOnlyDatabase, build_index
+from errors import (
+    FilePathNotFoundError,
+    MalformedFileError,
+    StaleIndexError
+)
+import os
+import shutil
+import pytest
+
+
+default_files = [
+    'flights_database.csv',
+    'planes_database.csv',
+    'tickets_database.csv',
+    'passengers_database.csv'
+]
+
+
+def loaded_database():
+    db = Database()
+    db.read_flights('flights_database.csv')
+    db.read_planes('planes_database.csv')
+    db.read_tickets('tickets_database.csv')
+    db.read_passengers('passengers_database.csv')
+    return db
+
+
+def test_readonly_database_lookups(tmp_path):
+    db = loaded_database()
+    db.ask_for_assistance(db.tickets()['4'])
+    path = tmp_path / 'database.index'
+    build_index(db, path)
+
+    with ReadOnlyDatabase(path) as index:
+        assert len(index.flights()) == 10
+        assert len(index.planes()) == 10
+        assert len(index.tickets()) == 10
+        assert len(index.passengers()) == 10
+
+        assert index.flights()[7].plane_number() == 7
+        plane = index.planes()[7]
+        assert plane.economic_seats_number() == 224
+        assert plane.business_seats_number() == 26
+        assert plane.carrier() == 'WIZZAIR'
+        assert index.planes()[1].busy_assistnats() == {'4'}
+        assert index.planes()[1].business_seats_occupancy()[30] == 'OCCUPIED'
+        assert index.planes()[1].business_seats_occupancy()[31] == 'FREE'
+
+        ticket = index.tickets()['7']
+        assert str(ticket) == str(db.tickets()['7'])
+        person = index.passengers()['10']
+        assert str(person) == str(db.passengers()['10'])
+
+
+def test_readonly_database_missing_keys(tmp_path):
+    path = tmp_path / 'database.index'
+    build_index(loaded_database(), path)
+    with ReadOnlyDatabase(path) as index:
+        assert 11 not in index.flights()
+        assert '1' not in index.flights()
+        assert 1 not in index.tickets()
+        assert '11' not in index.tickets()
+        with pytest.raises(KeyError):
+            index.planes()[0]
+        with pytest.raises(KeyError):
+            index.passengers()['0']
+
+
+def test_readonly_database_iteration(tmp_path):
+    path = tmp_path / 'database.index'
+    build_index(loaded_database(), path)
+    with ReadOnlyDatabase(path) as index:
+        assert list(index.flights()) == list(range(1, 11))
+        assert sorted(index.tickets()) == sorted(
+            str(number) for number in range(1, 11)
+        )
+
+
+def test_readonly_database_empty(tmp_path):
+    path = tmp_path / 'database.index'
+    build_index(Database(), path)
+    with ReadOnlyDatabase(path) as index:
+        assert len(index.tickets()) == 0
+        assert '1' not in index.tickets()
+
+
+def test_readonly_database_stale(tmp_path):
+    sources = []
+    for name in default_files:
+        shutil.copy(name, tmp_path / name)
+        sources.append(str(tmp_path / name))
+    path = tmp_path / 'database.index'
+    build_index(loaded_database(), path, sources)
+    ReadOnlyDatabase(path, sources).close()
+
+    status = os.stat(sources[0])
+    os.utime(sources[0], ns=(status.st_atime_ns, status.st_mtime_ns + 10))
+    with pytest.raises(StaleIndexError):
+        ReadOnlyDatabase(path, sources)
+
+
+def test_readonly_database_malformed(tmp_path):
+    path = tmp_path / 'database.index'
+    path.write_bytes(b'')
+    with pytest.raises(MalformedFileError):
+        ReadOnlyDatabase(path)
+    path.write_bytes(b'not an index file')
+    with pytest.raises(MalformedFileError):
+        ReadOnlyDatabase(path)
+
+
+def test_readonly_database_missing_file(tmp_path):
+    with pytest.raises(FilePathNotFoundError):
+        ReadOnlyDatabase(tmp_path / 'database.index')
@@ -0,0 +1,16 @@
+from rejections import RejectionCounts, DUPLICATE_KEY, OCCUPIED_SEAT
+
+
+def test_rejection_counts():
+    rejections = RejectionCounts()
+    rejections[DUPLICATE_KEY] += 2
+    rejections[OCCUPIED_SEAT] += 1
+    assert rejections[DUPLICATE_KEY] == 2
+    assert rejections['other reason'] == 0
+    assert rejections.total() == 3
+
+
+def test_rejection_counts_str():
+    rejections = RejectionCounts({DUPLICATE_KEY: 2, OCCUPIED_SEAT: 1})
+    assert str(rejections) == 'already existing key: 2, seat occupied: 1'
+    assert str(RejectionCounts()) == ''
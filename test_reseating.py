@@ -0,0 +1,60 @@
+from reseating import plan_reseating
+from plane import Plane
+from ticket import Ticket
+
+
+def seats(tickets):
+    return [(ticket.ticket_id(), ticket.seat_number()) for ticket in tickets]
+
+
+def test_plan_reseating_keeps_seats():
+    tickets = [
+        Ticket('1', 1, 'business', 1, 1),
+        Ticket('2', 1, 'economic', 5, 1)
+    ]
+    kept, moved, unseated = plan_reseating(tickets, Plane(1, 10, 2, 'LOT'))
+    assert kept == tickets
+    assert moved == []
+    assert unseated == []
+
+
+def test_plan_reseating_moves_to_lowest_free_seats():
+    tickets = [
+        Ticket('1', 1, 'economic', 9, 1),
+        Ticket('2', 1, 'economic', 1, 1),
+        Ticket('3', 1, 'economic', 7, 1),
+        Ticket('4', 1, 'economic', 3, 1)
+    ]
+    kept, moved, unseated = plan_reseating(tickets, Plane(1, 4, 1, 'LOT'))
+    assert kept == [tickets[1], tickets[3]]
+    assert seats(moved) == [('3', 2), ('1', 4)]
+    assert moved[0].seat_class() == 'economic'
+    assert moved[0].gate_number() == 1
+    assert unseated == []
+
+
+def test_plan_reseating_not_enough_seats():
+    tickets = [
+        Ticket('1', 1, 'business', 1, 1),
+        Ticket('2', 1, 'business', 2, 1),
+        Ticket('3', 1, 'business', 3, 1),
+        Ticket('4', 1, 'economic', 1, 1)
+    ]
+    kept, moved, unseated = plan_reseating(tickets, Plane(1, 10, 1, 'LOT'))
+    assert kept == [tickets[0], tickets[3]]
+    assert moved == []
+    assert unseated == [tickets[1], tickets[2]]
+
+
+def test_plan_reseating_skips_occupied_seats():
+    plane = Plane(2, 3, 1, 'LOT')
+    plane.economic_seats_occupancy().book(1)
+    tickets = [
+        Ticket('1', 1, 'economic', 1, 1),
+        Ticket('2', 1, 'economic', 3, 1)
+    ]
+    kept, moved, unseated = plan_reseating(tickets, plane)
+    assert kept == []
+    assert seats(moved) == [('2', 3), ('1', 2)]
+    assert moved[0].plane_number() == 2
+    assert unseated == []
@@ -0,0 +1,136 @@
+from seat_occupancy import SeatOccupancy
+import pytest
+
+
+def test_seat_occupancy_init():
+    occupancy = SeatOccupancy(20)
+    assert occupancy.seats_number() == 20
+    assert len(occupancy) == 20
+    assert list(occupancy) == list(range(1, 21))
+    assert occupancy.free_seats_number() == 20
+    assert occupancy.occupied_seats_number() == 0
+    for seat in occupancy:
+        assert occupancy[seat] == 'FREE'
+
+
+def test_seat_occupancy_bitmap_size():
+    assert len(SeatOccupancy(1).bitmap()) == 1
+    assert len(SeatOccupancy(8).bitmap()) == 1
+    assert len(SeatOccupancy(9).bitmap()) == 2
+    assert len(SeatOccupancy(450).bitmap()) == 57
+
+
+def test_seat_occupancy_book_and_release():
+    occupancy = SeatOccupancy(10)
+    occupancy.book(1)
+    occupancy.book(8)
+    occupancy.book(9)
+    assert not occupancy.is_free(1)
+    assert not occupancy.is_free(8)
+    assert not occupancy.is_free(9)
+    assert occupancy.is_free(10)
+    assert occupancy[9] == 'OCCUPIED'
+    assert occupancy.occupied_seats_number() == 3
+    assert occupancy.free_seats_number() == 7
+
+    occupancy.release(8)
+    assert occupancy.is_free(8)
+    assert occupancy[8] == 'FREE'
+    assert occupancy.occupied_seats_number() == 2
+
+
+def test_seat_occupancy_mapping_assignment():
+    occupancy = SeatOccupancy(5)
+    occupancy[3] = 'OCCUPIED'
+    assert not occupancy.is_free(3)
+    occupancy[3] = 'FREE'
+    assert occupancy.is_free(3)
+
+
+def test_seat_occupancy_mapping_invalid_value():
+    occupancy = SeatOccupancy(5)
+    with pytest.raises(ValueError):
+        occupancy[3] = 'TAKEN'
+
+
+def test_seat_occupancy_seat_out_of_range():
+    occupancy = SeatOccupancy(5)
+    assert 0 not in occupancy
+    assert 6 not in occupancy
+    assert 5 in occupancy
+    with pytest.raises(KeyError):
+        occupancy[6]
+    with pytest.raises(KeyError):
+        occupancy[0] = 'OCCUPIED'
+
+
+def test_seat_occupancy_equals_dict():
+    occupancy = SeatOccupancy(3)
+    occupancy.book(2)
+    assert occupancy == {1: 'FREE', 2: 'OCCUPIED', 3: 'FREE'}
+
+
+def test_seat_occupancy_first_free_seat():
+    occupancy = SeatOccupancy(4)
+    assert occupancy.first_free_seat() == 1
+    occupancy.book(1)
+    occupancy.book(2)
+    assert occupancy.first_free_seat() == 3
+    occupancy.release(1)
+    assert occupancy.first_free_seat() == 1
+    occupancy.book(1)
+    occupancy.book(3)
+    occupancy.book(4)
+    assert occupancy.first_free_seat() is None
+    occupancy.release(4)
+    assert occupancy.first_free_seat() == 4
+
+
+def test_seat_occupancy_first_free_seat_released_twice():
+    occupancy = SeatOccupancy(3)
+    occupancy.first_free_seat()
+    occupancy.book(2)
+    occupancy.release(2)
+    occupancy.release(2)
+    occupancy.book(1)
+    assert occupancy.first_free_seat() == 2
+    occupancy.book(2)
+    assert occupancy.first_free_seat() == 3
+
+
+def test_seat_occupancy_occupied_mask():
+    occupancy = SeatOccupancy(10)
+    occupancy.book(1)
+    occupancy.book(10)
+    assert occupancy.occupied_mask() == 0b1000000001
+
+
+def test_seat_occupancy_book_mask():
+    occupancy = SeatOccupancy(10)
+    occupancy.book(2)
+    occupancy.book_mask(0b1000000001)
+    assert occupancy.occupied_seats_number() == 3
+    assert occupancy[1] == 'OCCUPIED'
+    assert occupancy[2] == 'OCCUPIED'
+    assert occupancy[10] == 'OCCUPIED'
+    assert occupancy.first_free_seat() == 3
+
+
+def test_seat_occupancy_release_mask():
+    occupancy = SeatOccupancy(10)
+    occupancy.book_mask(0b1000000111)
+    assert occupancy.first_free_seat() == 4
+    occupancy.release_mask(0b1000000101)
+    assert occupancy.occupied_mask() == 0b10
+    assert occupancy.first_free_seat() == 1
+    occupancy.book(1)
+    assert occupancy.first_free_seat() == 3
+    with pytest.raises(ValueError):
+        occupancy.release_mask(1 << 10)
+
+
+def test_seat_occupancy_book_mask_out_of_range():
+    occupancy = SeatOccupancy(10)
+    with pytest.raises(ValueError):
+        occupancy.book_mask(1 << 10)
+    assert occupancy.occupied_seats_number() == 0
@@ -0,0 +1,155 @@
+from database import Database
+from flight import Flight
+from plane import Plane
+from ticket import Ticket
+from snapshot import read_snapshot, write_snapshot, source_stamps
+from errors import (
+    ChosenSeatIsOccupied,
+    MalformedFileError,
+    StaleSnapshotError
+)
+from io import BytesIO
+import os
+import shutil
+import struct
+import pytest
+
+
+default_files = [
+    'flights_database.csv',
+    'planes_database.csv',
+    'tickets_database.csv',
+    'passengers_database.csv'
+]
+
+
+def loaded_database():
+    db = Database()
+    db.read_flights('flights_database.csv')
+    db.read_planes('planes_database.csv')
+    db.read_tickets('tickets_database.csv')
+    db.read_passengers('passengers_database.csv')
+    return db
+
+
+def test_snapshot_round_trip():
+    db = loaded_database()
+    db.ask_for_assistance(db.tickets()['2'])
+    db.ask_for_assistance(db.tickets()['7'])
+    file_handle = BytesIO()
+    write_snapshot(file_handle, db)
+    flights, planes, tickets, passengers, released = read_snapshot(
+        file_handle.getvalue()
+    )
+
+    assert sorted(flights) == sorted(db.flights())
+    assert flights[3].plane_number() == 3
+    assert sorted(planes) == sorted(db.planes())
+    for plane_number in planes:
+        plane = planes[plane_number]
+        original = db.planes()[plane_number]
+        assert str(plane) == str(original)
+        assert dict(plane.economic_seats_occupancy()) == dict(
+            original.economic_seats_occupancy()
+        )
+        assert dict(plane.business_seats_occupancy()) == dict(
+            original.business_seats_occupancy()
+        )
+    assert planes[1].busy_assistnats() == {'2', '7'}
+    assert planes[1].business_seats_occupancy()[20] == 'OCCUPIED'
+    assert planes[1].economic_seats_occupancy()[7] == 'FREE'
+    assert {key: str(tickets[key]) for key in tickets} == {
+        key: str(db.tickets()[key]) for key in db.tickets()
+    }
+    assert {key: str(passengers[key]) for key in passengers} == {
+        key: str(db.passengers()[key]) for key in db.passengers()
+    }
+    assert released == set()
+
+
+def test_snapshot_invalid_magic():
+    with pytest.raises(MalformedFileError):
+        read_snapshot(b'NOTASNAPSHOT')
+
+
+def test_snapshot_truncated():
+    file_handle = BytesIO()
+    write_snapshot(file_handle, loaded_database())
+    with pytest.raises(MalformedFileError):
+        read_snapshot(file_handle.getvalue()[:-10])
+
+
+def test_snapshot_corrupt_columns(tmp_path):
+    db = Database()
+    db.add_flight(Flight(1))
+    db.add_plane(Plane(1, 77777, 3, 'LOT'))
+    file_handle = BytesIO()
+    write_snapshot(file_handle, db)
+    data = file_handle.getvalue()
+    corrupt_data = [
+        data.replace(b'LOT', b'\xffOT'),
+        data.replace(struct.pack('<q', 77777), struct.pack('<q', 10 ** 12))
+    ]
+    for index, corrupt in enumerate(corrupt_data):
+        with pytest.raises(MalformedFileError):
+            read_snapshot(corrupt)
+        path = tmp_path / f'{index}.snapshot'
+        path.write_bytes(corrupt)
+        with pytest.raises(MalformedFileError):
+            Database().load_snapshot(path)
+
+
+def test_snapshot_stale_sources(tmp_path):
+    sources = []
+    for name in default_files:
+        shutil.copy(name, tmp_path / name)
+        sources.append(str(tmp_path / name))
+    file_handle = BytesIO()
+    write_snapshot(file_handle, loaded_database(), sources)
+    read_snapshot(file_handle.getvalue(), sources)
+
+    status = os.stat(sources[2])
+    os.utime(sources[2], ns=(status.st_atime_ns, status.st_mtime_ns + 10))
+    with pytest.raises(StaleSnapshotError):
+        read_snapshot(file_handle.getvalue(), sources)
+    with pytest.raises(StaleSnapshotError):
+        read_snapshot(file_handle.getvalue(), sources[:2])
+
+
+def test_source_stamps():
+    stamps = source_stamps(['flights_database.csv'])
+    assert stamps[0][0] == 'flights_database.csv'
+    assert stamps[0][2] == os.path.getsize('flights_database.csv')
+
+
+def test_database_save_and_load_snapshot(tmp_path):
+    path = tmp_path / 'database.snapshot'
+    loaded_database().save_snapshot(path, default_files)
+    db = Database()
+    db.load_snapshot(path, default_files)
+    assert len(db.flights()) == 10
+    assert len(db.planes()) == 10
+    assert len(db.tickets()) == 10
+    assert len(db.passengers()) == 10
+    assert db.tickets()['7'].seat_number() == 3
+    assert db.passengers()['1'].first_name() == 'Lara'
+    with pytest.raises(ChosenSeatIsOccupied):
+        db.book_seat(db.tickets()['7'])
+    assert not os.path.exists(f'{path}.tmp')
+
+
+def test_database_snapshot_keeps_released_seats(tmp_path):
+    path = tmp_path / 'database.snapshot'
+    db = Database()
+    db.add_flight(Flight(1))
+    db.add_plane(Plane(1, 200, 5, 'LOT'))
+    db.book_seat(Ticket('A', 1, 'economic', 100, 1))
+    db.release_seat(db.tickets()['A'])
+    db.book_seat(Ticket('B', 1, 'economic', 100, 1))
+    db.save_snapshot(path)
+    db = Database()
+    db.load_snapshot(path)
+    assert sorted(db.tickets()) == ['A', 'B']
+    assert [ticket.ticket_id() for ticket in db.tickets_on_plane(1)] == ['B']
+    assert not db.holds_seat('A')
+    assert db.holds_seat('B')
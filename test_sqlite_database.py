@@ -0,0 +1,296 @@
+from sqlite_database import SqliteDatabase
+from database import Database
+from flight import Flight
+from passenger import Passenger
+from plane import Plane
+from ticket import Ticket
+from import_report import ImportReport
+from rejections import (
+    DUPLICATE_KEY,
+    UNKNOWN_FLIGHT,
+    UNKNOWN_TICKET,
+    INVALID_SEAT_NUMBER,
+    OCCUPIED_SEAT
+)
+from errors import (
+    AllAssistantsAreBusyError,
+    ChosenPassengerDoesNotExist,
+    ChosenPassengerHasNotAskedForHelp,
+    ChosenSeatIsOccupied,
+    FilePathNotFoundError,
+    InvalidFileHeaderError,
+    InvalidSeatClass,
+    InvalidSeatNumber,
+    LackingFlightObjectError,
+    LackingTicketObjectError,
+    NoFreeSeatsError,
+    PassengerAlreadyAskedForHelpError,
+    TicketAlreadyExistsError
+)
+from io import StringIO
+import json
+import pytest
+
+
+default_files = {
+    'flights': 'flights_database.csv',
+    'planes': 'planes_database.csv',
+    'tickets': 'tickets_database.csv',
+    'passengers': 'passengers_database.csv'
+}
+
+
+@pytest.fixture
+def db(tmp_path):
+    with SqliteDatabase(tmp_path / 'database.sqlite') as database:
+        database.read_files(default_files)
+        yield database
+
+
+def test_sqlite_database_empty(tmp_path):
+    with SqliteDatabase(tmp_path / 'database.sqlite') as database:
+        assert len(database.flights()) == 0
+        assert len(database.planes()) == 0
+        assert len(database.tickets()) == 0
+        assert len(database.passengers()) == 0
+        assert list(database.tickets()) == []
+
+
+def test_sqlite_database_read_files_same_as_database(db):
+    expected = Database()
+    expected.read_files(default_files)
+    assert list(db.flights()) == list(expected.flights())
+    assert list(db.planes()) == list(expected.planes())
+    assert list(db.tickets()) == list(expected.tickets())
+    assert list(db.passengers()) == list(expected.passengers())
+    for number in expected.planes():
+        assert str(db.planes()[number]) == str(expected.planes()[number])
+    assert str(db.tickets()['4']) == str(expected.tickets()['4'])
+    assert db.passengers()['10'].last_name() == 'Zolkiewski'
+
+
+def test_sqlite_database_keys_of_other_type(db):
+    assert '1' not in db.flights()
+    assert 1 not in db.tickets()
+    with pytest.raises(KeyError):
+        db.planes()['1']
+    with pytest.raises(KeyError):
+        db.tickets()['11']
+
+
+def test_sqlite_database_changes_are_kept(tmp_path):
+    path = tmp_path / 'database.sqlite'
+    with SqliteDatabase(path) as database:
+        database.read_files(default_files)
+        database.book_next_free_seat('11', 1, 'business', 2)
+        database.ask_for_assistance(database.tickets()['11'])
+    with SqliteDatabase(path) as database:
+        assert database.tickets()['11'].seat_number() == 2
+        assert database.planes()[1].busy_assistnats() == {'11'}
+        assert len(database.tickets()) == 11
+
+
+def test_sqlite_database_read_files_twice(db):
+    results = db.read_files(default_files)
+    assert results['flights'] == {DUPLICATE_KEY: 10}
+    assert results['tickets'] == {DUPLICATE_KEY: 10}
+    assert results['passengers'] == {DUPLICATE_KEY: 10}
+
+
+def test_sqlite_database_read_files_errors(tmp_path):
+    with SqliteDatabase(tmp_path / 'database.sqlite') as database:
+        with pytest.raises(FilePathNotFoundError):
+            database.read_flights('some_database.csv')
+        with pytest.raises(InvalidFileHeaderError):
+            database.read_passengers('invalid_header_test.csv')
+
+
+def test_sqlite_database_add_objects(db):
+    assert db.add_flight(Flight(1)) == 1
+    assert db.add_flight(Flight(11)) == 0
+    with pytest.raises(LackingFlightObjectError):
+        db.add_plane(Plane(12, 10, 2, 'LOT'))
+    assert db.add_plane(Plane(11, 10, 2, 'LOT')) == 0
+    assert db.add_ticket(Ticket('1', 11, 'economic', 1, 1)) == 1
+    with pytest.raises(LackingFlightObjectError):
+        db.add_ticket(Ticket('11', 12, 'economic', 1, 1))
+    with pytest.raises(InvalidSeatNumber):
+        db.add_ticket(Ticket('11', 11, 'business', 3, 1))
+    assert db.add_ticket(Ticket('11', 11, 'business', 2, 1)) == 0
+    with pytest.raises(ChosenSeatIsOccupied):
+        db.add_ticket(Ticket('12', 11, 'business', 2, 1))
+    with pytest.raises(LackingTicketObjectError):
+        db.add_passenger(Passenger('Jan', 'Nowak', '12'))
+    assert db.add_passenger(Passenger('Jan', 'Nowak', '11')) == 0
+    assert db.add_passenger(Passenger('Jan', 'Nowak', '11')) == 1
+    assert db.planes()[11].business_seats_occupancy()[2] == 'OCCUPIED'
+
+
+def test_sqlite_database_add_tickets_rejections(db):
+    tickets = [
+        Ticket('1', 1, 'economic', 100, 1),
+        Ticket('11', 99, 'economic', 1, 1),
+        Ticket('12', 2, 'economic', 100000, 1),
+        Ticket('13', 1, 'business', 1, 1),
+        Ticket('14', 2, 'economic', 3, 1),
+        Ticket('15', 2, 'economic', 3, 1),
+        Ticket('14', 2, 'economic', 4, 1)
+    ]
+    assert db.add_tickets(tickets) == {
+        DUPLICATE_KEY: 2,
+        UNKNOWN_FLIGHT: 1,
+        INVALID_SEAT_NUMBER: 1,
+        OCCUPIED_SEAT: 2
+    }
+    assert db.tickets()['14'].seat_number() == 3
+    assert '15' not in db.tickets()
+
+
+def test_sqlite_database_add_tickets_reseat_occupied(db):
+    tickets = [Ticket('11', 1, 'business', 1, 1)]
+    assert db.add_tickets(tickets, reseat_occupied=True) == {}
+    assert db.tickets()['11'].seat_number() == 2
+
+
+def test_sqlite_database_add_passengers_rejections(db):
+    passengers = [
+        Passenger('Jan', 'Nowak', '1'),
+        Passenger('Jan', 'Nowak', '11')
+    ]
+    assert db.add_passengers(passengers) == {
+        DUPLICATE_KEY: 1,
+        UNKNOWN_TICKET: 1
+    }
+
+
+def test_sqlite_database_read_with_report(tmp_path, db):
+    path = tmp_path / 'tickets.csv'
+    path.write_text(
+        'ticket_id,plane_number,seat_class,seat_number,gate_number\n'
+        '11,1,economic,x,1\n'
+        '1,1,economic,7,1\n'
+        '12,1,economic,7,1\n'
+    )
+    output = StringIO()
+    report = ImportReport(output)
+    assert db.read_tickets(path, report=report).total() == 2
+    lines = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert [line['line'] for line in lines] == [2, 3]
+    assert db.tickets()['12'].seat_number() == 7
+
+
+def test_sqlite_database_book_and_release_seat(db):
+    ticket = db.tickets()['1']
+    with pytest.raises(ChosenSeatIsOccupied):
+        db.book_seat(ticket)
+    db.release_seat(ticket)
+    assert db.planes()[1].business_seats_occupancy()[1] == 'FREE'
+    assert '1' not in [found.ticket_id() for found in db.tickets_on_plane(1)]
+    db.book_seat(ticket)
+    assert db.planes()[1].business_seats_occupancy()[1] == 'OCCUPIED'
+
+
+def test_sqlite_database_change_seat(db):
+    ticket = db.change_seat('1', 'economic', 7)
+    assert ticket.seat_number() == 7
+    assert db.tickets()['1'].seat_class() == 'economic'
+    assert db.planes()[1].business_seats_occupancy()[1] == 'FREE'
+    assert db.planes()[1].economic_seats_occupancy()[7] == 'OCCUPIED'
+    with pytest.raises(ChosenSeatIsOccupied):
+        db.change_seat('2', 'economic', 7)
+    assert db.tickets()['2'].seat_number() == 10
+    assert db.planes()[1].business_seats_occupancy()[10] == 'OCCUPIED'
+    with pytest.raises(InvalidSeatNumber):
+        db.change_seat('2', 'economic', 100000)
+    with pytest.raises(InvalidSeatClass):
+        db.change_seat('2', 'first', 1)
+    with pytest.raises(ChosenPassengerDoesNotExist):
+        db.change_seat('11', 'economic', 8)
+
+
+def test_sqlite_database_book_next_free_seat(tmp_path):
+    with SqliteDatabase(tmp_path / 'database.sqlite') as database:
+        database.add_flight(Flight(1))
+        database.add_plane(Plane(1, 2, 1, 'LOT'))
+        database.add_ticket(Ticket('1', 1, 'economic', 1, 1))
+        ticket = database.book_next_free_seat('2', 1, 'economic', 1)
+        assert ticket.seat_number() == 2
+        with pytest.raises(TicketAlreadyExistsError):
+            database.book_next_free_seat('2', 1, 'economic', 1)
+        with pytest.raises(NoFreeSeatsError):
+            database.book_next_free_seat('3', 1, 'economic', 1)
+        with pytest.raises(LackingFlightObjectError):
+            database.book_next_free_seat('3', 2, 'economic', 1)
+
+
+def test_sqlite_database_secondary_lookups(db):
+    expected = Database()
+    expected.read_files(default_files)
+    for seat_class in (None, 'business', 'economic'):
+        found = db.tickets_on_plane(1, seat_class)
+        correct = expected.tickets_on_plane(1, seat_class)
+        assert list(map(str, found)) == list(map(str, correct))
+    for gate_number in range(1, 4):
+        found = db.tickets_at_gate(gate_number)
+        correct = expected.tickets_at_gate(gate_number)
+        assert list(map(str, found)) == list(map(str, correct))
+
+
+def test_sqlite_database_find_passengers(db):
+    found = db.find_passengers('KOW')
+    assert [person.ticket_id() for person in found] == ['3', '4']
+    found = db.find_passengers('lara c')
+    assert [person.last_name() for person in found] == ['Croft']
+    assert db.find_passengers('xyz') == []
+    found = db.find_passengers_fuzzy('krof')
+    assert [person.ticket_id() for person in found] == []
+    found = db.find_passengers_fuzzy('krof', 2)
+    assert [person.ticket_id() for person in found] == ['1']
+
+
+def test_sqlite_database_assistance(db):
+    tickets = db.tickets()
+    db.ask_for_assistance(tickets['1'])
+    with pytest.raises(PassengerAlreadyAskedForHelpError):
+        db.ask_for_assistance(tickets['1'])
+    db.ask_for_assistance(tickets['2'])
+    db.ask_for_assistance(tickets['3'])
+    with pytest.raises(AllAssistantsAreBusyError):
+        db.ask_for_assistance(tickets['4'])
+    db.thank_for_assistance(tickets['1'])
+    with pytest.raises(ChosenPassengerHasNotAskedForHelp):
+        db.thank_for_assistance(tickets['1'])
+    assert db.planes()[1].busy_assistnats() == {'2', '3'}
+    with pytest.raises(ChosenPassengerDoesNotExist):
+        db.ask_for_assistance(Ticket('11', 1, 'economic', 100, 1))
+
+
+def test_sqlite_database_write_files(tmp_path, db):
+    paths = {
+        kind: str(tmp_path / name)
+        for kind, name in default_files.items()
+    }
+    db.write_files(paths)
+    for kind in ('flights', 'planes', 'tickets'):
+        with open(paths[kind], 'r') as written:
+            with open(default_files[kind], 'r') as original:
+                assert written.read() == original.read()
+
+
+def test_sqlite_database_change_seat_after_release(tmp_path):
+    with SqliteDatabase(tmp_path / 'database.sqlite') as database:
+        database.add_flight(Flight(1))
+        database.add_plane(Plane(1, 10, 2, 'LOT'))
+        database.book_seat(Ticket('A', 1, 'economic', 1, 1))
+        database.release_seat(database.tickets()['A'])
+        database.book_seat(Ticket('B', 1, 'economic', 1, 1))
+        database.release_seat(Ticket('A', 1, 'economic', 1, 1))
+        ticket = database.change_seat('A', 'economic', 5)
+        assert ticket.seat_number() == 5
+        occupancy = database.planes()[1].economic_seats_occupancy()
+        assert occupancy[1] == 'OCCUPIED'
+        assert occupancy[5] == 'OCCUPIED'
+        with pytest.raises(ChosenSeatIsOccupied):
+            database.book_seat(Ticket('C', 1, 'economic', 1, 1))
+        assert [found.ticket_id() for found in database.tickets_on_plane(1)] \
+            == ['A', 'B']
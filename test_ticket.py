@@ -1,4 +1,11 @@
 from ticket import Ticket
+from rejections import (
+    INVALID_PLANE_NUMBER,
+    INVALID_TICKET_ID,
+    INVALID_SEAT_CLASS,
+    INVALID_SEAT_NUMBER,
+    INVALID_GATE_NUMBER
+)
 from errors import (
     InvalidTicketIDNumber,
     InvalidGateNumber,
@@ -163,3 +170,29 @@ def test_init_ticket_sest_class_invalid():
     ticket = Ticket('012345', 123, 'business', 16, 7)
     with pytest.raises(InvalidSeatClass):
         ticket.set_seat_class('asfsg')
+
+
+def test_ticket_has_no_instance_dict():
+    ticket = Ticket('012345', 123, 'business', 16, 7)
+    assert not hasattr(ticket, '__dict__')
+    with pytest.raises(AttributeError):
+        ticket.seat = 17
+
+
+def test_ticket_rejection_reason():
+    reason = Ticket.rejection_reason
+    assert reason('1', 1, 'economic', 1, 1) is None
+    assert reason('1', 0, 'economic', 1, 1) == INVALID_PLANE_NUMBER
+    assert reason('', 1, 'economic', 1, 1) == INVALID_TICKET_ID
+    assert reason('1', 1, 'first', 1, 1) == INVALID_SEAT_CLASS
+    assert reason('1', 1, 'economic', None, 1) == INVALID_SEAT_NUMBER
+    assert reason('1', 1, 'economic', 1, 1.5) == INVALID_GATE_NUMBER
+    assert reason('1', 2 ** 63 - 1, 'economic', 2 ** 63 - 1, 1) is None
+    assert reason('1', 2 ** 63, 'economic', 1, 1) == INVALID_PLANE_NUMBER
+    assert reason('1', 1, 'economic', 1, 2 ** 63) == INVALID_GATE_NUMBER
+    assert reason('1', 1, 'economic', '1' * 20, 1) == INVALID_SEAT_NUMBER
+
+
+def test_ticket_from_checked():
+    ticket = Ticket.from_checked('1', 2, 'business', 3, 4)
+    assert str(ticket) == str(Ticket('1', 2, 'business', 3, 4))
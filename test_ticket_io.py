@@ -1,4 +1,15 @@
-from ticket_io import read_tickets_from_csv
+from ticket_io import (
+    read_tickets_from_csv,
+    iter_tickets_from_csv,
+    iter_ticket_rows_from_csv,
+    write_tickets_to_csv
+)
+from rejections import (
+    RejectionCounts,
+    MALFORMED_ROW,
+    INVALID_SEAT_NUMBER,
+    INVALID_GATE_NUMBER
+)
 from errors import InvalidKeyInTicketsFile
 from io import StringIO
 import pytest
@@ -126,3 +137,91 @@ def test_read_tickets_from_csv_gate_number_is_str():
     file_handle = StringIO(data)
     tickets = read_tickets_from_csv(file_handle)
     assert len(tickets) == 0
+
+
+def test_iter_tickets_from_csv():
+    data = 'ticket_id,plane_number,seat_class,seat_number,gate_number\n'
+    data += '1,1,business,1,1\n2,1,busines,4,1\n3,2,economic,7,3\n'
+    tickets = iter_tickets_from_csv(StringIO(data))
+    assert next(tickets).ticket_id() == '1'
+    ticket = next(tickets)
+    assert ticket.ticket_id() == '3'
+    assert ticket.plane_number() == 2
+    assert ticket.seat_number() == 7
+    assert next(tickets, None) is None
+
+
+def test_iter_tickets_from_csv_invalid_headline():
+    data = 'ticket_id,plane_number,seat_classseat_number,gate_number\n'
+    data += '1,1,business,1,1\n'
+    with pytest.raises(InvalidKeyInTicketsFile):
+        list(iter_tickets_from_csv(StringIO(data)))
+
+
+def test_read_tickets_from_csv_reordered_columns():
+    data = 'gate_number,seat_number,seat_class,plane_number,ticket_id\n'
+    data += '3,7,economic,2,15\n'
+    tickets = read_tickets_from_csv(StringIO(data))
+    assert tickets['15'].plane_number() == 2
+    assert tickets['15'].seat_class() == 'economic'
+    assert tickets['15'].seat_number() == 7
+    assert tickets['15'].gate_number() == 3
+
+
+def test_read_tickets_from_csv_short_and_empty_rows():
+    data = 'ticket_id,plane_number,seat_class,seat_number,gate_number\n'
+    data += '1,1,business\n\n2,1,business,2,2\n'
+    tickets = read_tickets_from_csv(StringIO(data))
+    assert list(tickets) == ['2']
+
+
+def test_read_tickets_from_csv_empty_file():
+    assert read_tickets_from_csv(StringIO('')) == {}
+
+
+def test_iter_tickets_from_csv_counts_rejections():
+    data = 'ticket_id,plane_number,seat_class,seat_number,gate_number\n'
+    data += '1,1,business,1,1\n'
+    data += '2,1,business,0,1\n'
+    data += '3,1,business,x,1\n'
+    data += '4,1,business,1,x\n'
+    data += '5,1,business\n'
+    rejections = RejectionCounts()
+    tickets = list(iter_tickets_from_csv(StringIO(data), rejections))
+    assert [ticket.ticket_id() for ticket in tickets] == ['1']
+    assert rejections == {
+        INVALID_SEAT_NUMBER: 2,
+        INVALID_GATE_NUMBER: 1,
+        MALFORMED_ROW: 1
+    }
+
+
+def test_iter_ticket_rows_from_csv_line_numbers():
+    data = 'ticket_id,plane_number,seat_class,seat_number,gate_number\n'
+    data += '1,1,business,1,1\n'
+    data += '\n'
+    data += '2,1,business,0,1\n'
+    data += '3,1,"economic",2,1\n'
+    rejected = []
+
+    class Rejections:
+        def reject(self, reason, line_number, row):
+            rejected.append((reason, line_number, row))
+
+    rows = list(iter_ticket_rows_from_csv(StringIO(data), Rejections()))
+    assert [(line, row) for line, row, _ in rows] == [
+        (2, ['1', '1', 'business', '1', '1']),
+        (5, ['3', '1', 'economic', '2', '1'])
+    ]
+    assert rejected == [
+        (INVALID_SEAT_NUMBER, 4, ['2', '1', 'business', '0', '1'])
+    ]
+
+
+def test_write_tickets_to_csv():
+    with open('tickets_database.csv', 'r') as file_handle:
+        tickets = read_tickets_from_csv(file_handle)
+    file_handle = StringIO(newline='')
+    write_tickets_to_csv(file_handle, tickets.values())
+    with open('tickets_database.csv', 'r') as original:
+        assert file_handle.getvalue() == original.read()
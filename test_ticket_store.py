@@ -0,0 +1,88 @@
+from ticket_store import TicketStore
+from ticket import Ticket
+import pytest
+
+
+def test_ticket_store_init():
+    store = TicketStore()
+    assert len(store) == 0
+    assert '1' not in store
+
+
+def test_ticket_store_set_and_get():
+    store = TicketStore()
+    store['1'] = Ticket('1', 3, 'business', 4, 5)
+    store['2'] = Ticket('2', 6, 'economic', 7, 8)
+    assert len(store) == 2
+    assert list(store) == ['1', '2']
+    ticket = store['1']
+    assert ticket.ticket_id() == '1'
+    assert ticket.plane_number() == 3
+    assert ticket.seat_class() == 'business'
+    assert ticket.seat_number() == 4
+    assert ticket.gate_number() == 5
+    assert str(store['2']) == str(Ticket('2', 6, 'economic', 7, 8))
+
+
+def test_ticket_store_update_existing():
+    store = TicketStore()
+    store['1'] = Ticket('1', 3, 'business', 4, 5)
+    ticket = store['1']
+    ticket.set_seat_class('economic')
+    ticket.set_seat_number(10)
+    assert store['1'].seat_class() == 'business'
+    store['1'] = ticket
+    assert len(store) == 1
+    assert store['1'].seat_class() == 'economic'
+    assert store['1'].seat_number() == 10
+
+
+def test_ticket_store_number_too_big():
+    store = TicketStore()
+    store['1'] = Ticket('1', 3, 'business', 4, 3_000_000_000)
+    assert store['1'].gate_number() == 3_000_000_000
+    with pytest.raises(OverflowError):
+        store['2'] = Ticket.from_checked('2', 3, 'economic', 1, 2 ** 63)
+    with pytest.raises(OverflowError):
+        store['1'] = Ticket.from_checked('1', 3, 'economic', 1, 2 ** 63)
+    store['3'] = Ticket('3', 3, 'economic', 2, 1)
+    assert list(store) == ['1', '3']
+    assert str(store['1']) == str(Ticket('1', 3, 'business', 4, 3000000000))
+    assert str(store['3']) == str(Ticket('3', 3, 'economic', 2, 1))
+
+
+def test_ticket_store_delete():
+    store = TicketStore()
+    for number in range(1, 5):
+        store[str(number)] = Ticket(str(number), number, 'economic', 1, 1)
+    del store['2']
+    assert len(store) == 3
+    assert '2' not in store
+    assert store['4'].plane_number() == 4
+    assert store['1'].plane_number() == 1
+    del store['4']
+    assert sorted(store) == ['1', '3']
+    with pytest.raises(KeyError):
+        del store['2']
+    with pytest.raises(KeyError):
+        store['4']
+
+
+def test_ticket_store_scans():
+    store = TicketStore()
+    store['1'] = Ticket('1', 1, 'business', 1, 2)
+    store['2'] = Ticket('2', 2, 'business', 1, 2)
+    store['3'] = Ticket('3', 1, 'economic', 1, 3)
+    assert store.tickets_on_plane(1) == ['1', '3']
+    assert store.tickets_at_gate(2) == ['1', '2']
+    assert store.tickets_at_gate(4) == []
+
+
+def test_ticket_store_rows():
+    store = TicketStore()
+    store['1'] = Ticket('1', 1, 'business', 1, 2)
+    store['2'] = Ticket('2', 2, 'economic', 5, 3)
+    assert list(store.rows()) == [
+        ('1', 1, 'business', 1, 2),
+        ('2', 2, 'economic', 5, 3)
+    ]
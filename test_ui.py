@@ -1,4 +1,8 @@
 from ui import UserInterface
+from sqlite_database import SqliteDatabase
+from flight import Flight
+from concurrent.futures import ThreadPoolExecutor
+import os
 
 
 def test_ui_init(monkeypatch):
@@ -140,3 +144,189 @@ def test_check_flights_param(monkeypatch):
 """
 
     assert table == correct
+
+
+def test_try_to_book_first_free_seat(monkeypatch):
+    def not_run(arg):
+        pass
+
+    def answer_yes(arg):
+        return 'y'
+
+    monkeypatch.setattr('ui.UserInterface._run', not_run)
+    monkeypatch.setattr('ui.UserInterface.get_user_input_str', answer_yes)
+    ui = UserInterface()
+    ui.load_default_files()
+    ui.try_to_book_first_free_seat(('11', 1, 'business', 1, 2))
+    assert ui.database().tickets()['11'].seat_number() == 2
+    assert ui.database().tickets()['11'].gate_number() == 2
+
+
+def test_try_to_book_first_free_seat_refused(monkeypatch):
+    def not_run(arg):
+        pass
+
+    def answer_no(arg):
+        return 'n'
+
+    monkeypatch.setattr('ui.UserInterface._run', not_run)
+    monkeypatch.setattr('ui.UserInterface.get_user_input_str', answer_no)
+    ui = UserInterface()
+    ui.load_default_files()
+    ui.try_to_book_first_free_seat(('11', 1, 'business', 1, 2))
+    assert '11' not in ui.database().tickets()
+
+
+def test_load_default_files_reuses_parsing_pool(monkeypatch):
+    def not_run(arg):
+        pass
+
+    pools = []
+
+    def thread_pool(max_workers):
+        pools.append(ThreadPoolExecutor(max_workers))
+        return pools[-1]
+
+    monkeypatch.setattr('ui.UserInterface._run', not_run)
+    monkeypatch.setattr('ui.ProcessPoolExecutor', thread_pool)
+    ui = UserInterface()
+    ui.load_default_files()
+    ui.load_default_files()
+    assert len(pools) == 1
+    assert len(ui.database().tickets()) == 10
+    pools[0].shutdown()
+
+
+def test_load_default_files_twice_shows_reasons(monkeypatch, capsys):
+    def not_run(arg):
+        pass
+
+    monkeypatch.setattr('ui.UserInterface._run', not_run)
+    ui = UserInterface()
+    ui.load_default_files()
+    assert 'Database loaded successfully.' in capsys.readouterr().out
+    ui.load_default_files()
+    output = capsys.readouterr().out
+    msg = '10 flights data rows omitted - already existing key: 10.'
+    assert msg in output
+    msg = '10 tickets data rows omitted - already existing key: 10.'
+    assert msg in output
+
+
+def test_try_to_change_seat(monkeypatch):
+    def not_run(arg):
+        pass
+
+    answers = iter(['1', 'economic'])
+    monkeypatch.setattr('ui.UserInterface._run', not_run)
+    monkeypatch.setattr(
+        'ui.UserInterface.get_user_input_str',
+        lambda arg: next(answers)
+    )
+    monkeypatch.setattr('ui.UserInterface.get_user_input_int', lambda arg: 7)
+    ui = UserInterface()
+    ui.load_default_files()
+    ui.try_to_change_seat()
+    ticket = ui.database().tickets()['1']
+    assert ticket.seat_class() == 'economic'
+    assert ticket.seat_number() == 7
+    plane = ui.database().planes()[1]
+    assert plane.business_seats_occupancy()[1] == 'FREE'
+    assert plane.economic_seats_occupancy()[7] == 'OCCUPIED'
+
+
+def test_try_to_change_seat_occupied(monkeypatch, capsys):
+    def not_run(arg):
+        pass
+
+    answers = iter(['1', 'economic'])
+    monkeypatch.setattr('ui.UserInterface._run', not_run)
+    monkeypatch.setattr(
+        'ui.UserInterface.get_user_input_str',
+        lambda arg: next(answers)
+    )
+    monkeypatch.setattr('ui.UserInterface.get_user_input_int', lambda arg: 2)
+    ui = UserInterface()
+    ui.load_default_files()
+    ui.try_to_change_seat()
+    assert 'Chosen seat is already occupied.' in capsys.readouterr().out
+    assert ui.database().tickets()['1'].seat_number() == 1
+    plane = ui.database().planes()[1]
+    assert plane.business_seats_occupancy()[1] == 'OCCUPIED'
+
+
+def test_user_interface_journal(monkeypatch, tmp_path, capsys):
+    def not_run(arg):
+        pass
+
+    monkeypatch.setattr('ui.UserInterface._run', not_run)
+    path = tmp_path / 'database.journal'
+    ui = UserInterface(path)
+    ui.load_default_files()
+    ui.database().change_seat('1', 'economic', 7)
+    ui.journal().close()
+    capsys.readouterr()
+    ui = UserInterface(path)
+    assert 'Recovered 5 changes' in capsys.readouterr().out
+    assert ui.database().tickets()['1'].seat_number() == 7
+    assert len(ui.database().passengers()) == 10
+    ui.journal().close()
+
+
+def test_user_interface_damaged_journal(monkeypatch, tmp_path, capsys):
+    def not_run(arg):
+        pass
+
+    monkeypatch.setattr('ui.UserInterface._run', not_run)
+    path = tmp_path / 'database.journal'
+    path.write_text('not a journal\n')
+    ui = UserInterface(path)
+    assert 'Journal is damaged' in capsys.readouterr().out
+    assert os.path.exists(f'{path}.damaged')
+    ui.database().add_flight(Flight(1))
+    ui.journal().close()
+    ui = UserInterface(path)
+    assert list(ui.database().flights()) == [1]
+    ui.journal().close()
+
+
+def test_user_interface_damaged_journal_keeps_snapshot(
+    monkeypatch,
+    tmp_path,
+    capsys
+):
+    def not_run(arg):
+        pass
+
+    monkeypatch.setattr('ui.UserInterface._run', not_run)
+    path = tmp_path / 'database.journal'
+    ui = UserInterface(path)
+    ui.load_default_files()
+    ui.journal().compact(ui.database())
+    ui.database().change_seat('1', 'economic', 7)
+    ui.journal().close()
+    with open(path, 'a') as file_handle:
+        file_handle.write('["change_seat","99","economic",1]\n')
+    capsys.readouterr()
+    ui = UserInterface(path)
+    assert 'only the last snapshot' in capsys.readouterr().out
+    assert len(ui.database().tickets()) == 10
+    assert ui.database().tickets()['1'].seat_number() == 1
+    ui.journal().close()
+
+
+def test_ui_with_sqlite_database(tmp_path, monkeypatch):
+    def not_run(arg):
+        pass
+
+    def answer_yes(arg):
+        return 'y'
+
+    monkeypatch.setattr('ui.UserInterface._run', not_run)
+    monkeypatch.setattr('ui.UserInterface.get_user_input_str', answer_yes)
+    with SqliteDatabase(tmp_path / 'database.sqlite') as database:
+        ui = UserInterface(database=database)
+        ui.load_default_files()
+        ui.try_to_book_first_free_seat(('11', 1, 'business', 1, 2))
+    with SqliteDatabase(tmp_path / 'database.sqlite') as database:
+        assert database.tickets()['11'].seat_number() == 2
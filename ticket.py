@@ -1,4 +1,11 @@
 from flight import Flight
+from rejections import (
+    INVALID_PLANE_NUMBER,
+    INVALID_TICKET_ID,
+    INVALID_SEAT_CLASS,
+    INVALID_SEAT_NUMBER,
+    INVALID_GATE_NUMBER
+)
 from errors import (
     InvalidTicketIDNumber,
     InvalidSeatNumber,
@@ -26,6 +33,13 @@ class Ticket(Flight):
     :param gate_number: ticket's owner gate number
     :type gate_number: int
     """
+    __slots__ = (
+        '_ticket_id',
+        '_seat_class',
+        '_seat_number',
+        '_gate_number'
+    )
+
     def __init__(
         self,
         ticket_id,
@@ -45,11 +59,63 @@ class Ticket(Flight):
         if self._if_gate_number(gate_number):
             self._gate_number = int(gate_number)
 
+    @staticmethod
+    def _is_ticket_id(ticket_id):
+        """
+        Checks whether the ticket_id is a not empty string.
+        """
+        return bool(ticket_id) and bool(str(ticket_id))
+
+    @staticmethod
+    def rejection_reason(
+        ticket_id,
+        plane_number,
+        seat_class,
+        seat_number,
+        gate_number
+    ):
+        """
+        Returns the reason why Ticket cannot be created of given data or
+        None if it can - does not raise exceptions.
+        """
+        if not Ticket._is_positive_int(plane_number):
+            return INVALID_PLANE_NUMBER
+        if not Ticket._is_ticket_id(ticket_id):
+            return INVALID_TICKET_ID
+        if seat_class not in {'business', 'economic'}:
+            return INVALID_SEAT_CLASS
+        if not Ticket._is_positive_int(seat_number):
+            return INVALID_SEAT_NUMBER
+        if not Ticket._is_positive_int(gate_number):
+            return INVALID_GATE_NUMBER
+        return None
+
+    @classmethod
+    def from_checked(
+        cls,
+        ticket_id,
+        plane_number,
+        seat_class,
+        seat_number,
+        gate_number
+    ):
+        """
+        Creates instance of Ticket of data for which rejection_reason()
+        returned None, without checking it again.
+        """
+        ticket = cls.__new__(cls)
+        ticket._plane_number = plane_number
+        ticket._ticket_id = str(ticket_id)
+        ticket._seat_class = seat_class
+        ticket._seat_number = seat_number
+        ticket._gate_number = gate_number
+        return ticket
+
     def _if_ticket_id(self, ticket_id):
         """
         Checks whether the ticket_id is a not empty string.
         """
-        if not ticket_id or not str(ticket_id):
+        if not self._is_ticket_id(ticket_id):
             raise InvalidTicketIDNumber
         return True
 
@@ -57,7 +123,7 @@ class Ticket(Flight):
         """
         Checks whether the gate_number is a positive integer.
         """
-        if not int(gate_number) > 0 or int(gate_number) != gate_number:
+        if not self._is_positive_int(gate_number):
             raise InvalidGateNumber
         return True
 
@@ -75,7 +141,7 @@ class Ticket(Flight):
         Checks whether the seat_number is a positive integer.
         If so sets new value, otherwise raises InvalidSeatNumber exception.
         """
-        if not int(seat_number) > 0 or int(seat_number) != seat_number:
+        if not self._is_positive_int(seat_number):
             raise InvalidSeatNumber
         self._seat_number = int(seat_number)
 
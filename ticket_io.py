@@ -1,48 +1,96 @@
 from ticket import Ticket
+from csv_io import read_header, parse_int, write_csv
+from rejections import MALFORMED_ROW
 import csv
-from errors import (
-    InvalidTicketIDNumber,
-    InvalidSeatNumber,
-    InvalidGateNumber,
-    InvalidSeatClass,
-    InvalidPlaneNumber,
-    InvalidKeyInTicketsFile
+from errors import InvalidKeyInTicketsFile
+
+
+TICKETS_FILE_HEADER = (
+    'ticket_id',
+    'plane_number',
+    'seat_class',
+    'seat_number',
+    'gate_number'
 )
 
 
+def iter_ticket_rows_from_csv(file_handle, rejections=None):
+    """
+    Yields (line number, row, object of class Ticket) tuples read from csv
+    file one at a time - line number is the one the row ends at.
+    The header is validated once, rows are parsed positionally.
+    Omits invalid data rows - if rejections is given, every omitted row
+    is passed to its reject() method with the reason, line number and row.
+    Raises csv.Error if the file is malformed.
+    """
+    reader = csv.reader(file_handle)
+    try:
+        columns = read_header(reader, TICKETS_FILE_HEADER)
+    except KeyError:
+        raise InvalidKeyInTicketsFile
+    if columns is None:
+        return
+    id_index, plane_index, class_index, seat_index, gate_index = columns
+    row_length = max(columns) + 1
+    for row in reader:
+        if not row:
+            continue
+        if len(row) < row_length:
+            reason = MALFORMED_ROW
+        else:
+            data = (
+                row[id_index],
+                parse_int(row[plane_index]),
+                row[class_index],
+                parse_int(row[seat_index]),
+                parse_int(row[gate_index])
+            )
+            reason = Ticket.rejection_reason(*data)
+            if reason is None:
+                yield reader.line_num, row, Ticket.from_checked(*data)
+                continue
+        if rejections is not None:
+            rejections.reject(reason, reader.line_num, row)
+
+
+def iter_tickets_from_csv(file_handle, rejections=None):
+    """
+    Yields objects of class Ticket read from csv file one at a time.
+    Omits invalid data rows - if rejections is given, every omitted row
+    is passed to its reject() method.
+    Raises csv.Error if the file is malformed.
+    """
+    for _, _, ticket in iter_ticket_rows_from_csv(file_handle, rejections):
+        yield ticket
+
+
 def read_tickets_from_csv(file_handle):
     """
     Reads data describing objects of class Ticket from csv file.
     Omits invalid data rows.
     """
     tickets = {}
-    reader = csv.DictReader(file_handle)
     try:
-        for ticket in reader:
-            try:
-                ticket_id = ticket['ticket_id']
-                plane_number = int(ticket['plane_number'])
-                seat_class = ticket['seat_class']
-                seat_number = int(ticket['seat_number'])
-                gate_number = int(ticket['gate_number'])
-                tickets[ticket_id] = Ticket(
-                    ticket_id,
-                    plane_number,
-                    seat_class,
-                    seat_number,
-                    gate_number
-                )
-            except (
-                ValueError,
-                InvalidPlaneNumber,
-                InvalidSeatClass,
-                InvalidSeatNumber,
-                InvalidGateNumber,
-                InvalidTicketIDNumber
-            ):
-                continue
-    except KeyError:
-        raise InvalidKeyInTicketsFile
+        for ticket in iter_tickets_from_csv(file_handle):
+            tickets[ticket.ticket_id()] = ticket
     except csv.Error:
         return None
     return tickets
+
+
+def write_tickets_to_csv(file_handle, tickets):
+    """
+    Writes objects of class Ticket from given iterable into csv file
+    under the header read by iter_tickets_from_csv - rows are
+    generated while being written.
+    """
+    write_csv(file_handle, TICKETS_FILE_HEADER, (
+        (
+            ticket.ticket_id(),
+            ticket.plane_number(),
+            ticket.seat_class(),
+            ticket.seat_number(),
+            ticket.gate_number()
+        )
+        for ticket in tickets
+    ))
@@ -0,0 +1,144 @@
+from ticket import Ticket
+from array import array
+from collections.abc import MutableMapping
+
+
+class TicketStore(MutableMapping):
+    """
+    Class TicketStore - columnar storage of tickets.
+    Behaves like a dictionary mapping ticket id to Ticket, but keeps every
+    attribute in its own column. Objects of class Ticket are created only
+    when accessed - modifying them does not change the store, they have to
+    be assigned again.
+    Contains attributes:
+    :param rows: dictionary mapping ticket id to row number
+    :type rows: dict
+
+    :param ids: ticket ids in row order
+    :type ids: list
+
+    :param plane_numbers: column of plane numbers
+    :type plane_numbers: array
+
+    :param business_flags: column of seat classes, 1 means business class
+    :type business_flags: bytearray
+
+    :param seat_numbers: column of seat numbers
+    :type seat_numbers: array
+
+    :param gate_numbers: column of gate numbers
+    :type gate_numbers: array
+    """
+    def __init__(self):
+        """
+        Creates empty instance of TicketStore.
+        """
+        self._rows = {}
+        self._ids = []
+        self._plane_numbers = array('q')
+        self._business_flags = bytearray()
+        self._seat_numbers = array('q')
+        self._gate_numbers = array('q')
+
+    def __getitem__(self, ticket_id):
+        row = self._rows[ticket_id]
+        business = self._business_flags[row]
+        return Ticket.from_checked(
+            self._ids[row],
+            self._plane_numbers[row],
+            'business' if business else 'economic',
+            self._seat_numbers[row],
+            self._gate_numbers[row]
+        )
+
+    def __setitem__(self, ticket_id, ticket):
+        """
+        Stores the ticket. Numbers are converted before any column is
+        changed - if one does not fit the columns OverflowError is raised
+        and the store is left as it was.
+        """
+        business = ticket.seat_class() == 'business'
+        plane_number, seat_number, gate_number = array('q', (
+            ticket.plane_number(),
+            ticket.seat_number(),
+            ticket.gate_number()
+        ))
+        row = self._rows.get(ticket_id)
+        if row is None:
+            self._plane_numbers.append(plane_number)
+            self._seat_numbers.append(seat_number)
+            self._gate_numbers.append(gate_number)
+            self._business_flags.append(business)
+            self._rows[ticket_id] = len(self._ids)
+            self._ids.append(ticket_id)
+        else:
+            self._plane_numbers[row] = plane_number
+            self._business_flags[row] = business
+            self._seat_numbers[row] = seat_number
+            self._gate_numbers[row] = gate_number
+
+    def __delitem__(self, ticket_id):
+        """
+        Removes the ticket by moving the last row into its place.
+        """
+        row = self._rows.pop(ticket_id)
+        last_row = len(self._ids) - 1
+        if row != last_row:
+            last_id = self._ids[last_row]
+            self._ids[row] = last_id
+            self._plane_numbers[row] = self._plane_numbers[last_row]
+            self._business_flags[row] = self._business_flags[last_row]
+            self._seat_numbers[row] = self._seat_numbers[last_row]
+            self._gate_numbers[row] = self._gate_numbers[last_row]
+            self._rows[last_id] = row
+        self._ids.pop()
+        self._plane_numbers.pop()
+        self._business_flags.pop()
+        self._seat_numbers.pop()
+        self._gate_numbers.pop()
+
+    def __contains__(self, ticket_id):
+        return ticket_id in self._rows
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def __len__(self):
+        return len(self._ids)
+
+    def rows(self):
+        """
+        Returns iterator over (ticket id, plane number, seat class, seat
+        number, gate number) tuples in row order - read straight from
+        the columns, without creating objects of class Ticket.
+        """
+        seat_classes = ('economic', 'business')
+        return zip(
+            self._ids,
+            self._plane_numbers,
+            map(seat_classes.__getitem__, self._business_flags),
+            self._seat_numbers,
+            self._gate_numbers
+        )
+
+    def tickets_on_plane(self, plane_number):
+        """
+        Returns ids of the tickets for given plane - scans only the column
+        of plane numbers.
+        """
+        return [
+            self._ids[row]
+            for row, number in enumerate(self._plane_numbers)
+            if number == plane_number
+        ]
+
+    def tickets_at_gate(self, gate_number):
+        """
+        Returns ids of the tickets boarding at given gate - scans only
+        the column of gate numbers.
+        """
+        return [
+            self._ids[row]
+            for row, number in enumerate(self._gate_numbers)
+            if number == gate_number
+        ]
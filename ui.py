@@ -1,8 +1,11 @@
-from database import Database
+from database import Database, parser_count
 from flight import Flight
 from passenger import Passenger
 from plane import Plane
 from ticket import Ticket
+from journal import Journal
+from concurrent.futures import ProcessPoolExecutor
+import os
 from errors import (
     InvalidPlaneNumber,
     InvalidPassengerFirstName,
@@ -25,7 +28,8 @@ from errors import (
     ChosenPassengerHasNotAskedForHelp,
     MalformedFileError,
     FileIsADirectoryError,
-    FilePathNotFoundError
+    FilePathNotFoundError,
+    NoFreeSeatsError
 )
 
 
@@ -34,19 +38,34 @@ class UserInterface:
     Class UserInterface - responsible for user servicing.
     Contains attributes:
     :param _database: database of the program
-    :type _database: class Database
+    :type _database: class Database or SqliteDatabase
 
     :param _default_files: dictionary of prepared exemplary files
     :type _default_file: dict
 
     :param _main_menu: program's main menu options
     :type _main_menu: dict
+
+    :param _journal: journal recording changes of the database or None
+    :type _journal: class Journal
+
+    :param _executor: pool of processes parsing the default files, created
+    when they are first loaded and kept until the interface ends, or None
+    :type _executor: class ProcessPoolExecutor
     """
-    def __init__(self):
+    def __init__(self, journal_path=None, database=None):
         """
         Creates instance of UserInterface.
-        """
-        self._database = Database()
+        If journal_path is given, changes of the database made in previous
+        runs are recovered from the journal and new ones are recorded in it.
+        If database is given, it is used instead of new Database - eg.
+        SqliteDatabase, which keeps the changes itself and needs no journal.
+        """
+        self._database = Database() if database is None else database
+        self._journal = None
+        self._executor = None
+        if journal_path is not None:
+            self.recover_journal(journal_path)
         self._default_files = {
             'flights': 'flights_database.csv',
             'passengers': 'passengers_database.csv',
@@ -79,6 +98,44 @@ class UserInterface:
         """
         return self._database
 
+    def journal(self):
+        """
+        Returns the journal of the UI or None.
+        """
+        return self._journal
+
+    def recover_journal(self, journal_path):
+        """
+        Recovers the database from the journal and starts recording changes
+        in it. If the journal is damaged, it is moved aside and the database
+        is recovered from the base snapshot only. If that fails too, changes
+        are not recorded.
+        """
+        journal = Journal(journal_path)
+        try:
+            replayed = journal.recover(self.database())
+        except MalformedFileError:
+            damaged_path = f'{journal.path()}.damaged'
+            os.replace(journal.path(), damaged_path)
+            self._database = Database()
+            journal = Journal(journal_path)
+            try:
+                journal.recover(self._database)
+            except MalformedFileError:
+                self._database = Database()
+                return self.show(
+                    f'Journal is damaged - it is kept in {damaged_path}, '
+                    'changes will not be saved.\n'
+                )
+            self._journal = journal
+            return self.show(
+                f'Journal is damaged - it is kept in {damaged_path}, '
+                'only the last snapshot is recovered.\n'
+            )
+        self._journal = journal
+        if replayed:
+            self.show(f'Recovered {replayed} changes from the journal.\n')
+
     def default_files(self):
         """
         Returns dictionary of deafault data files for objects of classes
@@ -212,6 +269,15 @@ class UserInterface:
         """
         self.show(f'File: {given_file} is a directory.')
 
+    def show_omitted_rows(self, kind, rejections):
+        """
+        Creates a message to inform the user how many data rows of given
+        kind were omitted and why.
+        """
+        msg = f'{rejections.total()} {kind} data rows omitted - '
+        msg += f'{rejections}.'
+        self.show(msg)
+
     def load_flights(self):
         """
         Loads Flight data from the default file.
@@ -220,10 +286,8 @@ class UserInterface:
             result = self.database().read_flights(
                 self.default_files()['flights']
             )
-            if result:
-                msg = f'{result} flights data rows omitted due to detected '
-                msg += 'already existing keys.'
-                self.show(msg)
+            if result.total():
+                self.show_omitted_rows('flights', result)
                 return False
         except InvalidFileHeaderError:
             return self.handle_invalid_header()
@@ -245,10 +309,8 @@ class UserInterface:
             result = self.database().read_planes(
                 self.default_files()['planes']
             )
-            if result:
-                msg = f'{result} planes data rows omitted due to detected '
-                msg += 'already existing keys.'
-                self.show(msg)
+            if result.total():
+                self.show_omitted_rows('planes', result)
                 return False
         except InvalidFileHeaderError:
             return self.handle_invalid_header()
@@ -272,10 +334,8 @@ class UserInterface:
             result = self.database().read_tickets(
                 self.default_files()['tickets']
             )
-            if result:
-                msg = f'{result} tickets data rows omitted due to detected '
-                msg += 'already existing keys.'
-                self.show(msg)
+            if result.total():
+                self.show_omitted_rows('tickets', result)
                 return False
         except InvalidFileHeaderError:
             return self.handle_invalid_header()
@@ -303,10 +363,8 @@ class UserInterface:
             result = self.database().read_passengers(
                 self.default_files()['passengers']
             )
-            if result:
-                msg = f'{result} passengers data rows omitted due to detected '
-                msg += 'already existing keys.'
-                self.show(msg)
+            if result.total():
+                self.show_omitted_rows('passengers', result)
                 return False
         except InvalidFileHeaderError:
             return self.handle_invalid_header()
@@ -328,14 +386,32 @@ class UserInterface:
         """
         Manages the process of loading default from dictionary of deafault data
         files for objects of classes Flight, Passenger, Plane, Ticket.
+        All files are parsed at the same time.
         """
-        loaded_flights = self.load_flights()
-        loaded_planes = self.load_planes()
-        loaded_tickets = self.load_tickets()
-        loaded_passengers = self.load_passengers()
+        loaded = True
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=parser_count(self.default_files())
+            )
+        try:
+            results = self.database().read_files(
+                self.default_files(),
+                self._executor
+            )
+            for kind in results:
+                if results[kind].total():
+                    self.show_omitted_rows(kind, results[kind])
+                    loaded = False
+        except InvalidFileHeaderError:
+            loaded = self.handle_invalid_header()
+        except MalformedFileError:
+            loaded = self.handle_malformed_file_data()
+        except FilePathNotFoundError as error:
+            loaded = self.handle_file_not_found(error.args[0])
+        except FileIsADirectoryError as error:
+            loaded = self.handle_file_is_a_directory(error.args[0])
 
-        if (loaded_flights is True and loaded_planes is True and
-                loaded_tickets is True and loaded_passengers is True):
+        if loaded is True:
             self.show('Database loaded successfully.\n')
         else:
             self.show('\n')
@@ -566,6 +642,7 @@ class UserInterface:
             result = self.database().add_ticket(Ticket(*data))
         except ChosenSeatIsOccupied:
             self.handle_occupied_seat()
+            self.try_to_book_first_free_seat(data)
         except InvalidTicketDataInput:
             msg = 'Invalid data - Ticket cannot be created.\n'
             self.show(msg)
@@ -579,6 +656,28 @@ class UserInterface:
             msg += 'Data describing this ticket will be omitted.\n'
             self.show(msg)
 
+    def try_to_book_first_free_seat(self, data):
+        """
+        Offers the user to book the first free seat of chosen class
+        instead of the occupied one.
+        """
+        ticket_id, plane_number, seat_class, seat_number, gate_number = data
+        msg = 'Do you want to book the first free seat of this class '
+        msg += 'instead? [y/n]: '
+        self.show(msg)
+        if self.get_user_input_str().strip().lower() != 'y':
+            return None
+        try:
+            ticket = self.database().book_next_free_seat(
+                ticket_id,
+                plane_number,
+                seat_class,
+                gate_number
+            )
+        except NoFreeSeatsError:
+            return self.show('There are no free seats of this class.\n')
+        return self.show(f'Booked seat number {ticket.seat_number()}.\n')
+
     def try_to_change_seat(self):
         """
         Tries to change selected passenger's seat.
@@ -587,25 +686,19 @@ class UserInterface:
         if passenger_id is not None:
             new_seat_class, new_seat_number = self.get_seat()
             if new_seat_class is not None and new_seat_number is not None:
-                ticket = self.database().tickets()[passenger_id]
-                data = (
-                    ticket.ticket_id(),
-                    ticket.plane_number(),
-                    ticket.seat_class(),
-                    ticket.seat_number(),
-                    ticket.gate_number()
-                )
-                current_ticket = Ticket(*data)
-                ticket.set_seat_class(new_seat_class)
-                ticket.set_seat_number(new_seat_number)
                 try:
-                    self.database().book_seat(ticket)
+                    self.database().change_seat(
+                        passenger_id,
+                        new_seat_class,
+                        new_seat_number
+                    )
                 except ChosenSeatIsOccupied:
                     msg = 'Chosen seat is already occupied.\n'
                     return self.show(msg)
                 except InvalidSeatNumber:
                     return self.invalid_seat_choice()
-                self.database().release_seat(current_ticket)
+                except InvalidSeatClass:
+                    return self.show('Invalid seat class.\n')
             return self.show('Seat changded successfully.\n')
         return self.show('Something went wrong - seat cannot be changed.\n')
 
@@ -864,8 +957,14 @@ class UserInterface:
             self.show(main_menu)
             user_choice = self.get_user_input_str()
             self.menu_choose_user_option(user_choice)
+            if self.journal() is not None:
+                self.journal().compact_if_due(self.database())
             for key in self.main_menu():
                 if self.main_menu()[key] == 'Exit':
                     exit_option = key
             if user_choice == exit_option:
                 end = True
+        if self.journal() is not None:
+            self.journal().close()
+        if self._executor is not None:
+            self._executor.shutdown()